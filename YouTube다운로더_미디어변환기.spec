@@ -6,7 +6,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    # 지연 임포트(LazyModule)는 PyInstaller가 찾지 못하므로 직접 포함
+    hiddenimports=['yt_dlp', 'docx', 'pptx', 'PyPDF2', 'markdown', 'pypandoc', 'lxml.etree'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
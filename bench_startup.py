@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+시작 시간 벤치마크 스크립트
+v2 모듈 임포트 시간(과 선택적으로 첫 화면 표시 시간)을 측정하고,
+python -X importtime 결과로 최상위 모듈별 임포트 비용을 보여준다.
+
+    python bench_startup.py                 # 임포트 시간 + 모듈별 비용 상위 15개
+    python bench_startup.py --runs 10 --gui # 첫 화면 표시 시간 포함 (디스플레이 필요)
+    python bench_startup.py --json          # 기록/비교용 JSON 출력
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "유트브다운로더&미디어변환기_v2.py")
+
+# 처음 쓸 때만 불러와야 하는 무거운 의존성 (시작 시 불러왔다면 지연 임포트가 깨진 것)
+LAZY_MODULES = ("yt_dlp", "docx", "pptx", "PyPDF2", "markdown", "pypandoc", "lxml.etree")
+
+# 자식 프로세스에서 실행: 모듈을 불러오고 (--gui면 창을 만들고) 걸린 시간을 JSON으로 출력
+PROBE_SCRIPT = r"""
+import importlib.util, json, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("converter", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules["converter"] = module
+spec.loader.exec_module(module)
+result = {"import": time.perf_counter() - start}
+if sys.argv[2] == "gui":
+    root = module.tk.Tk()
+    module.os.environ["JOB_DB_PATH"] = "off"
+    app = module.MediaDownloaderConverterGUI(root)
+    root.update()
+    result["first_window"] = time.perf_counter() - start
+    root.destroy()
+result["lazy_loaded"] = sorted(name for name in sys.argv[3].split(",") if name in sys.modules)
+print(json.dumps(result))
+"""
+
+
+def run_probe(mode):
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE_SCRIPT, MODULE_PATH, mode, ",".join(LAZY_MODULES)],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_costs():
+    """python -X importtime 결과를 최상위 모듈 기준으로 합산 (cumulative, 마이크로초)"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE_SCRIPT, MODULE_PATH, "import", ",".join(LAZY_MODULES)],
+        capture_output=True, text=True, check=True
+    ).stderr
+    costs = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # 헤더 줄
+        if name.strip().startswith("youtube_downloader."):
+            costs[name.strip()] = int(cumulative)  # 엔진 패키지는 하위 모듈별로도 표시
+        # 들여쓰기가 없는 줄이 최상위 임포트 (하위 모듈 비용은 이미 포함됨)
+        if name.startswith(" ") and not name[1:].startswith(" "):
+            top = name.strip().split(".")[0]
+            costs[top] = costs.get(top, 0) + int(cumulative)
+    return sorted(costs.items(), key=lambda item: item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="v2 모듈 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="반복 측정 횟수 (중앙값 보고)")
+    parser.add_argument("--gui", action="store_true", help="첫 화면 표시 시간까지 측정 (디스플레이 필요)")
+    parser.add_argument("--top", type=int, default=15, help="표시할 모듈 수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    mode = "gui" if args.gui else "import"
+    runs = [run_probe(mode) for _ in range(args.runs)]
+    report = {
+        "runs": args.runs,
+        "import_ms": round(statistics.median(run["import"] for run in runs) * 1000, 1),
+        "lazy_loaded": runs[-1]["lazy_loaded"],
+        "modules_ms": {name: round(cost / 1000, 1) for name, cost in import_costs()[:args.top]},
+    }
+    if args.gui:
+        report["first_window_ms"] = round(statistics.median(run["first_window"] for run in runs) * 1000, 1)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"모듈 임포트: {report['import_ms']} ms (중앙값, {args.runs}회)")
+    if args.gui:
+        print(f"첫 화면 표시: {report['first_window_ms']} ms")
+    print(f"시작 시 불러온 무거운 모듈: {', '.join(report['lazy_loaded']) or '없음'}")
+    print("\n최상위 모듈별 임포트 비용 (cumulative):")
+    for name, cost in report["modules_ms"].items():
+        print(f"  {name:<32} {cost:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
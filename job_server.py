@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+"""
+Job Server
+Local HTTP API for submitting download/convert/split/merge/document jobs to this machine
+
+    python job_server.py                                      # 127.0.0.1:8765
+    python job_server.py --host 0.0.0.0 --root /srv/media     # shared box
+
+Jobs run on the same JobScheduler as the GUI queue, so JOB_LIMIT_NETWORK,
+JOB_LIMIT_CPU and JOB_LIMIT_DISK bound how many run at once; the rest wait
+in the queue. When --max-pending jobs are already queued or running, new
+submissions get 429 with Retry-After. With --root, every input/output path
+must lie under it (relative paths are resolved against it). Set
+JOB_API_TOKEN to require "Authorization: Bearer <token>" on every request
+except /health and /metrics. A non-loopback --host refuses to start unless
+--root or JOB_API_TOKEN is set.
+
+Endpoints:
+    GET    /health               -> {"status": "ok", "queued": n, "running": n, "limits": {...}}
+    GET    /metrics              -> job/operation counters and latency histograms (Prometheus text format)
+    POST   /jobs                 -> {"kind": ..., "params": {...}, "priority": "high" | "normal" | "low"}
+                                    202 with the job, 400 on bad params, 429 when the queue is full
+    GET    /jobs                 -> [job, ...]
+    GET    /jobs/<id>            -> job (status, progress, result, outputs)
+    GET    /jobs/<id>/events     -> NDJSON stream of events until the job ends
+                                    (?since=<seq> continues after an event already seen)
+    GET    /jobs/<id>/files/<n>  -> n-th output file of a finished job
+    DELETE /jobs/<id>            -> cancel a queued job (409 once it started)
+
+Job kinds and params:
+    download  url, output_dir, format ("mp4" | "mp3")
+    convert   input, format, chunked (optional, parallel chunked conversion)
+    split     input, output_dir, and either duration (seconds) or segments
+    merge     inputs (list), output
+    document  input, format (one format, or a list converted from a single parse)
+
+Event types: "status" (job state), "log", "message" (status line text), "progress" (percent).
+"""
+
+import argparse
+import asyncio
+import hmac
+import ipaddress
+import json
+import os
+import re
+import time
+from collections import deque
+from http import HTTPStatus
+from urllib.parse import parse_qs, quote, urlsplit
+
+from youtube_downloader.documents import DOCUMENT_CONVERSIONS, convert_document, convert_document_multi, is_multi_format_supported
+from youtube_downloader.download import download_youtube
+from youtube_downloader.jobs import (
+    JOB_FINISHED_STATUSES,
+    JOB_PRIORITY_HIGH,
+    JOB_PRIORITY_LOW,
+    JOB_PRIORITY_NORMAL,
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_DONE,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JobScheduler,
+)
+from youtube_downloader.media import convert_media, convert_media_chunked
+from youtube_downloader.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, start_metrics_exporters
+from youtube_downloader.split_merge import merge_media_files, split_media_by_duration, split_media_by_segments
+
+# Load environment variables (.env) like the GUI does
+try:
+    from load_env import load_env_file
+    load_env_file()
+except ImportError:
+    pass
+
+
+API_TOKEN_ENV = 'JOB_API_TOKEN'
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+REQUEST_TIMEOUT = 30        # seconds to receive a complete request
+RETRY_AFTER_SECONDS = 5     # hint sent with 429 when the queue is full
+EVENT_HISTORY = 1000        # events kept per job for /events (older ones are dropped)
+MAX_FINISHED_JOBS = 200     # finished jobs kept for status/result queries
+FILE_CHUNK_SIZE = 1024 * 1024
+
+PRIORITIES = {'high': JOB_PRIORITY_HIGH, 'normal': JOB_PRIORITY_NORMAL, 'low': JOB_PRIORITY_LOW}
+STATUS_NAMES = {
+    JOB_STATUS_QUEUED: 'queued',
+    JOB_STATUS_RUNNING: 'running',
+    JOB_STATUS_DONE: 'done',
+    JOB_STATUS_FAILED: 'failed',
+    JOB_STATUS_CANCELLED: 'cancelled',
+}
+# 스케줄러 알림은 여러 스레드에서 순서 없이 도착하므로 앞 단계로 되돌리는 알림은 무시
+STATUS_ORDER = {
+    JOB_STATUS_QUEUED: 0,
+    JOB_STATUS_RUNNING: 1,
+    JOB_STATUS_DONE: 2,
+    JOB_STATUS_FAILED: 2,
+    JOB_STATUS_CANCELLED: 2,
+}
+MEDIA_EXT_PATTERN = re.compile(r'[A-Za-z0-9]{1,8}')
+
+
+class ApiError(Exception):
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+class ApiJob:
+    """Server-side view of one submitted job; only touched from the event loop."""
+
+    def __init__(self, kind, params, priority, runner):
+        self.kind = kind
+        self.params = params
+        self.priority = priority
+        self.runner = runner
+        self.job_id = None
+        self.status = JOB_STATUS_QUEUED
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = 0.0
+        self.success = None
+        self.result = None
+        self.outputs = []
+        self.events = deque(maxlen=EVENT_HISTORY)
+        self.next_seq = 0
+        self.waiters = []
+
+    def add_event(self, event):
+        event['seq'] = self.next_seq
+        event['time'] = time.time()
+        self.next_seq += 1
+        self.events.append(event)
+        if event['type'] == 'progress':
+            self.progress = event['percent']
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self.waiters.clear()
+
+    @property
+    def finished(self):
+        return self.status in JOB_FINISHED_STATUSES
+
+    def summary(self):
+        return {
+            'id': self.job_id,
+            'kind': self.kind,
+            'params': self.params,
+            'priority': next(name for name, value in PRIORITIES.items() if value == self.priority),
+            'status': STATUS_NAMES[self.status],
+            'progress': self.progress,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'success': self.success,
+            'result': self.result,
+            'error': self.error,
+            'outputs': [
+                {'path': path, 'url': f"/jobs/{self.job_id}/files/{index}"}
+                for index, path in enumerate(self.outputs)
+            ],
+        }
+
+
+def snapshot_dir(folder):
+    """{path: (size, mtime)} of the files directly in folder (empty if it does not exist)"""
+    try:
+        entries = list(os.scandir(folder))
+    except OSError:
+        return {}
+    return {
+        entry.path: (entry.stat().st_size, entry.stat().st_mtime)
+        for entry in entries if entry.is_file()
+    }
+
+
+def new_files(folder, before):
+    """Files in folder that were created or changed since the snapshot"""
+    return sorted(path for path, stat in snapshot_dir(folder).items() if before.get(path) != stat)
+
+
+class JobServer:
+    def __init__(self, root=None, max_pending=100, max_connections=64, token=None, verbose=False):
+        self.root = os.path.realpath(root) if root else None
+        self.max_pending = max_pending
+        self.max_connections = max_connections
+        self.token = token
+        self.verbose = verbose
+        self.jobs = {}
+        self.connections = 0
+        self.loop = None
+        self.scheduler = JobScheduler(change_callback=self._on_job_change)
+
+    # --- job submission ---
+
+    def submit(self, payload):
+        if not isinstance(payload, dict):
+            raise ApiError(400, "request body must be a JSON object")
+        kind = payload.get('kind')
+        if not isinstance(kind, str) or kind not in JOB_KINDS:
+            raise ApiError(400, f"unknown job kind: {kind!r} (expected one of {', '.join(JOB_KINDS)})")
+        params = payload.get('params') or {}
+        if not isinstance(params, dict):
+            raise ApiError(400, "params must be a JSON object")
+        priority_name = payload.get('priority', 'normal')
+        priority = PRIORITIES.get(priority_name) if isinstance(priority_name, str) else None
+        if priority is None:
+            raise ApiError(400, f"priority must be one of {', '.join(PRIORITIES)}")
+
+        pending = sum(1 for job in self.jobs.values() if not job.finished)
+        if pending >= self.max_pending:
+            raise ApiError(429, f"job queue is full ({pending} jobs pending)", {'Retry-After': str(RETRY_AFTER_SECONDS)})
+
+        resource, prepare = JOB_KINDS[kind]
+        record = ApiJob(kind, params, priority, prepare(self, params))
+        job = self.scheduler.submit(kind, resource, self._execute, (record,), priority)
+        record.job_id = job.job_id
+        self.jobs[job.job_id] = record
+        # 제출 중 이미 시작되었을 수 있으므로 현재 상태를 첫 이벤트로 남김
+        self._apply_status(record, job.status, job.error, job.started_at, job.finished_at)
+        return record
+
+    def _execute(self, record):
+        """Scheduler worker thread: run the job and forward its callbacks to the event loop"""
+        def post(event):
+            self.loop.call_soon_threadsafe(record.add_event, event)
+
+        def progress(current, total):
+            post({'type': 'progress', 'percent': round(current / total * 100, 1) if total else 100.0})
+
+        success, result, outputs = record.runner(
+            lambda message: post({'type': 'log', 'message': message}),
+            lambda message: post({'type': 'message', 'message': message}),
+            progress
+        )
+        record.success = success
+        record.result = result
+        record.outputs = outputs if success else []
+        return success
+
+    def _on_job_change(self, job):
+        # 스케줄러 스레드에서 호출됨: 상태 값만 복사해 이벤트 루프로 넘김
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(
+                self._job_changed, job.job_id, job.status, job.error, job.started_at, job.finished_at
+            )
+
+    def _job_changed(self, job_id, status, error, started_at, finished_at):
+        record = self.jobs.get(job_id)
+        if record is None:
+            return  # submit()이 아직 등록하지 않음 (submit이 현재 상태를 직접 반영)
+        self._apply_status(record, status, error, started_at, finished_at)
+
+    def _apply_status(self, record, status, error, started_at, finished_at):
+        if record.next_seq and STATUS_ORDER[status] <= STATUS_ORDER[record.status]:
+            return
+        record.status = status
+        record.error = error
+        record.started_at = started_at
+        record.finished_at = finished_at
+        record.add_event({'type': 'status', 'status': STATUS_NAMES[status], 'error': error})
+        if record.finished:
+            self.scheduler.clear_finished()
+            self._trim_finished()
+
+    def _trim_finished(self):
+        finished = [job_id for job_id, record in self.jobs.items() if record.finished]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    # --- path policy ---
+
+    def resolve_path(self, params, field, must_exist=False):
+        value = params.get(field)
+        if not isinstance(value, str) or not value:
+            raise ApiError(400, f"params.{field} must be a non-empty path")
+        path = os.path.realpath(os.path.join(self.root, value) if self.root else value)
+        if self.root and os.path.commonpath([self.root, path]) != self.root:
+            raise ApiError(403, f"path outside server root: {value}")
+        if must_exist and not os.path.exists(path):
+            raise ApiError(400, f"file not found: {value}")
+        return path
+
+    # --- HTTP ---
+
+    async def handle_connection(self, reader, writer):
+        if self.connections >= self.max_connections:
+            await self._send_json(writer, 503, {'error': "too many connections"}, {'Retry-After': str(RETRY_AFTER_SECONDS)})
+            await self._close(writer)
+            return
+        self.connections += 1
+        try:
+            method, path, query, headers, body = await asyncio.wait_for(self._read_request(reader), REQUEST_TIMEOUT)
+            if self.verbose:
+                print(f"{writer.get_extra_info('peername')} {method} {path}")
+            await self._route(reader, writer, method, path, query, headers, body)
+        except ApiError as e:
+            await self._send_json(writer, e.status, {'error': e.message}, e.headers)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            await self._send_json(writer, 400, {'error': "malformed request"})
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            await self._close(writer)
+
+    async def _read_request(self, reader):
+        head = await reader.readuntil(b'\r\n\r\n')
+        request_line, *header_lines = head.decode('latin-1').split('\r\n')
+        method, target, _version = request_line.split(' ', 2)
+        headers = {}
+        for line in header_lines:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length') or 0)
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, f"request body larger than {MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length else b''
+        url = urlsplit(target)
+        return method.upper(), url.path, parse_qs(url.query), headers, body
+
+    async def _route(self, reader, writer, method, path, query, headers, body):
+        parts = [part for part in path.split('/') if part]
+        if parts == ['health'] and method == 'GET':
+            await self._send_json(writer, 200, self._health())
+            return
+        if parts == ['metrics'] and method == 'GET':
+            body = REGISTRY.render().encode('utf-8')
+            writer.write(self._response_head(200, {'Content-Type': METRICS_CONTENT_TYPE, 'Content-Length': str(len(body))}) + body)
+            await writer.drain()
+            return
+        self._check_token(headers)
+
+        if parts == ['jobs']:
+            if method == 'POST':
+                try:
+                    payload = json.loads(body or b'{}')
+                except ValueError:
+                    raise ApiError(400, "request body is not valid JSON")
+                record = self.submit(payload)
+                await self._send_json(writer, 202, record.summary(), {'Location': f"/jobs/{record.job_id}"})
+            elif method == 'GET':
+                await self._send_json(writer, 200, [record.summary() for record in self.jobs.values()])
+            else:
+                raise ApiError(405, "method not allowed")
+            return
+
+        if len(parts) >= 2 and parts[0] == 'jobs':
+            record = self._get_job(parts[1])
+            if len(parts) == 2 and method == 'GET':
+                await self._send_json(writer, 200, record.summary())
+            elif len(parts) == 2 and method == 'DELETE':
+                if not self.scheduler.cancel(record.job_id):
+                    raise ApiError(409, f"job {record.job_id} is {STATUS_NAMES[record.status]} and cannot be cancelled")
+                self._apply_status(record, JOB_STATUS_CANCELLED, None, None, time.time())
+                await self._send_json(writer, 200, record.summary())
+            elif parts[2:] == ['events'] and method == 'GET':
+                since = query.get('since', ['-1'])[0]
+                await self._stream_events(reader, writer, record, int(since) if since.lstrip('-').isdigit() else -1)
+            elif len(parts) == 4 and parts[2] == 'files' and method == 'GET':
+                await self._send_file(writer, record, parts[3])
+            else:
+                raise ApiError(404, "not found")
+            return
+        raise ApiError(404, "not found")
+
+    def _check_token(self, headers):
+        if not self.token:
+            return
+        if not hmac.compare_digest(headers.get('authorization', ''), f"Bearer {self.token}"):
+            raise ApiError(401, "missing or invalid bearer token", {'WWW-Authenticate': 'Bearer'})
+
+    def _get_job(self, value):
+        record = self.jobs.get(int(value)) if value.isdigit() else None
+        if record is None:
+            raise ApiError(404, f"no such job: {value}")
+        return record
+
+    def _health(self):
+        statuses = [record.status for record in self.jobs.values()]
+        return {
+            'status': 'ok',
+            'queued': statuses.count(JOB_STATUS_QUEUED),
+            'running': statuses.count(JOB_STATUS_RUNNING),
+            'max_pending': self.max_pending,
+            'limits': self.scheduler.limits,
+        }
+
+    async def _stream_events(self, reader, writer, record, since):
+        writer.write(self._response_head(200, {'Content-Type': 'application/x-ndjson', 'Cache-Control': 'no-cache'}))
+        # 클라이언트는 요청 뒤에 보낼 것이 없으므로 읽기가 끝나면 연결이 끊긴 것
+        disconnected = self.loop.create_task(reader.read(1))
+        try:
+            while True:
+                pending = [event for event in record.events if event['seq'] > since]
+                for event in pending:
+                    writer.write((json.dumps(event, ensure_ascii=False) + '\n').encode('utf-8'))
+                    since = event['seq']
+                # 느린 클라이언트는 자기 스트림만 늦춤 (작업 쪽 이벤트 기록은 EVENT_HISTORY로 제한)
+                await writer.drain()
+                if record.finished and since >= record.next_seq - 1:
+                    return
+                waiter = self.loop.create_future()
+                record.waiters.append(waiter)
+                # 대기 중인 작업의 스트림도 끊기면 바로 연결 슬롯을 돌려줌
+                await asyncio.wait((waiter, disconnected), return_when=asyncio.FIRST_COMPLETED)
+                if disconnected.done() or writer.is_closing():
+                    if waiter in record.waiters:
+                        record.waiters.remove(waiter)
+                    return
+        finally:
+            disconnected.cancel()
+
+    async def _send_file(self, writer, record, index):
+        if not record.finished:
+            raise ApiError(409, f"job {record.job_id} has not finished")
+        if not index.isdigit() or int(index) >= len(record.outputs):
+            raise ApiError(404, f"job {record.job_id} has no output {index}")
+        path = record.outputs[int(index)]
+        try:
+            f = open(path, 'rb')
+        except OSError as e:
+            raise ApiError(410, f"output is no longer available: {e}")
+        with f:
+            name = os.path.basename(path)
+            writer.write(self._response_head(200, {
+                'Content-Type': 'application/octet-stream',
+                'Content-Length': str(os.fstat(f.fileno()).st_size),
+                'Content-Disposition': f"attachment; filename*=UTF-8''{quote(name)}",
+            }))
+            while True:
+                data = await self.loop.run_in_executor(None, f.read, FILE_CHUNK_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+
+    @staticmethod
+    def _response_head(status, headers):
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", "Connection: close"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    async def _send_json(self, writer, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = {'Content-Type': 'application/json; charset=utf-8', 'Content-Length': str(len(body))}
+        head.update(headers or {})
+        try:
+            writer.write(self._response_head(status, head) + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    async def _close(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def serve(self, host, port):
+        self.loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        async with server:
+            await server.serve_forever()
+
+
+# --- job kinds: validate params at submission and return a runner(log, status, progress) ---
+
+def _require(params, field, check=None, message=None):
+    value = params.get(field)
+    if value is None or (check and not check(value)):
+        raise ApiError(400, message or f"params.{field} is required")
+    return value
+
+
+def prepare_download(server, params):
+    url = _require(params, 'url', lambda v: isinstance(v, str) and v.startswith(('http://', 'https://')),
+                   "params.url must be an http(s) URL")
+    output_dir = server.resolve_path(params, 'output_dir')
+    format_type = params.get('format', 'mp4')
+    if format_type not in ('mp4', 'mp3'):
+        raise ApiError(400, "params.format must be mp4 or mp3")
+
+    def run(log, status, progress):
+        before = snapshot_dir(output_dir)
+        success, result = download_youtube(url, output_dir, format_type, log, status)
+        return success, result, new_files(output_dir, before)
+    return run
+
+
+def prepare_convert(server, params):
+    input_file = server.resolve_path(params, 'input', must_exist=True)
+    output_ext = _require(params, 'format', lambda v: isinstance(v, str) and MEDIA_EXT_PATTERN.fullmatch(v),
+                          "params.format must be a file extension such as mp3")
+    chunked = bool(params.get('chunked', False))
+
+    def run(log, status, progress):
+        if chunked:
+            success, result = convert_media_chunked(input_file, output_ext, log, progress_callback=progress)
+        else:
+            success, result = convert_media(input_file, output_ext, log)
+        progress(1, 1)
+        return success, result, [result] if success else []
+    return run
+
+
+def prepare_split(server, params):
+    input_file = server.resolve_path(params, 'input', must_exist=True)
+    output_dir = server.resolve_path(params, 'output_dir')
+    duration = params.get('duration')
+    segments = params.get('segments')
+    if (duration is None) == (segments is None):
+        raise ApiError(400, "give either params.duration (seconds) or params.segments")
+    if duration is not None and not (isinstance(duration, (int, float)) and duration > 0):
+        raise ApiError(400, "params.duration must be a positive number of seconds")
+    if segments is not None and not (isinstance(segments, int) and segments >= 2):
+        raise ApiError(400, "params.segments must be an integer of at least 2")
+
+    def run(log, status, progress):
+        before = snapshot_dir(output_dir)
+        if duration is not None:
+            success, result = split_media_by_duration(input_file, duration, output_dir, log, status, progress)
+        else:
+            success, result = split_media_by_segments(input_file, segments, output_dir, log, status, progress)
+        return success, result, new_files(output_dir, before)
+    return run
+
+
+def prepare_merge(server, params):
+    inputs = params.get('inputs')
+    if not isinstance(inputs, list) or len(inputs) < 2:
+        raise ApiError(400, "params.inputs must be a list of at least 2 files")
+    input_files = [server.resolve_path({'input': value}, 'input', must_exist=True) for value in inputs]
+    output_file = server.resolve_path(params, 'output')
+
+    def run(log, status, progress):
+        success, result = merge_media_files(input_files, output_file, log, status, progress)
+        return success, result, [result] if success else []
+    return run
+
+
+def prepare_document(server, params):
+    input_file = server.resolve_path(params, 'input', must_exist=True)
+    output_format = params.get('format')
+    input_ext = os.path.splitext(input_file)[1].lower()
+    formats = output_format if isinstance(output_format, list) else [output_format]
+    if not formats or not all(isinstance(fmt, str) and fmt for fmt in formats):
+        raise ApiError(400, "params.format must be a format name or a list of them")
+    if isinstance(output_format, list):
+        unsupported = [fmt for fmt in formats if not is_multi_format_supported(input_ext, fmt)]
+        if unsupported:
+            raise ApiError(400, f"unsupported conversion: {input_ext} → {', '.join(unsupported)}")
+    elif (input_ext, output_format) not in DOCUMENT_CONVERSIONS:
+        raise ApiError(400, f"unsupported conversion: {input_ext} → {output_format}")
+
+    def run(log, status, progress):
+        if isinstance(output_format, list):
+            success, results = convert_document_multi(input_file, output_format, log)
+            outputs = [path for path in results.values() if os.path.isfile(path)]
+            progress(1, 1)
+            return success, results, outputs
+        success, result = convert_document(input_file, output_format, log)
+        progress(1, 1)
+        return success, result, [result] if success else []
+    return run
+
+
+# 작업 종류 → (스케줄러 자원 종류, 파라미터 검증 후 실행 함수를 돌려주는 함수)
+JOB_KINDS = {
+    'download': ('network', prepare_download),
+    'convert': ('cpu', prepare_convert),
+    'split': ('disk', prepare_split),
+    'merge': ('disk', prepare_merge),
+    'document': ('cpu', prepare_document),
+}
+
+
+def is_loopback_host(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP job API for the downloader/converter")
+    parser.add_argument('--host', default='127.0.0.1', help="use 0.0.0.0 to accept jobs from other machines")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--root', default=None, help="only allow input/output paths under this directory")
+    parser.add_argument('--max-pending', type=int, default=100, help="queued + running jobs before 429")
+    parser.add_argument('--max-connections', type=int, default=64)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+    token = os.environ.get(API_TOKEN_ENV)
+    if not (is_loopback_host(args.host) or args.root or token):
+        parser.error(f"--host {args.host} accepts jobs from other machines; set --root or {API_TOKEN_ENV} "
+                     "so remote clients cannot read or write arbitrary paths")
+
+    # METRICS_FILE도 설정되어 있으면 파일로도 덤프 (METRICS_PORT는 /metrics와 별도 포트)
+    try:
+        start_metrics_exporters()
+    except (ValueError, OSError) as e:
+        parser.error(f"cannot start metrics endpoint: {e}")
+    server = JobServer(args.root, args.max_pending, args.max_connections, token, args.verbose)
+    print(f"Job server listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
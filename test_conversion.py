@@ -9,13 +9,15 @@ import os
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# 변환 함수 임포트
-# 파일명에 특수문자가 있어서 직접 임포트
-import importlib.util
-spec = importlib.util.spec_from_file_location("converter", "/Users/choichunsung/Documents/GitHub/myproduct_v4/youtubedownloading/유트브다운로더&미디어변환기_v2.py")
-converter_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(converter_module)
-convert_document = converter_module.convert_document
+# 변환 함수 임포트 (GUI 없이 엔진 패키지만 불러옴)
+from youtube_downloader.documents import convert_document
+from youtube_downloader.pandoc import get_pandoc_worker
+
+import tempfile
+import zipfile
+import struct
+import zlib
+import pypandoc
 
 def test_log(message):
     print(f"[LOG] {message}")
@@ -66,5 +68,57 @@ def test_conversion():
         
         print("\n")
 
+def make_test_png(path):
+    """4x4 빨간색 PNG 생성"""
+    raw = b''.join(b'\x00' + b'\xff\x00\x00' * 4 for _ in range(4))
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', 4, 4, 8, 2, 0, 0, 0))
+                + chunk(b'IDAT', zlib.compress(raw)) + chunk(b'IEND', b''))
+
+def docx_media(path):
+    with zipfile.ZipFile(path) as docx_file:
+        return sorted(docx_file.read(name) for name in docx_file.namelist() if name.startswith('word/media/'))
+
+def test_pandoc_worker_images():
+    """상주 pandoc 워커와 pandoc CLI가 같은 이미지를 DOCX에 넣는지 비교"""
+    print("=" * 60)
+    print("pandoc 워커 / CLI 이미지 비교 테스트")
+    print("=" * 60)
+    
+    worker = get_pandoc_worker()
+    if worker is None:
+        print("pandoc 워커가 꺼져 있어 건너뜁니다")
+        return
+    
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # 워커는 다른 작업 폴더에서 이미 실행 중이어도 CLI처럼 현재 작업 폴더 기준으로 이미지를 찾아야 함
+        try:
+            worker.convert_text("warm up", 'markdown', 'html', os.path.join(temp_dir, 'warmup.html'))
+        except Exception as e:
+            print(f"⚠️  pandoc 워커를 사용할 수 없어 건너뜁니다: {str(e)}")
+            return
+        os.chdir(temp_dir)
+        try:
+            make_test_png('image.png')
+            with open('image.md', 'w', encoding='utf-8') as f:
+                f.write("# 이미지 테스트\n\n![그림](image.png)\n")
+            
+            pypandoc.convert_file('image.md', 'docx', outputfile='cli.docx')
+            worker.convert('image.md', 'docx', 'worker.docx')
+            
+            cli_media, worker_media = docx_media('cli.docx'), docx_media('worker.docx')
+            if cli_media and cli_media == worker_media:
+                print(f"✅ 이미지 {len(worker_media)}개 일치")
+            else:
+                print(f"❌ 이미지 불일치: CLI {len(cli_media)}개, 워커 {len(worker_media)}개")
+        finally:
+            os.chdir(original_dir)
+    
+    print("\n")
+
 if __name__ == "__main__":
-    test_conversion()
\ No newline at end of file
+    test_conversion()
+    test_pandoc_worker_images()
\ No newline at end of file
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Transcode Worker
+Small HTTP worker that transcodes media chunks with ffmpeg for distributed conversion
+
+Run one per core group on each worker host (or several on one machine for testing):
+
+    python transcode_worker.py --port 9001
+    python transcode_worker.py --port 9002
+
+Endpoints:
+    GET  /health            -> {"status": "ok", "busy": bool}
+    POST /transcode         -> chunk bytes in the body, transcoded bytes in the response
+                               (headers: X-Input-Ext, X-Output-Ext)
+    POST /transcode-shared  -> {"input": path, "output": path} on shared storage
+                               (only with --shared-root; both paths must lie under it)
+
+The worker listens on 127.0.0.1 unless --host is given. Set
+TRANSCODE_WORKER_TOKEN (on the workers and the coordinator) to require
+"Authorization: Bearer <token>" on every request except /health. A
+non-loopback --host refuses to start without TRANSCODE_WORKER_TOKEN.
+"""
+
+import argparse
+import hmac
+import ipaddress
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+COPY_BUFFER_SIZE = 1024 * 1024
+WORKER_TOKEN_ENV = 'TRANSCODE_WORKER_TOKEN'
+
+
+def run_ffmpeg(input_file, output_file, threads=None):
+    """Transcode input_file to output_file (format chosen by extension)"""
+    cmd = ['ffmpeg', '-y', '-i', input_file]
+    if threads:
+        cmd += ['-threads', str(threads)]
+    cmd.append(output_file)
+    subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+
+class TranscodeHandler(BaseHTTPRequestHandler):
+    server_version = "TranscodeWorker/1.0"
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok', 'busy': self.server.busy.locked()})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path not in ('/transcode', '/transcode-shared'):
+            self._send_json(404, {'error': 'not found'})
+            return
+        token = self.server.token
+        if token and not hmac.compare_digest(self.headers.get('Authorization', ''), f"Bearer {token}"):
+            self._drain_body()
+            self._send_json(401, {'error': 'missing or invalid bearer token'})
+            return
+        if self.path == '/transcode-shared' and not self.server.shared_root:
+            self._drain_body()
+            self._send_json(403, {'error': 'shared-storage transcoding is disabled (start the worker with --shared-root)'})
+            return
+
+        # One ffmpeg job per worker; the coordinator retries elsewhere when busy
+        if not self.server.busy.acquire(blocking=False):
+            self._drain_body()
+            self._send_json(503, {'error': 'busy'})
+            return
+        self.response_started = False
+        try:
+            if self.path == '/transcode':
+                self._transcode_streamed()
+            else:
+                self._transcode_shared()
+        except subprocess.CalledProcessError as e:
+            self._send_error_or_abort({'error': e.stderr[-2000:] if e.stderr else str(e)})
+        except (OSError, ValueError, KeyError) as e:
+            self._send_error_or_abort({'error': str(e)})
+        finally:
+            self.server.busy.release()
+
+    def _send_error_or_abort(self, payload):
+        if self.response_started:
+            # 200 헤더를 이미 보냈으면 본문 중간에 오류 응답을 쓰지 않고 연결을 끊어
+            # 코디네이터가 Content-Length보다 짧은 응답으로 실패를 알게 함
+            self.close_connection = True
+            return
+        self._send_json(500, payload)
+
+    def _transcode_streamed(self):
+        input_ext = self._safe_ext(self.headers.get('X-Input-Ext', '.bin'))
+        output_ext = self._safe_ext(self.headers.get('X-Output-Ext', ''))
+        if not output_ext:
+            self._drain_body()
+            self._send_json(400, {'error': 'X-Output-Ext header is required'})
+            return
+
+        scratch = tempfile.mkdtemp(prefix='worker_', dir=self.server.scratch_root)
+        try:
+            input_file = os.path.join(scratch, 'input' + input_ext)
+            output_file = os.path.join(scratch, 'output' + output_ext)
+            remaining = int(self.headers.get('Content-Length', 0))
+            with open(input_file, 'wb') as f:
+                while remaining > 0:
+                    data = self.rfile.read(min(COPY_BUFFER_SIZE, remaining))
+                    if not data:
+                        break
+                    f.write(data)
+                    remaining -= len(data)
+            if remaining > 0:
+                self.close_connection = True
+                self._send_json(400, {'error': f'upload truncated ({remaining} bytes missing)'})
+                return
+
+            run_ffmpeg(input_file, output_file, self.server.threads)
+
+            self.response_started = True
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(os.path.getsize(output_file)))
+            self.end_headers()
+            with open(output_file, 'rb') as f:
+                shutil.copyfileobj(f, self.wfile, COPY_BUFFER_SIZE)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def _transcode_shared(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        input_file = request['input']
+        output_file = request['output']
+        root = os.path.realpath(self.server.shared_root)
+        for path in (input_file, output_file):
+            if os.path.commonpath([root, os.path.realpath(path)]) != root:
+                self._send_json(403, {'error': f'path outside shared root: {path}'})
+                return
+        run_ffmpeg(input_file, output_file, self.server.threads)
+        self._send_json(200, {'output': output_file})
+
+    def _drain_body(self):
+        remaining = int(self.headers.get('Content-Length', 0))
+        while remaining > 0:
+            data = self.rfile.read(min(COPY_BUFFER_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+
+    @staticmethod
+    def _safe_ext(ext):
+        ext = os.path.basename(ext.strip())
+        if ext and not ext.startswith('.'):
+            ext = '.' + ext
+        return ext
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(host, port, threads=None, scratch_root=None, shared_root=None, verbose=False, token=None):
+    """Create a worker server (call serve_forever() to run it)"""
+    server = ThreadingHTTPServer((host, port), TranscodeHandler)
+    server.busy = threading.Lock()
+    server.threads = threads
+    server.scratch_root = scratch_root or os.environ.get('MEDIA_SCRATCH_DIR') or tempfile.gettempdir()
+    server.shared_root = shared_root
+    server.verbose = verbose
+    server.token = token
+    os.makedirs(server.scratch_root, exist_ok=True)
+    return server
+
+
+def is_loopback_host(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ffmpeg transcode worker for distributed conversion")
+    parser.add_argument('--host', default='127.0.0.1', help="use 0.0.0.0 to accept chunks from other machines")
+    parser.add_argument('--port', type=int, default=9001)
+    parser.add_argument('--threads', type=int, default=None, help="ffmpeg -threads per job")
+    parser.add_argument('--scratch', default=None, help="scratch directory for streamed chunks")
+    parser.add_argument('--shared-root', default=None, help="enable /transcode-shared for paths under this directory")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+    token = os.environ.get(WORKER_TOKEN_ENV)
+    if not (is_loopback_host(args.host) or token):
+        parser.error(f"--host {args.host} accepts chunks from other machines; set {WORKER_TOKEN_ENV} "
+                     "so only the coordinator can submit files for ffmpeg to process")
+
+    server = create_server(args.host, args.port, args.threads, args.scratch, args.shared_root, args.verbose, token)
+    print(f"Transcode worker listening on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
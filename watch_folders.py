@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Watch Folders
+Daemon that converts files dropped into watched folders, one rule per folder
+
+    python watch_folders.py --rule /srv/in/audio convert_media mp3 \
+                            --rule /srv/in/long split_media_by_duration 600 \
+                            --rule /srv/in/docs convert_document pdf
+    python watch_folders.py watch_rules.json
+
+On Linux, inotify reports new and changed files, so the shares are not
+rescanned. Elsewhere, or when inotify is unavailable, the folders are
+polled. A file is processed once it has been quiet for --settle seconds and
+its size/mtime stopped changing, which debounces partial writes and slow
+copies. The size/mtime of every processed file is kept in a state file per rule.
+At startup only files that changed since the last run are picked up, and a
+file is processed again only after it changes. A file whose job failed is
+retried when it changes, or otherwise after a backoff that doubles from
+FAILURE_RETRY_BASE up to FAILURE_RETRY_MAX seconds.
+
+Rules file (JSON):
+    {
+      "settle_seconds": 5,
+      "rules": [
+        {"folder": "/srv/in/audio", "action": "convert_media", "format": "mp3"},
+        {"folder": "/srv/in/long", "action": "split_media_by_duration", "duration": 600,
+         "output_dir": "/srv/out/parts", "recursive": false},
+        {"folder": "/srv/in/docs", "action": "convert_document", "format": "pdf",
+         "patterns": ["*.docx", "*.pptx"]}
+      ]
+    }
+
+Actions:
+    convert_media             format; the output is written next to the input
+    split_media_by_duration   duration (seconds); output_dir (default <folder>/split/<name>)
+    convert_document          format; the output is written next to the input
+
+Rules watch sub-folders unless "recursive" is false. Split output folders are
+never watched. Jobs run on the engine's JobScheduler (JOB_LIMIT_CPU /
+JOB_LIMIT_DISK bound how many run at once).
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import datetime
+import errno
+import fnmatch
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+from youtube_downloader.documents import DOCUMENT_CONVERSIONS, convert_document
+from youtube_downloader.jobs import JobScheduler
+from youtube_downloader.media import convert_media
+from youtube_downloader.metrics import start_metrics_exporters
+from youtube_downloader.split_merge import split_media_by_duration
+
+# Load environment variables (.env) like the GUI does
+try:
+    from load_env import load_env_file
+    load_env_file()
+except ImportError:
+    pass
+
+
+WATCH_STATE_ENV = 'WATCH_STATE_FILE'
+DEFAULT_SETTLE_SECONDS = 5
+POLL_INTERVAL = 10              # seconds between scans when inotify is not available
+FAILURE_RETRY_BASE = 60         # first retry of an unchanged file that failed (doubles per failure)
+FAILURE_RETRY_MAX = 3600
+MEDIA_EXTS = ('.mp4', '.mp3', '.mov', '.avi', '.wav', '.flv', '.mkv')
+# 복사/다운로드 중인 임시 파일 (완성되면 보통 최종 이름으로 rename됨)
+PARTIAL_SUFFIXES = ('.part', '.partial', '.tmp', '.crdownload', '.download')
+
+# inotify(7)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_HEADER = struct.Struct('iIII')    # wd, mask, cookie, len
+EVENT_BUFFER_SIZE = 64 * 1024
+
+
+def log(message):
+    print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] {message}", flush=True)
+
+
+def get_watch_state_path():
+    return os.environ.get(WATCH_STATE_ENV) or str(Path.home() / ".cache" / "youtube-downloader" / "watch_state.json")
+
+
+class Inotify:
+    """Minimal inotify binding through libc (Linux only)."""
+
+    def __init__(self):
+        if not sys.platform.startswith('linux'):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path, mask=WATCH_MASK):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+        return wd
+
+    def read_events(self, timeout):
+        """[(wd, mask, name)] received within timeout seconds"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, EVENT_BUFFER_SIZE)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class WatchRule:
+    """One watched folder and what to do with the files dropped into it."""
+
+    def __init__(self, folder, action, format=None, duration=None, output_dir=None, patterns=None, recursive=True):
+        self.folder = os.path.realpath(folder)
+        self.action = action
+        self.format = format.lower().lstrip('.') if format else None
+        self.duration = duration
+        self.recursive = recursive
+        self.output_dir = os.path.realpath(output_dir) if output_dir else None
+        if action in ('convert_media', 'convert_document') and not self.format:
+            raise ValueError(f"{folder}: {action} needs a format")
+        if action == 'split_media_by_duration':
+            if not isinstance(duration, (int, float)) or duration <= 0:
+                raise ValueError(f"{folder}: split_media_by_duration needs a positive duration (seconds)")
+            self.output_dir = self.output_dir or os.path.join(self.folder, "split")
+        elif action not in ('convert_media', 'convert_document'):
+            raise ValueError(f"{folder}: unknown action {action}")
+        self.patterns = patterns or self._default_patterns()
+
+    def _default_patterns(self):
+        if self.action == 'convert_document':
+            exts = [ext for ext, fmt in DOCUMENT_CONVERSIONS if fmt == self.format]
+        elif self.action == 'convert_media':
+            exts = [ext for ext in MEDIA_EXTS if ext != f".{self.format}"]  # 결과 파일은 다시 변환하지 않음
+        else:
+            exts = MEDIA_EXTS
+        return [f"*{ext}" for ext in exts]
+
+    def covers(self, path):
+        """True if path is a file this rule should process"""
+        directory, name = os.path.split(path)
+        if name.startswith(('.', '~$')) or name.lower().endswith(PARTIAL_SUFFIXES):
+            return False
+        if directory != self.folder and not (self.recursive and directory.startswith(self.folder + os.sep)):
+            return False
+        return any(fnmatch.fnmatch(name.lower(), pattern.lower()) for pattern in self.patterns)
+
+    def run(self, path, log_callback):
+        """Process one file; returns (success, result)"""
+        if self.action == 'convert_media':
+            return convert_media(path, self.format, log_callback)
+        if self.action == 'convert_document':
+            return convert_document(path, self.format, log_callback)
+        output_dir = os.path.join(self.output_dir, os.path.splitext(os.path.basename(path))[0])
+        return split_media_by_duration(path, self.duration, output_dir, log_callback, lambda message: None)
+
+    @property
+    def key(self):
+        """State key: a file is processed once per rule (folder + action + setting)"""
+        return f"{self.folder}|{self.action}|{self.format or self.duration}"
+
+    @property
+    def resource(self):
+        return 'disk' if self.action == 'split_media_by_duration' else 'cpu'
+
+
+class FolderWatcher:
+    """
+    Feed changed files from the watched folders to their rules.
+
+    Changes come from inotify when available (falling back to periodic
+    scans otherwise). A changed file waits in `pending` until it has been
+    quiet for settle_seconds with an unchanged size/mtime, then runs on the
+    scheduler unless the state file shows this exact version was already
+    processed. State entries are [size, mtime] after a success and
+    [size, mtime, failures, retry_at] after a failure; `retry_times` holds
+    the wall-clock time at which each failed file is looked at again.
+    """
+
+    def __init__(self, rules, state_path, settle_seconds=DEFAULT_SETTLE_SECONDS, use_inotify=True, scheduler=None):
+        self.rules = rules
+        self.state_path = state_path
+        self.settle_seconds = settle_seconds
+        self.scheduler = scheduler or JobScheduler()
+        self.excluded = [rule.output_dir for rule in rules if rule.output_dir]
+        self.pending = {}           # path → (deadline, stat at last event)
+        self.in_flight = set()
+        self.watches = {}           # wd → directory
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+        self.retry_times = {        # path → time.time() of the next retry after a failure
+            path: entry[3] for files in self.state.values() for path, entry in files.items() if len(entry) > 2
+        }
+        self.inotify = None
+        if use_inotify:
+            try:
+                self.inotify = Inotify()
+            except OSError as e:
+                log(f"inotify unavailable ({e}), polling every {POLL_INTERVAL}s instead")
+
+    # --- state ---
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return {
+                    rule_key: {path: tuple(version) for path, version in files.items()}
+                    for rule_key, files in json.load(f).items()
+                }
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with self._lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(temp_path, self.state_path)
+
+    # --- discovery ---
+
+    def _rule_for(self, path):
+        if any(path == folder or path.startswith(folder + os.sep) for folder in self.excluded):
+            return None
+        matches = [rule for rule in self.rules if rule.covers(path)]
+        return max(matches, key=lambda rule: len(rule.folder)) if matches else None
+
+    def _is_watched_dir(self, directory):
+        if any(directory == folder or directory.startswith(folder + os.sep) for folder in self.excluded):
+            return False
+        return any(
+            directory == rule.folder or (rule.recursive and directory.startswith(rule.folder + os.sep))
+            for rule in self.rules
+        )
+
+    def _add_tree(self, directory):
+        """Watch directory (and its sub-folders when a rule is recursive) and queue changed files in it"""
+        for dir_path, dir_names, file_names in os.walk(directory):
+            if not self._is_watched_dir(dir_path):
+                dir_names[:] = []
+                continue
+            if self.inotify:
+                try:
+                    self.watches[self.inotify.add_watch(dir_path)] = dir_path
+                except OSError as e:
+                    log(f"Cannot watch {dir_path}: {e}")
+            dir_names[:] = [name for name in dir_names if self._is_watched_dir(os.path.join(dir_path, name))]
+            for file_name in file_names:
+                self._file_changed(os.path.join(dir_path, file_name))
+
+    def _scan(self):
+        """Full pass over the watched folders (startup, inotify overflow, polling mode)"""
+        for rule in self.rules:
+            if os.path.isdir(rule.folder):
+                self._add_tree(rule.folder)
+            else:
+                log(f"Watched folder does not exist: {rule.folder}")
+
+    def _processed_version(self, rule, path):
+        return self.state.get(rule.key, {}).get(path)
+
+    def _should_process(self, rule, path, version):
+        entry = self._processed_version(rule, path)
+        if entry is None or tuple(entry[:2]) != version:
+            return True
+        # 실패한 버전은 바뀌지 않았으면 대기 시간이 지난 뒤에만 다시 시도
+        return len(entry) > 2 and time.time() >= entry[3]
+
+    def _file_changed(self, path):
+        rule = self._rule_for(path)
+        if rule is None:
+            return
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.pending.pop(path, None)
+            return
+        version = (stat.st_size, stat.st_mtime)
+        if path not in self.pending and not self._should_process(rule, path, version):
+            return  # 이미 처리했거나 재시도 대기 중인 버전
+        self.pending[path] = (time.monotonic() + self.settle_seconds, version)
+
+    # --- main loop ---
+
+    def run(self):
+        for rule in self.rules:
+            log(f"Watching {rule.folder} → {rule.action} ({', '.join(rule.patterns)})")
+        self._scan()
+        next_scan = time.monotonic() + POLL_INTERVAL
+        try:
+            while True:
+                timeout = self._next_timeout()
+                if self.inotify:
+                    self._handle_events(self.inotify.read_events(timeout))
+                else:
+                    time.sleep(min(timeout, max(0, next_scan - time.monotonic())))
+                    if time.monotonic() >= next_scan:
+                        self._scan()
+                        next_scan = time.monotonic() + POLL_INTERVAL
+                self._retry_failed()
+                self._submit_settled()
+        finally:
+            if self.inotify:
+                self.inotify.close()
+            self._save_state()
+
+    def _next_timeout(self):
+        if not self.pending:
+            return 1.0
+        return max(0.0, min(1.0, min(deadline for deadline, _ in self.pending.values()) - time.monotonic()))
+
+    def _handle_events(self, events):
+        for wd, mask, name in events:
+            if mask & IN_Q_OVERFLOW:
+                log("inotify queue overflowed, rescanning watched folders")
+                self._scan()
+                continue
+            directory = self.watches.get(wd)
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and self._is_watched_dir(path):
+                    self._add_tree(path)
+            else:
+                self._file_changed(path)
+
+    def _retry_failed(self):
+        """Queue failed files whose retry time has come (inotify reports nothing for unchanged files)"""
+        now = time.time()
+        with self._lock:
+            due = [path for path, retry_at in self.retry_times.items() if retry_at <= now]
+            for path in due:
+                del self.retry_times[path]
+        for path in due:
+            self._file_changed(path)
+
+    def _submit_settled(self):
+        now = time.monotonic()
+        for path, (deadline, version) in list(self.pending.items()):
+            if deadline > now:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self.pending[path]
+                continue
+            current = (stat.st_size, stat.st_mtime)
+            if current != version or path in self.in_flight:
+                # 아직 쓰는 중이거나 이전 버전을 처리 중이면 다시 기다림
+                self.pending[path] = (now + self.settle_seconds, current)
+                continue
+            del self.pending[path]
+            rule = self._rule_for(path)
+            if rule is None or not self._should_process(rule, path, current):
+                continue
+            self.in_flight.add(path)
+            self.scheduler.submit(os.path.basename(path), rule.resource, self._process, (rule, path, current))
+
+    def _process(self, rule, path, version):
+        log(f"{rule.action}: {path}")
+        try:
+            success, result = rule.run(path, lambda message: log(f"  {message}"))
+        finally:
+            self.in_flight.discard(path)
+        with self._lock:
+            files = self.state.setdefault(rule.key, {})
+            if success:
+                files[path] = version
+                self.retry_times.pop(path, None)
+            else:
+                previous = files.get(path)
+                failures = previous[2] + 1 if previous and len(previous) > 2 and tuple(previous[:2]) == version else 1
+                delay = min(FAILURE_RETRY_BASE * 2 ** (failures - 1), FAILURE_RETRY_MAX)
+                retry_at = time.time() + delay
+                files[path] = version + (failures, retry_at)
+                self.retry_times[path] = retry_at
+        self._save_state()
+        if success:
+            log(f"Done: {result}")
+        else:
+            log(f"Failed: {path}: {result} (retrying in {delay}s unless the file changes)")
+        return success
+
+
+def load_rules(config_path, rule_args):
+    """Rules from the JSON file and/or --rule FOLDER ACTION VALUE arguments; returns (rules, settle seconds)"""
+    settle_seconds = None
+    specs = []
+    if config_path:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        settle_seconds = config.get('settle_seconds')
+        specs.extend(config.get('rules', []))
+    for folder, action, value in rule_args or []:
+        if action == 'split_media_by_duration':
+            specs.append({'folder': folder, 'action': action, 'duration': float(value)})
+        else:
+            specs.append({'folder': folder, 'action': action, 'format': value})
+    return [WatchRule(**spec) for spec in specs], settle_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert files dropped into watched folders")
+    parser.add_argument('config', nargs='?', help="JSON rules file")
+    parser.add_argument('--rule', nargs=3, action='append', metavar=('FOLDER', 'ACTION', 'VALUE'),
+                        help="watch FOLDER: convert_media FORMAT | split_media_by_duration SECONDS | convert_document FORMAT")
+    parser.add_argument('--settle', type=float, default=None, help=f"quiet seconds before a file is processed (default {DEFAULT_SETTLE_SECONDS})")
+    parser.add_argument('--state', default=None, help="processed-file state (default $WATCH_STATE_FILE or ~/.cache/youtube-downloader/watch_state.json)")
+    parser.add_argument('--poll', action='store_true', help="scan periodically instead of using inotify")
+    args = parser.parse_args()
+
+    try:
+        rules, settle_seconds = load_rules(args.config, args.rule)
+    except (OSError, ValueError, TypeError) as e:
+        parser.error(str(e))
+    if not rules:
+        parser.error("no rules given (pass a rules file or --rule)")
+
+    try:
+        for target in start_metrics_exporters():
+            log(f"Metrics: {target}")
+    except (ValueError, OSError) as e:
+        parser.error(f"cannot start metrics endpoint: {e}")
+
+    watcher = FolderWatcher(
+        rules,
+        args.state or get_watch_state_path(),
+        args.settle if args.settle is not None else (settle_seconds or DEFAULT_SETTLE_SECONDS),
+        use_inotify=not args.poll
+    )
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+YouTube downloader / media & document converter engine
+Importable without Tk: the GUI (유트브다운로더&미디어변환기_v2.py) is one client of it.
+
+    youtube_downloader.download     YouTube download (yt-dlp)
+    youtube_downloader.media        ffmpeg helpers and media conversion
+    youtube_downloader.split_merge  splitting, merging and appending media
+    youtube_downloader.pandoc       persistent pandoc worker
+    youtube_downloader.documents    document extraction, model and conversion
+    youtube_downloader.jobs         job scheduler and persistent job store
+    youtube_downloader.metrics      Prometheus-format metrics registry and exporters
+    youtube_downloader.tracing      opt-in per-stage spans as Chrome trace-event JSON
+
+Submodules are not imported here, so a worker process that unpickles a
+function from one of them only imports that module and what it needs.
+"""
@@ -0,0 +1,1539 @@
+"""
+Documents
+Streaming DOCX/PPTX/PDF extraction, the shared document model and document conversion
+"""
+
+import os
+from pathlib import Path
+import re
+import tempfile
+import shutil
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+from collections import deque
+import zipfile
+import posixpath
+import hashlib
+import weakref
+import html
+import time
+
+from .lazy import LazyModule
+from .metrics import record_operation, timed_operation
+from .tracing import span, traced_iter
+from .pandoc import pandoc_convert_file, pandoc_convert_text
+
+docx = LazyModule('docx')
+pptx = LazyModule('pptx')
+PyPDF2 = LazyModule('PyPDF2')
+markdown = LazyModule('markdown')
+etree = LazyModule('lxml.etree')
+
+# 페이지별 추출 텍스트 캐시 (수정된 PDF를 다시 변환할 때 바뀐 페이지만 추출)
+PDF_PAGE_CACHE_ENV = 'PDF_PAGE_CACHE_DIR'     # 캐시 폴더, "off"면 캐시 사용 안 함
+PDF_PAGE_CACHE_MAX_MB_ENV = 'PDF_PAGE_CACHE_MAX_MB'
+PDF_PAGE_CACHE_MAX_MB = 200                   # 기본 캐시 크기 한도 (넘으면 오래 안 쓴 페이지부터 삭제)
+PDF_PAGE_CACHE_PRUNE_EVERY = 256              # 이만큼 새로 쓸 때마다 크기 확인
+PDF_PAGE_CACHE_VERSION = "3"                  # 추출 방식이 바뀌면 올려서 기존 캐시 무효화
+
+_pdf_page_cache_writes = 0
+
+def get_pdf_page_cache_dir():
+    """페이지 캐시 폴더 (사용하지 않으면 None)"""
+    cache_dir = os.environ.get(PDF_PAGE_CACHE_ENV)
+    if cache_dir and cache_dir.lower() == 'off':
+        return None
+    return cache_dir or str(Path.home() / ".cache" / "youtube-downloader" / "pdf_pages")
+
+def get_pdf_page_cache_limit():
+    """페이지 캐시 크기 한도 (바이트)"""
+    try:
+        max_mb = float(os.environ.get(PDF_PAGE_CACHE_MAX_MB_ENV) or PDF_PAGE_CACHE_MAX_MB)
+    except ValueError:
+        max_mb = PDF_PAGE_CACHE_MAX_MB
+    return int(max(max_mb, 0) * 1024 * 1024)
+
+# 추출 텍스트와 관계없는 항목 (글꼴 프로그램, 페이지 트리로 돌아가는 참조)
+PDF_DIGEST_SKIP_KEYS = ('/Parent', '/FontFile', '/FontFile2', '/FontFile3')
+# 텍스트 추출에 쓰이는 리소스 종류
+PDF_TEXT_RESOURCE_KEYS = ('/Font', '/XObject')
+
+# 문서별 간접 객체 digest (여러 페이지가 같은 리소스를 공유하므로 한 번만 계산)
+_pdf_digest_memos = weakref.WeakKeyDictionary()
+
+def _pdf_object_digest(obj, memo):
+    """텍스트 추출에 영향을 주는 PDF 객체 내용의 digest (간접 객체는 memo에 저장)"""
+    ref = None
+    if isinstance(obj, PyPDF2.generic.IndirectObject):
+        ref = (obj.idnum, obj.generation)
+        if ref in memo:
+            # None이면 계산 중인 객체를 다시 만난 순환 참조
+            return memo[ref] or f"R{ref}".encode()
+        memo[ref] = None
+        obj = obj.get_object()
+    
+    digest = hashlib.sha256()
+    if isinstance(obj, dict) and obj.get('/Subtype') == '/Image':
+        digest.update(b"image")  # 이미지 데이터는 추출 텍스트와 무관
+    elif isinstance(obj, dict):
+        if isinstance(obj, PyPDF2.generic.StreamObject):
+            # 폼 XObject, ToUnicode, Type3 글리프 같은 콘텐츠 스트림
+            digest.update(obj.get_data())
+        digest.update(b"<<")
+        for key in sorted(obj):
+            if key not in PDF_DIGEST_SKIP_KEYS:
+                digest.update(f"{key}=".encode() + _pdf_object_digest(obj.raw_get(key), memo))
+        digest.update(b">>")
+    elif isinstance(obj, list):
+        digest.update(b"[" + b"".join(_pdf_object_digest(item, memo) for item in obj) + b"]")
+    else:
+        digest.update(f"{obj!r}".encode())
+    
+    result = digest.digest()
+    if ref is not None:
+        memo[ref] = result
+    return result
+
+def pdf_page_cache_key(page):
+    """페이지 콘텐츠 스트림과 텍스트에 영향을 주는 리소스(글꼴, 폼 XObject)로 만든 캐시 키"""
+    digest = hashlib.sha256()
+    digest.update(f"{PDF_PAGE_CACHE_VERSION}:{PyPDF2.__version__}\n".encode())
+    contents = page.get_contents()
+    if contents is not None:
+        digest.update(contents.get_data())
+    # 같은 콘텐츠라도 글꼴 인코딩이나 폼 XObject 안의 텍스트가 다르면 추출 텍스트가 달라짐
+    memo = _pdf_digest_memos.setdefault(page.pdf, {}) if page.pdf is not None else {}
+    resources = page.get('/Resources')
+    resources = resources.get_object() if resources is not None else {}
+    for key in PDF_TEXT_RESOURCE_KEYS:
+        if key in resources:
+            digest.update(f"{key}=".encode() + _pdf_object_digest(resources.raw_get(key), memo))
+    return digest.hexdigest()
+
+def prune_pdf_page_cache(cache_dir, limit):
+    """캐시가 limit 바이트를 넘으면 가장 오래 쓰지 않은 페이지부터 삭제"""
+    entries = []
+    total = 0
+    for root, _dirs, files in os.walk(cache_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    if total <= limit:
+        return
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def extract_pdf_page_text(page):
+    """페이지 텍스트 추출 (캐시에 있으면 캐시 사용)"""
+    global _pdf_page_cache_writes
+    cache_dir = get_pdf_page_cache_dir()
+    if cache_dir is None:
+        return page.extract_text()
+    
+    try:
+        key = pdf_page_cache_key(page)
+    except Exception:
+        return page.extract_text()
+    cache_file = os.path.join(cache_dir, key[:2], f"{key}.txt")
+    try:
+        with open(cache_file, 'r', encoding='utf-8', newline='') as f:
+            page_text = f.read()
+        # 수정 시각을 최근 사용 시각으로 씀 (정리할 때 오래 안 쓴 것부터 삭제)
+        os.utime(cache_file)
+        return page_text
+    except OSError:
+        pass
+    
+    page_text = page.extract_text()
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # 여러 워커 프로세스가 동시에 써도 깨지지 않도록 임시 파일 후 교체
+        fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(page_text)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        return page_text
+    
+    # 프로세스마다 첫 기록 때와 이후 일정 횟수마다 크기 한도 확인
+    if _pdf_page_cache_writes % PDF_PAGE_CACHE_PRUNE_EVERY == 0:
+        prune_pdf_page_cache(cache_dir, get_pdf_page_cache_limit())
+    _pdf_page_cache_writes += 1
+    return page_text
+
+def clear_pdf_page_cache():
+    """페이지 캐시 전체 삭제"""
+    cache_dir = get_pdf_page_cache_dir()
+    if cache_dir and os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+def iter_pdf_page_texts(pdf_path):
+    """PDF 페이지 텍스트를 한 페이지씩 생성"""
+    with open(pdf_path, 'rb') as file:
+        with span('pdf.open', cat='document'):
+            pdf_reader = PyPDF2.PdfReader(file)
+        for i, page in enumerate(pdf_reader.pages, 1):
+            with span('pdf.extract_page', cat='document', page=i):
+                page_text = extract_pdf_page_text(page)
+            yield page_text
+
+def extract_text_from_pdf(pdf_path):
+    """PDF에서 텍스트 추출"""
+    try:
+        return "".join(page_text + "\n" for page_text in iter_pdf_page_texts(pdf_path))
+    except Exception as e:
+        raise Exception(f"PDF 텍스트 추출 실패: {str(e)}")
+
+def structure_pdf_page_blocks(page_number, page_text):
+    """페이지 텍스트 하나를 제목/리스트/문단 구조의 문서 모델 블록 목록으로 변환 (빈 페이지는 None)"""
+    if not page_text.strip():
+        return None
+    
+    page_content = []
+    page_content.append(('heading', 2, f"페이지 {page_number}"))
+    
+    # 텍스트를 줄별로 처리하며 연속된 일반 줄은 문단으로 합치기
+    current_paragraph = []
+    
+    def flush_paragraph():
+        if current_paragraph:
+            page_content.append(('paragraph', ' '.join(current_paragraph), None))
+            current_paragraph.clear()
+    
+    for line in page_text.strip().split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+            
+        # 제목처럼 보이는 줄 감지 (대문자 비율이 높거나 짧은 줄)
+        if len(line) < 100 and (line.isupper() or line.count(' ') < 5):
+            flush_paragraph()
+            page_content.append(('heading', 3, line))
+        # 리스트 항목 감지
+        elif line.startswith(('•', '-', '*', '·', '○')) or re.match(r'^\d+[.)]\s', line):
+            flush_paragraph()
+            page_content.append(('list_item', line.lstrip('•-*·○ ').lstrip('0123456789.) ')))
+        # '#'으로 시작하는 긴 줄은 제목으로 오인되지 않게 따로 문단으로 둠
+        elif line.startswith('#'):
+            flush_paragraph()
+            page_content.append(('paragraph', line, None))
+        # 일반 텍스트
+        else:
+            current_paragraph.append(line)
+    
+    flush_paragraph()
+    return page_content
+
+def structure_pdf_page_text(page_number, page_text):
+    """페이지 텍스트 하나를 제목/리스트/문단 구조의 마크다운으로 변환 (빈 페이지는 None)"""
+    blocks = structure_pdf_page_blocks(page_number, page_text)
+    return render_markdown_section('page', blocks) if blocks is not None else None
+
+def _process_pool(max_workers, initializer=None):
+    """워커 프로세스 풀 (GUI/작업 서버의 다른 스레드가 잡고 있던 잠금이 복사되지 않도록 fork 대신 spawn)"""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'), initializer=initializer)
+
+# 병렬 PDF 추출 설정
+PDF_PARALLEL_MIN_PAGES = 64   # 이보다 페이지가 적으면 한 프로세스에서 처리
+PDF_PARALLEL_MIN_SECONDS = 2  # 남은 페이지 추출 예상 시간이 이보다 짧으면 프로세스를 띄우지 않음
+PDF_PAGES_PER_SHARD = 16      # 워커 하나가 한 번에 맡는 페이지 수 (처음 한 묶음은 시간 측정용으로 직접 처리)
+PDF_EXTRACT_WORKERS = None    # 기본 워커 수 (None이면 CPU 수, 최대 PDF_MAX_DEFAULT_WORKERS)
+PDF_MAX_DEFAULT_WORKERS = 4
+
+def extract_pdf_page_range(pdf_path, start, stop):
+    """페이지 범위 [start, stop)를 독립적으로 열어 블록 목록으로 구조화 (워커 프로세스용, 빈 페이지는 None)"""
+    with span('pdf.extract_range', cat='document', start=start + 1, stop=stop), open(pdf_path, 'rb') as file:
+        with span('pdf.open', cat='document'):
+            pdf_reader = PyPDF2.PdfReader(file)
+        blocks = []
+        for i in range(start, stop):
+            with span('pdf.extract_page', cat='document', page=i + 1):
+                page_text = extract_pdf_page_text(pdf_reader.pages[i])
+            blocks.append(structure_pdf_page_blocks(i + 1, page_text))
+        return blocks
+
+def _iter_pdf_page_blocks_parallel(pdf_path, first_page, page_count, workers):
+    """페이지 범위 [first_page, page_count)를 워커 프로세스에 나눠 처리하고 순서대로 결과 반환"""
+    shards = deque((start, min(start + PDF_PAGES_PER_SHARD, page_count)) for start in range(first_page, page_count, PDF_PAGES_PER_SHARD))
+    next_page = first_page
+    try:
+        with _process_pool(workers) as executor:
+            # 처리 중인 범위 수를 제한해 결과가 한꺼번에 메모리에 쌓이지 않게 함
+            pending = deque()
+            while shards or pending:
+                while shards and len(pending) < workers * 2:
+                    start, stop = shards.popleft()
+                    pending.append((stop, executor.submit(extract_pdf_page_range, pdf_path, start, stop)))
+                stop, future = pending.popleft()
+                for blocks in future.result():
+                    if blocks is not None:
+                        yield blocks
+                next_page = stop
+    except GeneratorExit:
+        raise
+    except Exception:
+        # 워커 프로세스를 쓸 수 없으면 남은 페이지는 현재 프로세스에서 처리
+        for blocks in extract_pdf_page_range(pdf_path, next_page, page_count):
+            if blocks is not None:
+                yield blocks
+
+def iter_pdf_page_blocks(pdf_path, workers=None):
+    """PDF 페이지별 문서 모델 블록 목록을 한 페이지씩 생성 (빈 페이지 제외)
+
+    처음 PDF_PAGES_PER_SHARD 페이지는 직접 추출하며 시간을 재고, 페이지가 많고
+    남은 페이지 예상 시간이 PDF_PARALLEL_MIN_SECONDS 이상일 때만 나머지를
+    workers개(기본: CPU 수, 최대 PDF_MAX_DEFAULT_WORKERS) 프로세스에서 병렬로 추출한다.
+    """
+    workers = workers or PDF_EXTRACT_WORKERS or min(os.cpu_count() or 1, PDF_MAX_DEFAULT_WORKERS)
+    with open(pdf_path, 'rb') as file:
+        with span('pdf.open', cat='document'):
+            pdf_reader = PyPDF2.PdfReader(file)
+        page_count = len(pdf_reader.pages)
+        check_parallel = workers > 1 and page_count >= PDF_PARALLEL_MIN_PAGES
+        extract_seconds = 0.0
+        for i in range(page_count):
+            if check_parallel and i == PDF_PAGES_PER_SHARD:
+                # 텍스트만 있는 작은 PDF는 프로세스 시작 비용이 추출보다 큼
+                estimated = extract_seconds / i * (page_count - i)
+                if estimated >= PDF_PARALLEL_MIN_SECONDS:
+                    yield from _iter_pdf_page_blocks_parallel(pdf_path, i, page_count, workers)
+                    return
+            start = time.perf_counter()
+            with span('pdf.extract_page', cat='document', page=i + 1):
+                page_text = extract_pdf_page_text(pdf_reader.pages[i])
+            extract_seconds += time.perf_counter() - start
+            blocks = structure_pdf_page_blocks(i + 1, page_text)
+            if blocks is not None:
+                yield blocks
+
+def iter_structured_pdf_pages(pdf_path, workers=None):
+    """PDF 페이지별 구조화된 마크다운을 한 페이지씩 생성 (빈 페이지 제외)"""
+    for blocks in iter_pdf_page_blocks(pdf_path, workers):
+        yield render_markdown_section('page', blocks)
+
+def extract_structured_content_from_pdf(pdf_path, workers=None):
+    """PDF에서 구조화된 콘텐츠 추출 (페이지별 구조 보존)"""
+    try:
+        return '\n\n---\n\n'.join(iter_structured_pdf_pages(pdf_path, workers))
+    except Exception as e:
+        # 실패 시 기본 텍스트 추출로 폴백
+        return extract_text_from_pdf(pdf_path)
+
+# WordprocessingML 네임스페이스 (스트리밍 DOCX 추출용)
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+def _w(tag):
+    return f"{{{W_NS}}}{tag}"
+
+# python-docx가 UI 이름으로 바꿔 보여주는 내장 스타일 이름
+DOCX_STYLE_ALIASES = {'caption': 'Caption', 'footer': 'Footer', 'header': 'Header'}
+DOCX_STYLE_ALIASES.update({f"heading {i}": f"Heading {i}" for i in range(1, 10)})
+
+# 런 텍스트로 취급하는 요소 (python-docx Run.text와 동일)
+DOCX_RUN_TEXT_TAGS = {
+    _w('tab'): "\t",
+    _w('ptab'): "\t",
+    _w('cr'): "\n",
+    _w('noBreakHyphen'): "-",
+}
+
+def _docx_on_off(rpr, tag):
+    """w:b, w:i 같은 on/off 속성 값 (없으면 None)"""
+    if rpr is None:
+        return None
+    element = rpr.find(_w(tag))
+    if element is None:
+        return None
+    return element.get(_w('val'), 'true') not in ('0', 'false', 'off')
+
+def _docx_run_text(run):
+    parts = []
+    for child in run:
+        if child.tag == _w('t'):
+            parts.append(child.text or "")
+        elif child.tag == _w('br'):
+            if child.get(_w('type')) in (None, 'textWrapping'):
+                parts.append("\n")
+        elif child.tag in DOCX_RUN_TEXT_TAGS:
+            parts.append(DOCX_RUN_TEXT_TAGS[child.tag])
+    return "".join(parts)
+
+def _docx_paragraph_text(p):
+    parts = []
+    for child in p:
+        if child.tag == _w('r'):
+            parts.append(_docx_run_text(child))
+        elif child.tag == _w('hyperlink'):
+            parts.extend(_docx_run_text(run) for run in child.iterchildren(_w('r')))
+    return "".join(parts)
+
+def _docx_paragraph_runs(p):
+    """문단 바로 아래 런들의 (텍스트, 볼드, 이탤릭)"""
+    runs = []
+    for run in p.iterchildren(_w('r')):
+        rpr = run.find(_w('rPr'))
+        runs.append((_docx_run_text(run), _docx_on_off(rpr, 'b'), _docx_on_off(rpr, 'i')))
+    return runs
+
+def _docx_paragraph_style_id(p):
+    ppr = p.find(_w('pPr'))
+    if ppr is None:
+        return None
+    pstyle = ppr.find(_w('pStyle'))
+    return pstyle.get(_w('val')) if pstyle is not None else None
+
+def read_docx_style_names(zip_file):
+    """styles.xml에서 문단 스타일 ID → 이름 매핑과 기본 문단 스타일 이름 읽기"""
+    try:
+        root = etree.fromstring(zip_file.read('word/styles.xml'))
+    except KeyError:
+        return {}, "Normal"
+    
+    names = {}
+    default_name = "Normal"
+    for style in root.iterchildren(_w('style')):
+        if style.get(_w('type')) != 'paragraph':
+            continue
+        style_id = style.get(_w('styleId'))
+        name_element = style.find(_w('name'))
+        name = name_element.get(_w('val')) if name_element is not None else style_id
+        name = DOCX_STYLE_ALIASES.get(name, name)
+        names[style_id] = name
+        if style.get(_w('default')) in ('1', 'true', 'on'):
+            default_name = name
+    return names, default_name
+
+def _docx_table_rows(tbl):
+    """표의 셀 텍스트 행 목록 (병합 셀은 python-docx처럼 반복)"""
+    grid = tbl.find(_w('tblGrid'))
+    col_count = len(grid.findall(_w('gridCol'))) if grid is not None else 0
+    row_elements = tbl.findall(_w('tr'))
+    
+    cells = []
+    for tr in row_elements:
+        for tc in tr.iterchildren(_w('tc')):
+            tcpr = tc.find(_w('tcPr'))
+            grid_span = 1
+            v_merge = None
+            if tcpr is not None:
+                span = tcpr.find(_w('gridSpan'))
+                if span is not None:
+                    grid_span = int(span.get(_w('val'), 1))
+                merge = tcpr.find(_w('vMerge'))
+                if merge is not None:
+                    v_merge = merge.get(_w('val'), 'continue')
+            for span_index in range(grid_span):
+                if v_merge == 'continue' and col_count and len(cells) >= col_count:
+                    cells.append(cells[-col_count])
+                elif span_index > 0:
+                    cells.append(cells[-1])
+                else:
+                    cells.append("\n".join(_docx_paragraph_text(p) for p in tc.iterchildren(_w('p'))))
+    
+    if not col_count:
+        return [cells] if cells else []
+    return [cells[i * col_count:(i + 1) * col_count] for i in range(len(row_elements))]
+
+def markdown_table_from_rows(rows):
+    """셀 텍스트 행 목록을 마크다운 표로 변환 (첫 행은 헤더)"""
+    if not rows:
+        return ""
+    
+    markdown_table = []
+    
+    # 헤더 행
+    header_row = [text.strip() or " " for text in rows[0]]
+    markdown_table.append("| " + " | ".join(header_row) + " |")
+    
+    # 구분선
+    separator = "| " + " | ".join(["---"] * len(header_row)) + " |"
+    markdown_table.append(separator)
+    
+    # 데이터 행들
+    for row in rows[1:]:
+        data_row = [text.strip() or " " for text in row]
+        markdown_table.append("| " + " | ".join(data_row) + " |")
+    
+    return "\n".join(markdown_table)
+
+# 문서 모델: 추출기가 한 번 만들고 여러 출력 형식이 함께 쓰는 블록 목록
+#   ('heading', 레벨, 텍스트)
+#   ('paragraph', 텍스트, runs 또는 None)   runs: (텍스트, 볼드, 이탤릭) 목록
+#   ('list_item', 텍스트)
+#   ('table', 행 목록)
+# 블록은 섹션(DOCX 본문 요소 / 슬라이드 / 페이지) 단위로 스트리밍된다.
+
+# 섹션 종류 → 마크다운에서 섹션 사이 구분자
+MARKDOWN_SECTION_SEPARATORS = {
+    'body': "\n\n",
+    'slide': "\n\n---\n\n",
+    'page': "\n\n---\n\n",
+}
+
+def render_markdown_block(block):
+    """문서 모델 블록 하나를 마크다운으로 변환"""
+    kind = block[0]
+    if kind == 'heading':
+        return f"{'#' * block[1]} {block[2]}"
+    if kind == 'list_item':
+        return f"- {block[1]}"
+    if kind == 'table':
+        return markdown_table_from_rows(block[1])
+
+    text, runs = block[1], block[2]
+    if not runs:
+        return text
+    # 볼드, 이탤릭 처리
+    formatted_text = ""
+    for run_text, bold, italic in runs:
+        if bold and italic:
+            formatted_text += f"***{run_text}***"
+        elif bold:
+            formatted_text += f"**{run_text}**"
+        elif italic:
+            formatted_text += f"*{run_text}*"
+        else:
+            formatted_text += run_text
+    return formatted_text if formatted_text.strip() else text
+
+def render_markdown_section(section_kind, blocks):
+    """섹션 하나(블록 목록)를 마크다운으로 변환"""
+    if section_kind == 'slide':
+        # 슬라이드 안에서는 줄 단위로 잇고 표만 빈 줄로 감쌈
+        return "\n".join(
+            "\n" + render_markdown_block(block) + "\n" if block[0] == 'table' else render_markdown_block(block)
+            for block in blocks
+        )
+    return "\n\n".join(render_markdown_block(block) for block in blocks)
+
+def _docx_paragraph_block(style_name, text, runs):
+    """문단 하나를 문서 모델 블록으로 변환 (runs: (텍스트, 볼드, 이탤릭) 목록)"""
+    if "Heading" in style_name:
+        level = 1
+        if "1" in style_name:
+            level = 1
+        elif "2" in style_name:
+            level = 2
+        elif "3" in style_name:
+            level = 3
+        elif "4" in style_name:
+            level = 4
+        elif "5" in style_name:
+            level = 5
+        elif "6" in style_name:
+            level = 6
+        return ('heading', level, text)
+    elif "List" in style_name or text.startswith(('-', '*', '+')):
+        return ('list_item', text)
+    else:
+        return ('paragraph', text, runs)
+
+def _iter_docx_body_elements(docx_path):
+    """word/document.xml을 스트리밍으로 읽으며 본문 바로 아래 문단/표 요소를 하나씩 반환"""
+    body_tag = _w('body')
+    with zipfile.ZipFile(docx_path) as zip_file:
+        style_names, default_style = read_docx_style_names(zip_file)
+        with zip_file.open('word/document.xml') as document_xml:
+            for _, element in etree.iterparse(document_xml, events=('end',), tag=(_w('p'), _w('tbl'))):
+                parent = element.getparent()
+                if parent is None or parent.tag != body_tag:
+                    continue
+                yield element, style_names, default_style
+                # 처리한 요소는 메모리에서 해제
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+def iter_docx_blocks(docx_path):
+    """DOCX 본문을 스트리밍으로 읽어 문서 모델 블록을 하나씩 생성 (python-docx 미사용)"""
+    for element, style_names, default_style in _iter_docx_body_elements(docx_path):
+        if element.tag == _w('p'):
+            text = _docx_paragraph_text(element).strip()
+            if text:
+                style_id = _docx_paragraph_style_id(element)
+                style_name = style_names.get(style_id, default_style) if style_id else default_style
+                yield _docx_paragraph_block(style_name, text, _docx_paragraph_runs(element))
+        else:
+            yield ('table', _docx_table_rows(element))
+
+def iter_docx_markdown_blocks(docx_path):
+    """DOCX 본문을 스트리밍으로 읽어 마크다운 블록을 하나씩 생성"""
+    for block in iter_docx_blocks(docx_path):
+        yield render_markdown_block(block)
+
+def extract_text_from_docx(docx_path):
+    """DOCX에서 텍스트 추출"""
+    try:
+        return "".join(
+            _docx_paragraph_text(element) + "\n"
+            for element, _, _ in _iter_docx_body_elements(docx_path)
+            if element.tag == _w('p')
+        )
+    except Exception:
+        pass
+    
+    # 스트리밍 추출 실패 시 python-docx로 폴백
+    try:
+        doc = docx.Document(docx_path)
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
+    except Exception as e:
+        raise Exception(f"DOCX 텍스트 추출 실패: {str(e)}")
+
+def extract_structured_content_from_docx(docx_path):
+    """DOCX에서 구조화된 콘텐츠 추출 (표, 리스트, 서식 포함)"""
+    try:
+        return "\n\n".join(iter_docx_markdown_blocks(docx_path))
+    except Exception:
+        return _extract_structured_content_from_docx_object_model(docx_path)
+
+def _extract_structured_content_from_docx_object_model(docx_path):
+    """python-docx 객체 모델을 이용한 구조화 추출 (스트리밍 추출의 폴백)"""
+    try:
+        doc = docx.Document(docx_path)
+        content = []
+        
+        # 본문 요소 → 문단/표 객체 매핑을 한 번만 만들어 요소마다 선형 탐색하지 않음
+        paragraphs_by_element = {p._element: p for p in doc.paragraphs}
+        tables_by_element = {t._element: t for t in doc.tables}
+        style_names = {}  # 스타일 ID → 스타일 이름 캐시
+        
+        for element in doc.element.body:
+            if element.tag.endswith('p'):  # 문단
+                para = paragraphs_by_element.get(element)
+                if para:
+                    # 문단 스타일 확인
+                    style_id = element.style
+                    if style_id not in style_names:
+                        style_names[style_id] = para.style.name if para.style else "Normal"
+                    text = para.text.strip()
+                    
+                    if text:
+                        runs = [(run.text, run.bold, run.italic) for run in para.runs]
+                        content.append(render_markdown_block(_docx_paragraph_block(style_names[style_id], text, runs)))
+            
+            elif element.tag.endswith('tbl'):  # 표
+                table = tables_by_element.get(element)
+                if table:
+                    content.append(convert_table_to_markdown(table))
+        
+        return "\n\n".join(content)
+    except Exception as e:
+        # 실패 시 기본 텍스트 추출로 폴백
+        return extract_text_from_docx(docx_path)
+
+def convert_table_to_markdown(table):
+    """Word 표를 마크다운 표 형식으로 변환"""
+    return markdown_table_from_rows([[cell.text for cell in row.cells] for row in table.rows])
+
+# PresentationML / DrawingML 네임스페이스 (스트리밍 PPTX 추출용)
+P_NS = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+def _p(tag):
+    return f"{{{P_NS}}}{tag}"
+
+def _a(tag):
+    return f"{{{A_NS}}}{tag}"
+
+def _pptx_paragraph_text(paragraph):
+    parts = []
+    for child in paragraph:
+        if child.tag in (_a('r'), _a('fld')):
+            t = child.find(_a('t'))
+            parts.append(t.text or "" if t is not None else "")
+        elif child.tag == _a('br'):
+            parts.append("\v")
+    return "".join(parts)
+
+def _pptx_text_body_text(element):
+    """txBody가 있는 요소의 텍스트 (python-pptx TextFrame.text와 동일)"""
+    tx_body = element.find(_p('txBody'))
+    if tx_body is None:
+        tx_body = element.find(_a('txBody'))
+    if tx_body is None:
+        return ""
+    return "\n".join(_pptx_paragraph_text(p) for p in tx_body.iterchildren(_a('p')))
+
+def _pptx_table_rows(tbl):
+    return [
+        [_pptx_text_body_text(tc) for tc in tr.iterchildren(_a('tc'))]
+        for tr in tbl.iterchildren(_a('tr'))
+    ]
+
+def _iter_pptx_slide_parts(zip_file):
+    """presentation.xml의 슬라이드 순서대로 슬라이드 파트 경로 반환"""
+    rels = etree.fromstring(zip_file.read('ppt/_rels/presentation.xml.rels'))
+    targets = {}
+    for rel in rels.iterchildren(f"{{{PKG_REL_NS}}}Relationship"):
+        target = rel.get('Target')
+        if target.startswith('/'):
+            targets[rel.get('Id')] = target.lstrip('/')
+        else:
+            targets[rel.get('Id')] = posixpath.normpath(posixpath.join('ppt', target))
+    
+    presentation = etree.fromstring(zip_file.read('ppt/presentation.xml'))
+    slide_id_list = presentation.find(_p('sldIdLst'))
+    if slide_id_list is None:
+        return
+    for slide_id in slide_id_list.iterchildren(_p('sldId')):
+        yield targets[slide_id.get(f"{{{R_NS}}}id")]
+
+def _iter_pptx_slide_shapes(pptx_path):
+    """슬라이드를 하나씩 읽어 (슬라이드 번호, [(표 행 목록 또는 None, 텍스트 또는 None)]) 반환
+
+    python-pptx와 같게 텍스트는 자동 도형(sp)만, 표는 graphicFrame의 a:tbl만 다룬다.
+    """
+    with zipfile.ZipFile(pptx_path) as zip_file:
+        for i, part_name in enumerate(_iter_pptx_slide_parts(zip_file), 1):
+            slide = etree.fromstring(zip_file.read(part_name))
+            sp_tree = slide.find(f"{_p('cSld')}/{_p('spTree')}")
+            shapes = []
+            if sp_tree is not None:
+                for shape in sp_tree:
+                    if shape.tag == _p('sp'):
+                        shapes.append((None, _pptx_text_body_text(shape)))
+                    elif shape.tag == _p('graphicFrame'):
+                        tbl = shape.find(f"{_a('graphic')}/{_a('graphicData')}/{_a('tbl')}")
+                        if tbl is not None:
+                            shapes.append((_pptx_table_rows(tbl), None))
+            yield i, shapes
+
+def _pptx_slide_blocks(i, shapes):
+    """슬라이드 하나를 문서 모델 블록 목록으로 변환 (내용이 없으면 None)
+
+    shapes: (표 행 목록 또는 None, 텍스트 또는 None) 목록. 처리한 도형 수만
+    세어 두어 도형마다 앞선 도형을 다시 훑지 않는다.
+    """
+    slide_content = [('heading', 2, f"슬라이드 {i}")]
+    processed_count = 0       # 처리한 도형 수 (표 포함)
+    processed_text_count = 0  # 처리한 텍스트 도형 수
+    
+    for table_rows, shape_text in shapes:
+        # 표 처리
+        if table_rows is not None:
+            if table_rows:
+                slide_content.append(('table', table_rows))
+            processed_count += 1
+        
+        # 텍스트 처리
+        elif shape_text is not None and shape_text.strip():
+            text = shape_text.strip()
+            
+            # 제목 슬라이드의 경우 첫 번째 텍스트는 제목, 두 번째는 부제목
+            if i == 1 and processed_count == 0:
+                slide_content.append(('heading', 3, text))
+            elif i == 1 and processed_count == 1:
+                slide_content.append(('paragraph', text, [(text, False, True)]))
+            else:
+                # 일반 슬라이드의 첫 번째 텍스트는 제목
+                if processed_text_count == 0:
+                    slide_content.append(('heading', 3, text))
+                else:
+                    # 나머지 텍스트 처리
+                    text_lines = text.split('\n')
+                    for line in text_lines:
+                        line = line.strip()
+                        if line:
+                            if line.startswith(('•', '-', '*')) or re.match(r'^\d+\.', line):
+                                slide_content.append(('list_item', line.lstrip('•-* ').lstrip('0123456789. ')))
+                            else:
+                                slide_content.append(('paragraph', line, None))
+            
+            processed_count += 1
+            processed_text_count += 1
+    
+    if len(slide_content) > 1:  # 제목 외에 내용이 있는 경우만 추가
+        return slide_content
+    return None
+
+def _pptx_slide_markdown(i, shapes):
+    """슬라이드 하나를 마크다운으로 변환 (내용이 없으면 None)"""
+    blocks = _pptx_slide_blocks(i, shapes)
+    return render_markdown_section('slide', blocks) if blocks is not None else None
+
+def iter_pptx_slide_blocks(pptx_path):
+    """PPTX 슬라이드 XML을 하나씩 읽어 슬라이드별 문서 모델 블록 목록 생성 (python-pptx 미사용)"""
+    for i, shapes in _iter_pptx_slide_shapes(pptx_path):
+        blocks = _pptx_slide_blocks(i, shapes)
+        if blocks is not None:
+            yield blocks
+
+def iter_pptx_markdown_slides(pptx_path):
+    """PPTX 슬라이드별 마크다운 생성"""
+    for blocks in iter_pptx_slide_blocks(pptx_path):
+        yield render_markdown_section('slide', blocks)
+
+def extract_text_from_pptx(pptx_path):
+    """PPTX에서 텍스트 추출"""
+    try:
+        return "".join(
+            shape_text + "\n"
+            for _, shapes in _iter_pptx_slide_shapes(pptx_path)
+            for _, shape_text in shapes
+            if shape_text is not None
+        )
+    except Exception:
+        pass
+    
+    # 스트리밍 추출 실패 시 python-pptx로 폴백
+    try:
+        prs = pptx.Presentation(pptx_path)
+        text = []
+        for slide in prs.slides:
+            for shape in slide.shapes:
+                if hasattr(shape, "text"):
+                    text.append(shape.text + "\n")
+        return "".join(text)
+    except Exception as e:
+        raise Exception(f"PPTX 텍스트 추출 실패: {str(e)}")
+
+def extract_structured_content_from_pptx(pptx_path):
+    """PPTX에서 구조화된 콘텐츠 추출 (슬라이드별 구조 보존)"""
+    try:
+        return "\n\n---\n\n".join(iter_pptx_markdown_slides(pptx_path))
+    except Exception:
+        return _extract_structured_content_from_pptx_object_model(pptx_path)
+
+def _extract_structured_content_from_pptx_object_model(pptx_path):
+    """python-pptx 객체 모델을 이용한 구조화 추출 (스트리밍 추출의 폴백)"""
+    try:
+        prs = pptx.Presentation(pptx_path)
+        content = []
+        
+        for i, slide in enumerate(prs.slides, 1):
+            shapes = []
+            for shape in slide.shapes:
+                if shape.has_table:
+                    shapes.append(([[cell.text for cell in row.cells] for row in shape.table.rows], None))
+                elif hasattr(shape, "text"):
+                    shapes.append((None, shape.text))
+            slide_md = _pptx_slide_markdown(i, shapes)
+            if slide_md is not None:
+                content.append(slide_md)
+        
+        return "\n\n---\n\n".join(content)
+    except Exception as e:
+        # 실패 시 기본 텍스트 추출로 폴백
+        return extract_text_from_pptx(pptx_path)
+
+def convert_pptx_table_to_markdown(table):
+    """PowerPoint 표를 마크다운 표 형식으로 변환"""
+    return markdown_table_from_rows([[cell.text for cell in row.cells] for row in table.rows])
+
+def convert_pdf_to_docx(pdf_path, output_path, log_callback):
+    """PDF를 DOCX로 변환"""
+    try:
+        log_callback(f"PDF → DOCX 변환 시작: {pdf_path}")
+        
+        # 페이지마다 문단으로 추가해 전체 텍스트를 한 번에 만들지 않음
+        doc = docx.Document()
+        try:
+            for page_text in iter_pdf_page_texts(pdf_path):
+                doc.add_paragraph(page_text)
+        except Exception as e:
+            raise Exception(f"PDF 텍스트 추출 실패: {str(e)}")
+        doc.save(output_path)
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"PDF → DOCX 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_pdf_to_md(pdf_path, output_path, log_callback):
+    """PDF를 MD로 변환 (구조화된 형식 유지)"""
+    try:
+        log_callback(f"PDF → MD 변환 시작: {pdf_path}")
+        title = f"# {os.path.splitext(os.path.basename(pdf_path))[0]}\n\n"
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(title)
+            try:
+                # 페이지가 추출되는 대로 바로 기록
+                for i, page_md in enumerate(traced_iter('extract', iter_structured_pdf_pages(pdf_path), cat='document')):
+                    if i:
+                        f.write("\n\n---\n\n")
+                    f.write(page_md)
+            except Exception:
+                f.seek(0)
+                f.truncate()
+                f.write(title)
+                f.write(extract_text_from_pdf(pdf_path))
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"PDF → MD 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_pdf_to_pptx(pdf_path, output_path, log_callback):
+    """PDF를 PPTX로 변환"""
+    try:
+        log_callback(f"PDF → PPTX 변환 시작: {pdf_path}")
+        
+        # 슬라이드에는 앞부분 1000자만 들어가므로 필요한 페이지까지만 추출
+        pages = []
+        extracted_length = 0
+        try:
+            for page_text in iter_pdf_page_texts(pdf_path):
+                pages.append(page_text + "\n")
+                extracted_length += len(page_text) + 1
+                if extracted_length > 1000:
+                    break
+        except Exception as e:
+            raise Exception(f"PDF 텍스트 추출 실패: {str(e)}")
+        text = "".join(pages)
+        
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        title = slide.shapes.title
+        content = slide.placeholders[1]
+        
+        title.text = os.path.splitext(os.path.basename(pdf_path))[0]
+        content.text = text[:1000] + "..." if len(text) > 1000 else text
+        
+        prs.save(output_path)
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"PDF → PPTX 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_docx_to_pdf(docx_path, output_path, log_callback):
+    """DOCX를 PDF로 변환 (pandoc 사용)"""
+    try:
+        log_callback(f"DOCX → PDF 변환 시작: {docx_path}")
+        pandoc_convert_file(docx_path, 'pdf', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"DOCX → PDF 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_docx_to_md(docx_path, output_path, log_callback):
+    """DOCX를 MD로 변환 (표, 리스트, 서식 유지)"""
+    try:
+        log_callback(f"DOCX → MD 변환 시작: {docx_path}")
+        title = f"# {os.path.splitext(os.path.basename(docx_path))[0]}\n\n"
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(title)
+            try:
+                # 블록이 나오는 대로 바로 기록해 메모리 사용량을 일정하게 유지
+                for i, block in enumerate(traced_iter('extract', iter_docx_markdown_blocks(docx_path), cat='document')):
+                    if i:
+                        f.write("\n\n")
+                    f.write(block)
+            except Exception:
+                f.seek(0)
+                f.truncate()
+                f.write(title)
+                f.write(_extract_structured_content_from_docx_object_model(docx_path))
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"DOCX → MD 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_docx_to_pptx(docx_path, output_path, log_callback):
+    """DOCX를 PPTX로 변환"""
+    try:
+        log_callback(f"DOCX → PPTX 변환 시작: {docx_path}")
+        text = extract_text_from_docx(docx_path)
+        
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        title = slide.shapes.title
+        content = slide.placeholders[1]
+        
+        title.text = os.path.splitext(os.path.basename(docx_path))[0]
+        content.text = text[:1000] + "..." if len(text) > 1000 else text
+        
+        prs.save(output_path)
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"DOCX → PPTX 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_pptx_to_pdf(pptx_path, output_path, log_callback):
+    """PPTX를 PDF로 변환"""
+    try:
+        log_callback(f"PPTX → PDF 변환 시작: {pptx_path}")
+        text = extract_text_from_pptx(pptx_path)
+        
+        # 추출한 텍스트를 임시 파일에 쓰지 않고 pandoc에 바로 전달
+        pandoc_convert_text(text, 'md', 'pdf', output_path)
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"PPTX → PDF 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_pptx_to_docx(pptx_path, output_path, log_callback):
+    """PPTX를 DOCX로 변환"""
+    try:
+        log_callback(f"PPTX → DOCX 변환 시작: {pptx_path}")
+        text = extract_text_from_pptx(pptx_path)
+        
+        doc = docx.Document()
+        doc.add_paragraph(text)
+        doc.save(output_path)
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"PPTX → DOCX 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_pptx_to_md(pptx_path, output_path, log_callback):
+    """PPTX를 MD로 변환 (슬라이드 구조, 표 유지)"""
+    try:
+        log_callback(f"PPTX → MD 변환 시작: {pptx_path}")
+        title = f"# {os.path.splitext(os.path.basename(pptx_path))[0]}\n\n"
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(title)
+            try:
+                # 슬라이드가 나오는 대로 바로 기록
+                for i, slide_md in enumerate(traced_iter('extract', iter_pptx_markdown_slides(pptx_path), cat='document')):
+                    if i:
+                        f.write("\n\n---\n\n")
+                    f.write(slide_md)
+            except Exception:
+                f.seek(0)
+                f.truncate()
+                f.write(title)
+                f.write(_extract_structured_content_from_pptx_object_model(pptx_path))
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"PPTX → MD 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_md_to_pdf(md_path, output_path, log_callback):
+    """MD를 PDF로 변환"""
+    try:
+        log_callback(f"MD → PDF 변환 시작: {md_path}")
+        pandoc_convert_file(md_path, 'pdf', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"MD → PDF 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_md_to_docx(md_path, output_path, log_callback):
+    """MD를 DOCX로 변환"""
+    try:
+        log_callback(f"MD → DOCX 변환 시작: {md_path}")
+        pandoc_convert_file(md_path, 'docx', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"MD → DOCX 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_md_to_pptx(md_path, output_path, log_callback):
+    """MD를 PPTX로 변환"""
+    try:
+        log_callback(f"MD → PPTX 변환 시작: {md_path}")
+        
+        with open(md_path, 'r', encoding='utf-8') as f:
+            md_content = f.read()
+        
+        html = markdown.markdown(md_content)
+        
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        title = slide.shapes.title
+        content = slide.placeholders[1]
+        
+        title.text = os.path.splitext(os.path.basename(md_path))[0]
+        content.text = md_content[:1000] + "..." if len(md_content) > 1000 else md_content
+        
+        prs.save(output_path)
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"MD → PPTX 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_html_to_pdf(html_path, output_path, log_callback):
+    """HTML을 PDF로 변환"""
+    try:
+        log_callback(f"HTML → PDF 변환 시작: {html_path}")
+        pandoc_convert_file(html_path, 'pdf', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"HTML → PDF 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_html_to_docx(html_path, output_path, log_callback):
+    """HTML을 DOCX로 변환"""
+    try:
+        log_callback(f"HTML → DOCX 변환 시작: {html_path}")
+        pandoc_convert_file(html_path, 'docx', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"HTML → DOCX 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_html_to_md(html_path, output_path, log_callback):
+    """HTML을 Markdown으로 변환"""
+    try:
+        log_callback(f"HTML → MD 변환 시작: {html_path}")
+        pandoc_convert_file(html_path, 'md', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"HTML → MD 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_pdf_to_html(pdf_path, output_path, log_callback):
+    """PDF를 HTML로 변환"""
+    try:
+        log_callback(f"PDF → HTML 변환 시작: {pdf_path}")
+        
+        # 페이지별로 HTML 조각을 만들어 바로 기록 (메모리는 한 페이지 분량만 사용)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for page_text in iter_pdf_page_texts(pdf_path):
+                f.write(markdown.markdown(page_text))
+                f.write("\n")
+        
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"PDF → HTML 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_docx_to_html(docx_path, output_path, log_callback):
+    """DOCX를 HTML로 변환"""
+    try:
+        log_callback(f"DOCX → HTML 변환 시작: {docx_path}")
+        pandoc_convert_file(docx_path, 'html', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"DOCX → HTML 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def convert_md_to_html(md_path, output_path, log_callback):
+    """Markdown을 HTML로 변환"""
+    try:
+        log_callback(f"MD → HTML 변환 시작: {md_path}")
+        pandoc_convert_file(md_path, 'html', output_path)
+        log_callback(f"변환 완료: {output_path}")
+        return True, output_path
+    except Exception as e:
+        error_msg = f"MD → HTML 변환 실패: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+# (입력 확장자, 출력 형식) → 변환 함수
+DOCUMENT_CONVERSIONS = {
+    ('.pdf', 'docx'): convert_pdf_to_docx,
+    ('.pdf', 'md'): convert_pdf_to_md,
+    ('.pdf', 'pptx'): convert_pdf_to_pptx,
+    ('.pdf', 'html'): convert_pdf_to_html,
+    ('.docx', 'pdf'): convert_docx_to_pdf,
+    ('.docx', 'md'): convert_docx_to_md,
+    ('.docx', 'pptx'): convert_docx_to_pptx,
+    ('.docx', 'html'): convert_docx_to_html,
+    ('.pptx', 'pdf'): convert_pptx_to_pdf,
+    ('.pptx', 'docx'): convert_pptx_to_docx,
+    ('.pptx', 'md'): convert_pptx_to_md,
+    ('.md', 'pdf'): convert_md_to_pdf,
+    ('.md', 'docx'): convert_md_to_docx,
+    ('.md', 'pptx'): convert_md_to_pptx,
+    ('.md', 'html'): convert_md_to_html,
+    ('.html', 'pdf'): convert_html_to_pdf,
+    ('.html', 'docx'): convert_html_to_docx,
+    ('.html', 'md'): convert_html_to_md,
+}
+
+def get_document_output_path(input_file, output_format):
+    """문서 변환 결과 파일 경로 (입력 파일과 같은 위치)"""
+    return f"{os.path.splitext(input_file)[0]}.{output_format.lower()}"
+
+@timed_operation('document')
+def convert_document(input_file, output_format, log_callback):
+    """문서 변환 메인 함수"""
+    input_ext = os.path.splitext(input_file)[1].lower()
+    output_file = get_document_output_path(input_file, output_format)
+    
+    conversion_key = (input_ext, output_format.lower())
+    
+    if conversion_key not in DOCUMENT_CONVERSIONS:
+        error_msg = f"지원하지 않는 변환: {input_ext} → {output_format}"
+        log_callback(error_msg)
+        return False, error_msg
+    
+    if input_ext == f".{output_format.lower()}":
+        error_msg = "입력 파일과 출력 형식이 동일합니다"
+        log_callback(error_msg)
+        return False, error_msg
+    
+    return DOCUMENT_CONVERSIONS[conversion_key](input_file, output_file, log_callback)
+
+def read_document_model(input_file, workers=None):
+    """문서를 파싱해 (제목, 섹션 종류, 섹션별 블록 목록 생성기) 반환 (DOCX/PPTX/PDF)"""
+    title = os.path.splitext(os.path.basename(input_file))[0]
+    input_ext = os.path.splitext(input_file)[1].lower()
+    if input_ext == '.docx':
+        # DOCX 본문은 요소 하나를 섹션 하나로 스트리밍
+        return title, 'body', ([block] for block in iter_docx_blocks(input_file))
+    if input_ext == '.pptx':
+        return title, 'slide', iter_pptx_slide_blocks(input_file)
+    if input_ext == '.pdf':
+        return title, 'page', iter_pdf_page_blocks(input_file, workers)
+    raise ValueError(f"문서 모델을 지원하지 않는 형식: {input_ext}")
+
+class MarkdownDocumentWriter:
+    """Write document model sections as Markdown (same layout as the *_to_md converters)"""
+
+    def __init__(self, output_path, title, section_kind):
+        self.file = open(output_path, 'w', encoding='utf-8')
+        self.section_kind = section_kind
+        self.first_section = True
+        self.file.write(f"# {title}\n\n")
+
+    def write_section(self, blocks):
+        if not self.first_section:
+            self.file.write(MARKDOWN_SECTION_SEPARATORS[self.section_kind])
+        self.first_section = False
+        self.file.write(render_markdown_section(self.section_kind, blocks))
+
+    def close(self):
+        self.file.close()
+
+class HtmlDocumentWriter:
+    """
+    Write document model sections as an HTML fragment (slides/pages separated by <hr />).
+
+    DOCX body sections hold one block each, so an open <ul> is kept across
+    sections and closed by the next non-list block, separator or close().
+    """
+
+    def __init__(self, output_path, title, section_kind):
+        self.file = open(output_path, 'w', encoding='utf-8')
+        self.section_kind = section_kind
+        self.first_section = True
+        self.in_list = False
+        self.file.write(f"<h1>{html.escape(title)}</h1>\n")
+
+    @staticmethod
+    def _text(text):
+        return html.escape(text).replace("\n", "<br />\n")
+
+    def _close_list(self):
+        if self.in_list:
+            self.file.write("</ul>\n")
+            self.in_list = False
+
+    def write_section(self, blocks):
+        if not self.first_section and self.section_kind != 'body':
+            self._close_list()
+            self.file.write("<hr />\n")
+        self.first_section = False
+        for block in blocks:
+            kind = block[0]
+            if kind != 'list_item':
+                self._close_list()
+            if kind == 'heading':
+                level = min(block[1], 6)
+                self.file.write(f"<h{level}>{self._text(block[2])}</h{level}>\n")
+            elif kind == 'list_item':
+                if not self.in_list:
+                    self.file.write("<ul>\n")
+                    self.in_list = True
+                self.file.write(f"<li>{self._text(block[1])}</li>\n")
+            elif kind == 'table':
+                self._write_table(block[1])
+            else:
+                self._write_paragraph(block[1], block[2])
+
+    def _write_paragraph(self, text, runs):
+        parts = []
+        for run_text, bold, italic in runs or ():
+            run_html = self._text(run_text)
+            if italic:
+                run_html = f"<em>{run_html}</em>"
+            if bold:
+                run_html = f"<strong>{run_html}</strong>"
+            parts.append(run_html)
+        content = "".join(parts)
+        if not (runs and "".join(run_text for run_text, _, _ in runs).strip()):
+            content = self._text(text)
+        self.file.write(f"<p>{content}</p>\n")
+
+    def _write_table(self, rows):
+        if not rows:
+            return
+        self.file.write("<table>\n<thead>\n<tr>")
+        self.file.write("".join(f"<th>{self._text(text.strip())}</th>" for text in rows[0]))
+        self.file.write("</tr>\n</thead>\n<tbody>\n")
+        for row in rows[1:]:
+            self.file.write("<tr>" + "".join(f"<td>{self._text(text.strip())}</td>" for text in row) + "</tr>\n")
+        self.file.write("</tbody>\n</table>\n")
+
+    def close(self):
+        self._close_list()
+        self.file.close()
+
+class DocxDocumentWriter:
+    """Build a DOCX from document model sections (each slide/page starts on a new page)"""
+
+    def __init__(self, output_path, title, section_kind):
+        self.output_path = output_path
+        self.section_kind = section_kind
+        self.first_section = True
+        self.doc = docx.Document()
+        self.doc.add_heading(title, 0)
+
+    def write_section(self, blocks):
+        if not self.first_section and self.section_kind != 'body':
+            self.doc.add_page_break()
+        self.first_section = False
+        for block in blocks:
+            kind = block[0]
+            if kind == 'heading':
+                self.doc.add_heading(block[2], min(block[1], 9))
+            elif kind == 'list_item':
+                self.doc.add_paragraph(block[1], style='List Bullet')
+            elif kind == 'table':
+                rows = block[1]
+                if rows:
+                    table = self.doc.add_table(rows=len(rows), cols=max(len(row) for row in rows), style='Table Grid')
+                    for row, cells in zip(rows, table.rows):
+                        for text, cell in zip(row, cells.cells):
+                            cell.text = text.strip()
+            else:
+                text, runs = block[1], block[2]
+                if runs and "".join(run_text for run_text, _, _ in runs).strip():
+                    paragraph = self.doc.add_paragraph()
+                    for run_text, bold, italic in runs:
+                        run = paragraph.add_run(run_text)
+                        run.bold = bold
+                        run.italic = italic
+                else:
+                    self.doc.add_paragraph(text)
+
+    def close(self):
+        self.doc.save(self.output_path)
+
+# 출력 형식 → 문서 모델 writer
+DOCUMENT_MODEL_WRITERS = {
+    'md': MarkdownDocumentWriter,
+    'html': HtmlDocumentWriter,
+    'docx': DocxDocumentWriter,
+}
+
+# 문서 모델로 읽을 수 있는 입력 형식
+DOCUMENT_MODEL_INPUT_EXTS = ('.docx', '.pptx', '.pdf')
+
+def is_multi_format_supported(input_ext, output_format):
+    """convert_document_multi가 input_ext → output_format 변환을 할 수 있는지"""
+    output_format = output_format.lower()
+    if (input_ext, output_format) in DOCUMENT_CONVERSIONS:
+        return True
+    return output_format in DOCUMENT_MODEL_WRITERS and input_ext in DOCUMENT_MODEL_INPUT_EXTS and f".{output_format}" != input_ext
+
+@timed_operation('document_multi')
+def convert_document_multi(input_file, output_formats, log_callback):
+    """
+    Convert one document to several formats from a single parse.
+
+    DOCX/PPTX/PDF inputs are read once into the document model and every
+    md/html/docx target is written section by section as the model streams
+    past. Other targets (and a parse that fails midway) go through
+    convert_document, one parse per format. Returns (all succeeded,
+    {output format: output path or error message}).
+    """
+    input_ext = os.path.splitext(input_file)[1].lower()
+    output_formats = [fmt.lower() for fmt in output_formats]
+    results = {}
+
+    model_formats = [
+        fmt for fmt in output_formats
+        if fmt in DOCUMENT_MODEL_WRITERS and input_ext in DOCUMENT_MODEL_INPUT_EXTS and f".{fmt}" != input_ext
+    ]
+    if model_formats:
+        log_callback(f"문서 모델 변환 시작: {input_file} → {', '.join(model_formats)}")
+        writers = {}
+        try:
+            title, section_kind, sections = read_document_model(input_file)
+            for fmt in model_formats:
+                writers[fmt] = DOCUMENT_MODEL_WRITERS[fmt](get_document_output_path(input_file, fmt), title, section_kind)
+            for blocks in traced_iter('extract', sections, cat='document'):
+                for fmt, writer in writers.items():
+                    with span('write', cat='document', format=fmt):
+                        writer.write_section(blocks)
+            for fmt, writer in writers.items():
+                writer.close()
+                results[fmt] = get_document_output_path(input_file, fmt)
+                log_callback(f"변환 완료: {results[fmt]}")
+        except Exception as e:
+            log_callback(f"문서 모델 변환 실패, 형식별 변환으로 전환: {str(e)}")
+            for writer in writers.values():
+                with contextlib.suppress(Exception):
+                    writer.close()
+            results = {}
+
+    success = True
+    for fmt in output_formats:
+        if fmt in results:
+            continue
+        fmt_success, result = convert_document(input_file, fmt, log_callback)
+        results[fmt] = result
+        success = success and fmt_success
+    return success, results
+
+def find_documents(folder, output_format):
+    """폴더(하위 폴더 포함)에서 output_format으로 변환할 수 있는 문서 목록"""
+    output_format = output_format.lower()
+    documents = []
+    for dir_path, _, file_names in os.walk(folder):
+        for file_name in sorted(file_names):
+            if file_name.startswith(('.', '~$')):
+                continue
+            input_ext = os.path.splitext(file_name)[1].lower()
+            if (input_ext, output_format) in DOCUMENT_CONVERSIONS:
+                documents.append(os.path.join(dir_path, file_name))
+    return sorted(documents)
+
+def is_document_up_to_date(input_file, output_format):
+    """변환 결과가 이미 있고 입력 파일보다 최신이면 True"""
+    output_file = get_document_output_path(input_file, output_format)
+    try:
+        return os.path.getmtime(output_file) >= os.path.getmtime(input_file)
+    except OSError:
+        return False
+
+def _init_document_worker():
+    # 일괄 변환 워커 안에서는 PDF 추출을 다시 병렬화하지 않음 (코어 과다 사용 방지)
+    global PDF_EXTRACT_WORKERS
+    PDF_EXTRACT_WORKERS = 1
+
+def _convert_document_worker(input_file, output_format):
+    """워커 프로세스에서 문서 하나를 변환하고 (성공 여부, 결과, 로그, 걸린 시간) 반환"""
+    logs = []
+    start = time.perf_counter()
+    try:
+        success, result = convert_document(input_file, output_format, logs.append)
+    except Exception as e:
+        success, result = False, f"문서 변환 중 오류: {str(e)}"
+    return success, result, logs, time.perf_counter() - start
+
+def convert_documents_batch(input_files, output_format, log_callback, status_callback, progress_callback=None, result_callback=None, max_workers=None, skip_unchanged=True, checkpoint=None):
+    """
+    Convert many documents with convert_document on a process pool.
+
+    Documents whose output is already newer than the input are skipped when
+    skip_unchanged is set, as are documents recorded in checkpoint.
+    result_callback(input_file, status, result) is called per file with
+    status 'success', 'failed' or 'skipped'.
+    """
+    total_files = len(input_files)
+    successful = 0
+    failed = 0
+    skipped = 0
+    done = 0
+    
+    pending_files = []
+    for input_file in input_files:
+        if checkpoint and checkpoint.is_done(input_file):
+            skipped += 1
+            done += 1
+            log_callback(f"[{done}/{total_files}] 이전 실행에서 완료됨, 건너뜀: {input_file}")
+            if result_callback:
+                result_callback(input_file, 'skipped', get_document_output_path(input_file, output_format))
+        elif skip_unchanged and is_document_up_to_date(input_file, output_format):
+            skipped += 1
+            done += 1
+            log_callback(f"[{done}/{total_files}] 변경 없음, 건너뜀: {input_file}")
+            if result_callback:
+                result_callback(input_file, 'skipped', get_document_output_path(input_file, output_format))
+        else:
+            pending_files.append(input_file)
+    
+    if progress_callback and total_files:
+        progress_callback(done, total_files)
+    
+    if pending_files:
+        log_callback(f"문서 {len(pending_files)}개를 일괄 변환합니다 (건너뜀: {skipped}개).")
+        with _process_pool(max_workers, _init_document_worker) as executor:
+            futures = {
+                executor.submit(_convert_document_worker, input_file, output_format): input_file
+                for input_file in pending_files
+            }
+            for future in as_completed(futures):
+                input_file = futures[future]
+                try:
+                    success, result, logs, elapsed = future.result()
+                except Exception as e:
+                    success, result, logs, elapsed = False, f"워커 오류: {str(e)}", [], None
+                if elapsed is not None:
+                    # 워커 프로세스의 메트릭은 이 프로세스에 보이지 않으므로 결과로 기록
+                    record_operation('document', success, elapsed)
+                
+                done += 1
+                if success:
+                    successful += 1
+                    if checkpoint:
+                        checkpoint.mark_done(input_file, result)
+                    log_callback(f"[{done}/{total_files}] 성공: {result}")
+                else:
+                    failed += 1
+                    for line in logs:
+                        log_callback(line)
+                    log_callback(f"[{done}/{total_files}] 실패: {input_file} - {result}")
+                if result_callback:
+                    result_callback(input_file, 'success' if success else 'failed', result)
+                if progress_callback:
+                    progress_callback(done, total_files)
+                status_callback(f"문서 일괄 변환 중 ({done}/{total_files})...")
+    
+    summary = f"성공: {successful}, 실패: {failed}, 건너뜀: {skipped}"
+    log_callback(f"\n문서 일괄 변환 완료! {summary}")
+    status_callback(f"문서 일괄 변환 완료! ({summary})")
+    return failed == 0, summary
@@ -0,0 +1,45 @@
+"""
+YouTube download
+yt-dlp based video/audio download
+"""
+
+import os
+
+from .lazy import LazyModule
+from .metrics import timed_operation
+
+yt_dlp = LazyModule('yt_dlp')
+
+@timed_operation('download')
+def download_youtube(url, output_dir, format_type, log_callback, status_callback):
+    """
+    Download YouTube video as mp4 or mp3.
+    Returns (success, output_dir or error message).
+    """
+    ydl_opts = {
+        'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s'),
+    }
+    if format_type == 'mp3':
+        ydl_opts.update({
+            'format': 'bestaudio/best',
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'mp3',
+                'preferredquality': '192',
+            }],
+        })
+    else:  # mp4
+        ydl_opts['format'] = 'best[ext=mp4]'
+    try:
+        log_callback(f"다운로드 시작: {url}")
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            ydl.download([url])
+        log_callback("다운로드 완료!")
+        status_callback("다운로드 완료!")
+        return True, output_dir
+    except Exception as e:
+        log_callback(f"다운로드 오류: {e}")
+        status_callback("다운로드 오류")
+        return False, str(e)
+    finally:
+        status_callback("대기 중...")
@@ -0,0 +1,310 @@
+"""
+Jobs
+Resource-limited job scheduler and the SQLite job store used to resume jobs after a restart
+"""
+
+import os
+from pathlib import Path
+import threading
+import json
+import sqlite3
+import heapq
+import itertools
+import time
+
+from .media import FFMPEG_GOVERNOR
+from .metrics import REGISTRY
+from .tracing import add_complete_span, span
+
+# 자원 종류별 동시 실행 작업 수 환경 변수 (네트워크: 다운로드, CPU: 변환, 디스크: 분할/합치기)
+JOB_LIMIT_ENVS = {
+    'network': 'JOB_LIMIT_NETWORK',
+    'cpu': 'JOB_LIMIT_CPU',
+    'disk': 'JOB_LIMIT_DISK',
+}
+JOB_RESOURCE_NAMES = {'network': "네트워크", 'cpu': "CPU", 'disk': "디스크"}
+
+JOB_PRIORITY_HIGH = 0
+JOB_PRIORITY_NORMAL = 1
+JOB_PRIORITY_LOW = 2
+JOB_PRIORITY_NAMES = {JOB_PRIORITY_HIGH: "높음", JOB_PRIORITY_NORMAL: "보통", JOB_PRIORITY_LOW: "낮음"}
+
+JOB_STATUS_QUEUED = "대기"
+JOB_STATUS_RUNNING = "실행 중"
+JOB_STATUS_DONE = "완료"
+JOB_STATUS_FAILED = "실패"
+JOB_STATUS_CANCELLED = "취소"
+JOB_FINISHED_STATUSES = (JOB_STATUS_DONE, JOB_STATUS_FAILED, JOB_STATUS_CANCELLED)
+# 메트릭 레이블에 쓰는 상태 이름
+JOB_STATUS_METRIC_NAMES = {JOB_STATUS_DONE: 'done', JOB_STATUS_FAILED: 'failed', JOB_STATUS_CANCELLED: 'cancelled'}
+
+JOBS_TOTAL = REGISTRY.counter('ytdl_jobs_total', "Scheduler jobs that finished", ('resource', 'status'))
+JOBS_QUEUED = REGISTRY.gauge('ytdl_jobs_queued', "Scheduler jobs waiting for a slot", ('resource',))
+JOBS_RUNNING = REGISTRY.gauge('ytdl_jobs_running', "Scheduler jobs running", ('resource',))
+JOB_WAIT_SECONDS = REGISTRY.histogram('ytdl_job_queue_wait_seconds', "Time jobs spent queued before starting", ('resource',))
+JOB_RUN_SECONDS = REGISTRY.histogram('ytdl_job_duration_seconds', "Time jobs spent running", ('resource',))
+
+def get_job_limits():
+    """자원 종류별 동시 실행 작업 수 (CPU 기본값은 ffmpeg 동시 실행 가능 수)"""
+    defaults = {'network': 3, 'cpu': FFMPEG_GOVERNOR.max_jobs, 'disk': 1}
+    limits = {}
+    for resource, env_name in JOB_LIMIT_ENVS.items():
+        try:
+            limits[resource] = max(1, int(os.environ.get(env_name, defaults[resource])))
+        except ValueError:
+            limits[resource] = defaults[resource]
+    return limits
+
+class Job:
+    """A scheduled job; the queue view reads these fields directly."""
+
+    def __init__(self, job_id, name, resource, priority, target, args):
+        self.job_id = job_id
+        self.name = name
+        self.resource = resource
+        self.priority = priority
+        self.target = target
+        self.args = args
+        self.status = JOB_STATUS_QUEUED
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+class JobScheduler:
+    """
+    Run jobs with a separate concurrency limit per resource class.
+
+    Each resource class ('network', 'cpu', 'disk') has its own priority
+    queue; a queued job starts as soon as a slot of its class is free,
+    highest priority first and then in submission order. A target that
+    returns False or raises is marked failed. change_callback(job) is called
+    from the submitting or worker thread whenever a job changes state.
+    """
+
+    def __init__(self, limits=None, change_callback=None):
+        self.limits = limits or get_job_limits()
+        self.change_callback = change_callback
+        self.jobs = {}
+        self._queues = {resource: [] for resource in self.limits}
+        self._running = {resource: 0 for resource in self.limits}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, name, resource, target, args=(), priority=JOB_PRIORITY_NORMAL):
+        with self._lock:
+            job = Job(next(self._ids), name, resource, priority, target, args)
+            self.jobs[job.job_id] = job
+            heapq.heappush(self._queues[resource], (priority, job.job_id))
+        JOBS_QUEUED.inc(resource=resource)
+        self._notify(job)
+        self._dispatch()
+        return job
+
+    def set_priority(self, job_id, priority):
+        """Change the priority of a queued job (returns False if it already started)"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status != JOB_STATUS_QUEUED:
+                return False
+            job.priority = priority
+            # 이전 항목은 꺼낼 때 우선순위가 달라 건너뜀
+            heapq.heappush(self._queues[job.resource], (priority, job_id))
+        self._notify(job)
+        return True
+
+    def cancel(self, job_id):
+        """Cancel a queued job (returns False if it already started)"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status != JOB_STATUS_QUEUED:
+                return False
+            job.status = JOB_STATUS_CANCELLED
+            job.finished_at = time.time()
+        JOBS_QUEUED.dec(resource=job.resource)
+        JOBS_TOTAL.inc(resource=job.resource, status=JOB_STATUS_METRIC_NAMES[job.status])
+        self._notify(job)
+        return True
+
+    def set_limit(self, resource, limit):
+        with self._lock:
+            self.limits[resource] = max(1, limit)
+        self._dispatch()
+
+    def clear_finished(self):
+        """Forget finished jobs; returns their ids"""
+        with self._lock:
+            finished = [job_id for job_id, job in self.jobs.items() if job.status in JOB_FINISHED_STATUSES]
+            for job_id in finished:
+                del self.jobs[job_id]
+        return finished
+
+    def _dispatch(self):
+        started = []
+        with self._lock:
+            for resource, pending in self._queues.items():
+                while pending and self._running[resource] < self.limits[resource]:
+                    priority, job_id = heapq.heappop(pending)
+                    job = self.jobs.get(job_id)
+                    if job is None or job.status != JOB_STATUS_QUEUED or job.priority != priority:
+                        continue
+                    job.status = JOB_STATUS_RUNNING
+                    job.started_at = time.time()
+                    self._running[resource] += 1
+                    started.append(job)
+        for job in started:
+            JOBS_QUEUED.dec(resource=job.resource)
+            JOBS_RUNNING.inc(resource=job.resource)
+            JOB_WAIT_SECONDS.observe(job.started_at - job.submitted_at, resource=job.resource)
+            self._notify(job)
+            threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+    def _run(self, job):
+        add_complete_span('queued', 'job', job.submitted_at, job.started_at, job=job.name, job_id=job.job_id)
+        try:
+            with span(job.name, cat='job', job_id=job.job_id, resource=job.resource):
+                result = job.target(*job.args)
+            job.status = JOB_STATUS_FAILED if result is False else JOB_STATUS_DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = JOB_STATUS_FAILED
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._running[job.resource] -= 1
+            JOBS_RUNNING.dec(resource=job.resource)
+            JOBS_TOTAL.inc(resource=job.resource, status=JOB_STATUS_METRIC_NAMES[job.status])
+            JOB_RUN_SECONDS.observe(job.finished_at - job.started_at, resource=job.resource)
+            self._notify(job)
+            self._dispatch()
+
+    def _notify(self, job):
+        if self.change_callback:
+            self.change_callback(job)
+
+# 작업 대기열/진행 상황을 저장할 SQLite 파일 환경 변수 ("off"면 저장 안 함)
+JOB_DB_ENV = 'JOB_DB_PATH'
+
+def get_job_db_path():
+    """작업 저장소 경로 (사용하지 않으면 None)"""
+    db_path = os.environ.get(JOB_DB_ENV)
+    if db_path and db_path.lower() == 'off':
+        return None
+    return db_path or str(Path.home() / ".cache" / "youtube-downloader" / "jobs.sqlite3")
+
+class JobStore:
+    """
+    SQLite record of submitted jobs and the items they finished.
+
+    A job row keeps what is needed to run it again (the GUI method name and
+    its JSON arguments). job_items stores every finished item with the size
+    and mtime of its output, so a resumed job skips only outputs that are
+    still intact.
+    """
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    method TEXT NOT NULL,
+                    args TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS job_items (
+                    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+                    item TEXT NOT NULL,
+                    output TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    PRIMARY KEY (job_id, item)
+                );
+            """)
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def add_job(self, kind, method, args, priority):
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (kind, method, args, priority, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, method, json.dumps(list(args), ensure_ascii=False), priority, JOB_STATUS_QUEUED, now, now)
+            )
+            return cursor.lastrowid
+
+    def set_status(self, job_id, status, error=None):
+        self._execute("UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?", (status, error, time.time(), job_id))
+
+    def set_priority(self, job_id, priority):
+        self._execute("UPDATE jobs SET priority = ?, updated_at = ? WHERE id = ?", (priority, time.time(), job_id))
+
+    def incomplete_jobs(self):
+        """Jobs that were queued or running when the app last stopped, oldest first"""
+        rows = self._execute(
+            "SELECT id, kind, method, args, priority FROM jobs WHERE status IN (?, ?) ORDER BY id",
+            (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)
+        )
+        return [
+            {'id': job_id, 'kind': kind, 'method': method, 'args': json.loads(args), 'priority': priority}
+            for job_id, kind, method, args, priority in rows
+        ]
+
+    def delete_jobs(self, job_ids):
+        with self._lock:
+            for job_id in job_ids:
+                self._conn.execute("DELETE FROM job_items WHERE job_id = ?", (job_id,))
+                self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def delete_finished(self):
+        rows = self._execute("SELECT id FROM jobs WHERE status IN (?, ?, ?)", JOB_FINISHED_STATUSES)
+        self.delete_jobs([job_id for job_id, in rows])
+
+    def mark_item_done(self, job_id, item, output, size, mtime):
+        self._execute(
+            "INSERT OR REPLACE INTO job_items (job_id, item, output, size, mtime) VALUES (?, ?, ?, ?, ?)",
+            (job_id, item, output, size, mtime)
+        )
+
+    def item_output(self, job_id, item):
+        """(output, size, mtime) recorded for a finished item, or None"""
+        rows = self._execute("SELECT output, size, mtime FROM job_items WHERE job_id = ? AND item = ?", (job_id, item))
+        return rows[0] if rows else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class JobCheckpoint:
+    """Per-job progress handle passed to the resumable split/batch functions."""
+
+    def __init__(self, store, job_id):
+        self.store = store
+        self.job_id = job_id
+
+    def is_done(self, item):
+        """True if item finished earlier and its output is unchanged since"""
+        record = self.store.item_output(self.job_id, item)
+        if record is None:
+            return False
+        output, size, mtime = record
+        try:
+            stat = os.stat(output)
+        except OSError:
+            return False
+        return stat.st_size == size and stat.st_mtime == mtime
+
+    def mark_done(self, item, output):
+        stat = os.stat(output)
+        self.store.mark_item_done(self.job_id, item, output, stat.st_size, stat.st_mtime)
@@ -0,0 +1,29 @@
+"""
+Lazy imports
+Placeholder modules that import a heavy dependency on first attribute access
+"""
+
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a heavy dependency that imports it on first attribute access.
+
+    yt-dlp, python-docx, python-pptx, PyPDF2, pypandoc and lxml together take
+    most of the launch time, while a session usually touches one tab, so each
+    one is only loaded by the first feature that uses it.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
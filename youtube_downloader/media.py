@@ -0,0 +1,579 @@
+"""
+Media engine
+Scratch directories, the shared ffmpeg governor and media conversion
+(single file, chunked in parallel, distributed over transcode workers, batch)
+"""
+
+import os
+import subprocess
+import threading
+import tempfile
+import json
+import shutil
+import errno
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import urllib.request
+import urllib.error
+import http.client
+import time
+
+from .metrics import REGISTRY, timed_operation
+from .tracing import add_complete_span, span
+
+# 작업별 임시 폴더를 만들 위치 (빠른 로컬 디스크나 tmpfs 지정용 환경 변수)
+SCRATCH_DIR_ENV = 'MEDIA_SCRATCH_DIR'
+
+def get_scratch_root():
+    """
+    Root directory for per-job scratch directories.
+    """
+    return os.environ.get(SCRATCH_DIR_ENV) or tempfile.gettempdir()
+
+@contextlib.contextmanager
+def job_scratch_dir(prefix="job"):
+    """
+    Create an isolated scratch directory for one job and always remove it.
+    """
+    root = get_scratch_root()
+    os.makedirs(root, exist_ok=True)
+    scratch = tempfile.mkdtemp(prefix=f"{prefix}_", dir=root)
+    try:
+        yield scratch
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+def commit_output(temp_path, output_file):
+    """
+    Atomically move a finished file from scratch to its final path.
+
+    When scratch lives on another filesystem the file is first copied next to
+    the output under a hidden name, so the final rename is still atomic.
+    """
+    try:
+        os.replace(temp_path, output_file)
+        return output_file
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    fd, staging_path = tempfile.mkstemp(prefix=".partial_", suffix=os.path.splitext(output_file)[1], dir=output_dir)
+    os.close(fd)
+    try:
+        with span('write', cat='media', output=os.path.basename(output_file)):
+            shutil.copyfile(temp_path, staging_path)
+        os.replace(staging_path, output_file)
+    except Exception:
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
+        raise
+    os.remove(temp_path)
+    return output_file
+
+class FFmpegGovernor:
+    """
+    Share the machine's cores between concurrently running ffmpeg jobs.
+
+    The threads granted to running jobs never add up to more than the
+    cores. A new job gets its fair share (the cores divided by the running
+    jobs including itself), capped by the threads still free, and a
+    niceness that keeps the GUI responsive. While fewer than min_threads
+    cores are free, new jobs wait until a running job returns its threads.
+    """
+
+    def __init__(self, total_cores=None, min_threads=2, base_niceness=5):
+        self.total_cores = total_cores or os.cpu_count() or 1
+        self.min_threads = max(1, min(min_threads, self.total_cores))
+        self.max_jobs = max(1, self.total_cores // self.min_threads)
+        self.base_niceness = base_niceness
+        self.active_jobs = 0
+        self.granted_threads = 0
+        self._condition = threading.Condition()
+
+    @contextlib.contextmanager
+    def slot(self, wait_callback=None, max_threads=None):
+        """Reserve threads for one job (at most max_threads); yields (thread budget, niceness)."""
+        needed = min(self.min_threads, max_threads) if max_threads else self.min_threads
+        with self._condition:
+            if self.total_cores - self.granted_threads < needed and wait_callback:
+                wait_callback(f"CPU 사용 중인 작업이 많아 대기합니다 ({self.granted_threads}/{self.total_cores} 스레드 사용 중)...")
+            while self.total_cores - self.granted_threads < needed:
+                self._condition.wait()
+            self.active_jobs += 1
+            free = self.total_cores - self.granted_threads
+            threads = min(free, max(self.min_threads, self.total_cores // self.active_jobs))
+            if max_threads:
+                threads = min(threads, max_threads)
+            self.granted_threads += threads
+            niceness = min(19, self.base_niceness + self.active_jobs - 1)
+        try:
+            yield threads, niceness
+        finally:
+            with self._condition:
+                self.active_jobs -= 1
+                self.granted_threads -= threads
+                self._condition.notify_all()
+
+FFMPEG_GOVERNOR = FFmpegGovernor()
+
+FFMPEG_WAIT_SECONDS = REGISTRY.histogram('ytdl_ffmpeg_slot_wait_seconds', "Time ffmpeg runs waited for a governor slot")
+FFMPEG_RUN_SECONDS = REGISTRY.histogram('ytdl_ffmpeg_duration_seconds', "Wall time of ffmpeg processes", ('result',))
+
+def run_ffmpeg(cmd, threads=None, wait_callback=None):
+    """
+    Run an ffmpeg command under the global governor.
+
+    The governor's thread budget is added as an output option (threads, if
+    given, only lowers it) and the process niceness is raised before it does
+    real work. Raises CalledProcessError like subprocess.run(check=True).
+    """
+    requested_at = time.time()
+    with FFMPEG_GOVERNOR.slot(wait_callback, threads) as (budget, niceness):
+        started_at = time.time()
+        FFMPEG_WAIT_SECONDS.observe(started_at - requested_at)
+        add_complete_span('ffmpeg.wait', 'media', requested_at, started_at)
+        cmd = cmd[:-1] + ['-threads', str(budget)] + cmd[-1:]
+        with span('ffmpeg', cat='media', output=os.path.basename(cmd[-1]), threads=budget):
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
+            if hasattr(os, 'setpriority'):
+                try:
+                    os.setpriority(os.PRIO_PROCESS, process.pid, niceness)
+                except OSError:
+                    pass
+            stdout, stderr = process.communicate()
+    FFMPEG_RUN_SECONDS.observe(time.time() - started_at, result='success' if process.returncode == 0 else 'failure')
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+def is_same_file_path(path, other):
+    """두 경로가 같은 파일을 가리키는지 (출력이 원본을 덮어쓰는지 확인용)"""
+    return os.path.normcase(os.path.realpath(path)) == os.path.normcase(os.path.realpath(other))
+
+@timed_operation('convert')
+def convert_media(input_file, output_ext, log_callback):
+    """
+    Convert media file to another format using ffmpeg.
+
+    Converting to the input's own format is refused (like ffmpeg's "Output
+    same as Input"), since the result would replace the original.
+    """
+    base = os.path.splitext(input_file)[0]
+    output_file = f"{base}.{output_ext}"
+    if is_same_file_path(input_file, output_file):
+        log_callback(f"변환 실패: 출력 파일이 입력 파일과 같습니다: {output_file}")
+        return False, f"출력 파일이 입력 파일과 같습니다: {output_file}"
+    try:
+        log_callback(f"변환 시작: {input_file} → {output_file}")
+        with job_scratch_dir("convert") as scratch:
+            temp_output = os.path.join(scratch, f"output.{output_ext}")
+            cmd = [
+                'ffmpeg',
+                '-y',  # overwrite
+                '-i', input_file,
+                temp_output
+            ]
+            run_ffmpeg(cmd, wait_callback=log_callback)
+            commit_output(temp_output, output_file)
+        log_callback(f"변환 완료: {output_file}")
+        return True, output_file
+    except (subprocess.CalledProcessError, OSError) as e:
+        log_callback(f"변환 실패: {e}")
+        return False, str(e)
+
+def get_media_duration(input_file):
+    """
+    Get media file duration in seconds using ffprobe.
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        input_file
+    ]
+    try:
+        with span('ffprobe', cat='media', input=os.path.basename(input_file)):
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        duration = float(result.stdout.strip())
+        return duration
+    except (subprocess.CalledProcessError, ValueError):
+        return None
+
+def write_concat_list(list_file, input_files):
+    """
+    Write an ffmpeg concat demuxer list for the given files.
+    """
+    with open(list_file, 'w', encoding='utf-8') as f:
+        for input_file in input_files:
+            # Escape single quotes for ffmpeg
+            escaped_path = os.path.abspath(input_file).replace("'", "'\"'\"'")
+            f.write(f"file '{escaped_path}'\n")
+
+# 분할 병렬 변환 설정
+CHUNK_MIN_SECONDS = 30          # 이보다 짧은 청크는 만들지 않음
+CHUNKS_PER_WORKER = 2           # 작업 분배를 고르게 하기 위한 워커당 청크 수
+CHUNK_BOUNDARY_TOLERANCE = 0.1  # 청크 경계에서 허용하는 길이 오차 (초)
+
+def segment_at_keyframes(input_file, chunk_duration, scratch):
+    """
+    Cut a media file into stream-copied chunks at keyframes using the segment muxer.
+    """
+    file_ext = os.path.splitext(input_file)[1]
+    pattern = os.path.join(scratch, f"chunk_%05d{file_ext}")
+    cmd = [
+        'ffmpeg',
+        '-y',
+        '-i', input_file,
+        '-map', '0',
+        '-c', 'copy',
+        '-f', 'segment',
+        '-segment_time', str(chunk_duration),
+        '-reset_timestamps', '1',
+        pattern
+    ]
+    with span('segment', cat='media'):
+        run_ffmpeg(cmd)
+    return sorted(
+        os.path.join(scratch, name) for name in os.listdir(scratch)
+        if name.startswith("chunk_") and name.endswith(file_ext)
+    )
+
+def transcode_chunk(chunk_file, output_file, threads=None):
+    """
+    Transcode one chunk and report its source and output durations.
+    """
+    cmd = ['ffmpeg', '-y', '-i', chunk_file, output_file]
+    run_ffmpeg(cmd, threads=threads)
+    return output_file, get_media_duration(chunk_file), get_media_duration(output_file)
+
+def check_chunk_boundaries(chunk_results, log_callback):
+    """
+    Verify transcoded chunks keep their source durations so concat is seamless.
+    Returns the indices of chunks whose boundaries would not be seamless.
+    """
+    bad_chunks = []
+    for i, (output_file, source_duration, output_duration) in enumerate(chunk_results):
+        if source_duration is None or output_duration is None:
+            log_callback(f"청크 {i + 1} 길이를 확인할 수 없습니다: {output_file}")
+            bad_chunks.append(i)
+        elif abs(output_duration - source_duration) > CHUNK_BOUNDARY_TOLERANCE:
+            log_callback(f"청크 {i + 1} 길이 불일치: 원본 {source_duration:.3f}s, 변환 {output_duration:.3f}s")
+            bad_chunks.append(i)
+    return bad_chunks
+
+def group_bad_chunks(bad_chunks, chunk_count):
+    """
+    Ranges [start, stop) to re-encode as one piece: each bad chunk together
+    with its neighbours, overlapping ranges merged.
+    """
+    ranges = []
+    for i in bad_chunks:
+        start, stop = max(0, i - 1), min(chunk_count, i + 2)
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], stop)
+        else:
+            ranges.append([start, stop])
+    return [tuple(r) for r in ranges]
+
+def _retranscode_chunk_range(chunks, start, stop, output_ext, scratch, transcode):
+    """
+    Stream-copy source chunks [start, stop) back into one piece and transcode
+    it, so the boundaries inside the range disappear. Returns the transcode
+    result tuple.
+    """
+    file_ext = os.path.splitext(chunks[start])[1]
+    list_file = os.path.join(scratch, f"rejoin_{start:05d}.txt")
+    rejoined = os.path.join(scratch, f"rejoin_{start:05d}{file_ext}")
+    write_concat_list(list_file, chunks[start:stop])
+    run_ffmpeg(['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', list_file, '-map', '0', '-c', 'copy', rejoined])
+    return transcode(rejoined, os.path.join(scratch, f"out_rejoin_{start:05d}.{output_ext}"))
+
+def _run_chunked_transcode(input_file, output_ext, log_callback, parallelism, transcode, progress_callback=None):
+    """
+    Shared split → parallel transcode → lossless concat pipeline.
+
+    transcode(chunk_file, output_file) must return the same tuple as
+    transcode_chunk. A chunk whose boundaries would not be seamless is
+    re-encoded together with its neighbours as one piece; the pipeline falls
+    back to a single-pass convert_media only when the file is too short to
+    split or such a re-encoded range is still not seamless.
+    """
+    base = os.path.splitext(input_file)[0]
+    output_file = f"{base}.{output_ext}"
+    if is_same_file_path(input_file, output_file):
+        log_callback(f"변환 실패: 출력 파일이 입력 파일과 같습니다: {output_file}")
+        return False, f"출력 파일이 입력 파일과 같습니다: {output_file}"
+    
+    total_duration = get_media_duration(input_file)
+    if total_duration is None:
+        log_callback(f"미디어 파일의 길이를 가져올 수 없습니다: {input_file}")
+        return False, "미디어 파일의 길이를 가져올 수 없습니다"
+    
+    if parallelism < 2 or total_duration < CHUNK_MIN_SECONDS * 2:
+        return convert_media(input_file, output_ext, log_callback)
+    
+    chunk_duration = max(CHUNK_MIN_SECONDS, total_duration / (parallelism * CHUNKS_PER_WORKER))
+    
+    try:
+        log_callback(f"분할 병렬 변환 시작: {input_file} → {output_file}")
+        with job_scratch_dir("chunked") as scratch:
+            chunks = segment_at_keyframes(input_file, chunk_duration, scratch)
+            log_callback(f"키프레임 기준 {len(chunks)}개 청크, 동시 {parallelism}개로 변환합니다.")
+            
+            results = [None] * len(chunks)
+            with ThreadPoolExecutor(max_workers=parallelism) as executor:
+                futures = {
+                    executor.submit(transcode, chunk, os.path.join(scratch, f"out_{i:05d}.{output_ext}")): i
+                    for i, chunk in enumerate(chunks)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception:
+                        # 대기 중인 청크는 시작하지 않고 실행 중인 청크만 끝나면 바로 실패 보고
+                        executor.shutdown(cancel_futures=True)
+                        raise
+                    if progress_callback:
+                        progress_callback(done, len(chunks) + 1)
+            
+            bad_chunks = check_chunk_boundaries(results, log_callback)
+            if bad_chunks:
+                # 문제가 된 청크와 양옆 청크만 하나로 합쳐 다시 변환 (뒤에서부터 바꿔 앞쪽 인덱스 유지)
+                for start, stop in reversed(group_bad_chunks(bad_chunks, len(chunks))):
+                    log_callback(f"청크 {start + 1}~{stop}번을 하나로 합쳐 다시 변환합니다.")
+                    rejoined = _retranscode_chunk_range(chunks, start, stop, output_ext, scratch, transcode)
+                    if check_chunk_boundaries([rejoined], log_callback):
+                        log_callback("다시 변환한 구간도 경계가 매끄럽지 않아 단일 변환으로 다시 진행합니다.")
+                        return convert_media(input_file, output_ext, log_callback)
+                    results[start:stop] = [rejoined]
+            
+            list_file = os.path.join(scratch, "chunks.txt")
+            temp_output = os.path.join(scratch, f"output.{output_ext}")
+            write_concat_list(list_file, [result[0] for result in results])
+            cmd = [
+                'ffmpeg',
+                '-y',
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', list_file,
+                '-map', '0',
+                '-c', 'copy',
+                temp_output
+            ]
+            run_ffmpeg(cmd, wait_callback=log_callback)
+            
+            merged_duration = get_media_duration(temp_output)
+            if merged_duration is None or abs(merged_duration - total_duration) > CHUNK_BOUNDARY_TOLERANCE * len(chunks):
+                log_callback(f"합친 결과 길이가 원본과 다릅니다 (원본 {total_duration:.3f}s, 결과 {merged_duration}). 단일 변환으로 다시 진행합니다.")
+                return convert_media(input_file, output_ext, log_callback)
+            
+            commit_output(temp_output, output_file)
+            if progress_callback:
+                progress_callback(len(chunks) + 1, len(chunks) + 1)
+        
+        log_callback(f"변환 완료: {output_file}")
+        return True, output_file
+    except (subprocess.CalledProcessError, OSError, RuntimeError) as e:
+        log_callback(f"분할 병렬 변환 실패: {e}")
+        return False, str(e)
+
+@timed_operation('convert_chunked')
+def convert_media_chunked(input_file, output_ext, log_callback, max_workers=None, progress_callback=None):
+    """
+    Convert a long media file by transcoding keyframe-aligned chunks concurrently.
+
+    The input is cut at keyframes without re-encoding, chunks are transcoded
+    by parallel ffmpeg processes and the results are concatenated losslessly.
+    If a chunk boundary would not be seamless (e.g. codec priming samples
+    changing chunk lengths) only the chunks around it are re-encoded.
+    """
+    max_workers = max_workers or FFMPEG_GOVERNOR.max_jobs
+    threads_per_chunk = max(1, FFMPEG_GOVERNOR.total_cores // max_workers)
+    
+    def transcode(chunk_file, chunk_output):
+        return transcode_chunk(chunk_file, chunk_output, threads_per_chunk)
+    
+    return _run_chunked_transcode(input_file, output_ext, log_callback, max_workers, transcode, progress_callback)
+
+# 분산 변환 워커 목록 환경 변수 (예: "10.0.0.5:9001,10.0.0.6:9001")
+TRANSCODE_WORKERS_ENV = 'TRANSCODE_WORKERS'
+TRANSCODE_WORKER_TOKEN_ENV = 'TRANSCODE_WORKER_TOKEN'  # 워커에 설정한 것과 같은 Bearer 토큰
+WORKER_REQUEST_TIMEOUT = 3600   # 청크 하나 변환에 허용하는 최대 시간 (초)
+WORKER_IDLE_TIMEOUT = 600       # 쉬는 워커를 기다리는 최대 시간 (초)
+WORKER_MAX_FAILURES = 3         # 이 횟수만큼 실패한 워커는 제외
+WORKER_RETRY_BACKOFF = 2        # 실패한 워커를 다시 쓰기 전 대기 시간 (초, 연속 실패 횟수만큼 증가)
+WORKER_BUSY_DELAY = 1           # 다른 작업으로 바쁜(503) 워커를 다시 쓰기 전 대기 시간 (초)
+
+def get_transcode_workers():
+    """
+    Worker base URLs configured in TRANSCODE_WORKERS.
+    """
+    workers = []
+    for entry in os.environ.get(TRANSCODE_WORKERS_ENV, "").split(','):
+        entry = entry.strip()
+        if entry:
+            workers.append(entry if entry.startswith('http') else f"http://{entry}")
+    return workers
+
+def _worker_headers(headers):
+    token = os.environ.get(TRANSCODE_WORKER_TOKEN_ENV)
+    if token:
+        headers['Authorization'] = f"Bearer {token}"
+    return headers
+
+def transcode_chunk_remote(worker_url, chunk_file, output_file, shared_storage=False):
+    """
+    Transcode one chunk on a remote worker (see transcode_worker.py).
+
+    With shared_storage the worker reads and writes the chunk paths directly;
+    otherwise the chunk is streamed in the request and the result streamed back.
+    """
+    if shared_storage:
+        body = json.dumps({'input': os.path.abspath(chunk_file), 'output': os.path.abspath(output_file)}).encode('utf-8')
+        request = urllib.request.Request(
+            f"{worker_url}/transcode-shared", data=body,
+            headers=_worker_headers({'Content-Type': 'application/json'}), method='POST'
+        )
+        with urllib.request.urlopen(request, timeout=WORKER_REQUEST_TIMEOUT) as response:
+            response.read()
+    else:
+        with open(chunk_file, 'rb') as src:
+            request = urllib.request.Request(
+                f"{worker_url}/transcode", data=src, method='POST',
+                headers=_worker_headers({
+                    'Content-Type': 'application/octet-stream',
+                    'Content-Length': str(os.path.getsize(chunk_file)),
+                    'X-Input-Ext': os.path.splitext(chunk_file)[1],
+                    'X-Output-Ext': os.path.splitext(output_file)[1],
+                })
+            )
+            with urllib.request.urlopen(request, timeout=WORKER_REQUEST_TIMEOUT) as response, \
+                    open(output_file, 'wb') as dst:
+                shutil.copyfileobj(response, dst, 1024 * 1024)
+                expected = response.headers.get('Content-Length')
+                # 워커가 결과를 보내다 끊으면 잘린 청크가 성공처럼 보이지 않게 함
+                if expected is not None and dst.tell() != int(expected):
+                    raise ValueError(f"워커 응답이 잘렸습니다 ({dst.tell()}/{expected} bytes)")
+    return output_file, get_media_duration(chunk_file), get_media_duration(output_file)
+
+@timed_operation('convert_distributed')
+def convert_media_distributed(input_file, output_ext, log_callback, workers=None, shared_storage=False, max_retries=2, progress_callback=None):
+    """
+    Convert a long media file by fanning keyframe-aligned chunks out to remote workers.
+
+    Each worker runs one chunk at a time; a failed chunk is retried on the next
+    free worker, a failed worker is only reused after a backoff, and workers
+    that fail WORKER_MAX_FAILURES times in a row are dropped. A worker that
+    answers 503 (busy with another coordinator's chunk) is tried again later
+    without counting as a failure. Once every worker has been dropped the
+    remaining chunks fail immediately. For shared_storage
+    MEDIA_SCRATCH_DIR must point to a directory mounted at the same path on
+    every worker, and the workers must be started with --shared-root at or
+    above it.
+    """
+    workers = workers or get_transcode_workers()
+    if not workers:
+        log_callback("분산 변환 워커가 설정되지 않아 로컬 분할 병렬 변환으로 진행합니다.")
+        return convert_media_chunked(input_file, output_ext, log_callback, progress_callback=progress_callback)
+    
+    idle_workers = queue.Queue()
+    for worker in workers:
+        idle_workers.put(worker)
+    failures = {worker: 0 for worker in workers}  # 연속 실패 횟수 (성공하면 0)
+    live_workers = set(workers)
+    failures_lock = threading.Lock()
+    
+    def requeue_later(worker, delay):
+        # 다른 쉬는 워커가 먼저 선택되도록 잠시 뒤에 되돌려 놓음
+        timer = threading.Timer(delay, idle_workers.put, args=(worker,))
+        timer.daemon = True
+        timer.start()
+    
+    def transcode(chunk_file, chunk_output):
+        chunk_name = os.path.basename(chunk_file)
+        last_error = None
+        attempt = 0
+        busy_deadline = None  # 바쁜 워커만 계속 만날 때 기다리는 한도
+        while attempt <= max_retries:
+            try:
+                worker = idle_workers.get(timeout=WORKER_IDLE_TIMEOUT)
+            except queue.Empty:
+                raise RuntimeError(f"사용 가능한 워커가 없습니다: {chunk_name}")
+            if worker is None:
+                # 모든 워커가 제외됨: 기다리는 다른 청크도 바로 실패하도록 표시를 남김
+                idle_workers.put(None)
+                raise RuntimeError(f"남은 워커가 없습니다: {chunk_name} - {last_error}")
+            try:
+                with span('remote_transcode', cat='media', worker=worker, chunk=chunk_name):
+                    result = transcode_chunk_remote(worker, chunk_file, chunk_output, shared_storage)
+                with failures_lock:
+                    failures[worker] = 0
+                idle_workers.put(worker)
+                return result
+            except urllib.error.HTTPError as e:
+                last_error = e
+                if e.code == 503:
+                    busy_deadline = busy_deadline or time.monotonic() + WORKER_IDLE_TIMEOUT
+                    if time.monotonic() < busy_deadline:
+                        # 다른 작업으로 바쁜 워커: 실패로 세지 않고 청크를 다시 대기열에 둠
+                        requeue_later(worker, WORKER_BUSY_DELAY)
+                        continue
+            except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError) as e:
+                last_error = e
+            attempt += 1
+            log_callback(f"워커 {worker} 청크 변환 실패 ({attempt}/{max_retries + 1}): {chunk_name} - {last_error}")
+            with failures_lock:
+                failures[worker] += 1
+                worker_failures = failures[worker]
+                if worker_failures >= WORKER_MAX_FAILURES:
+                    live_workers.discard(worker)
+                    no_workers_left = not live_workers
+            if worker_failures < WORKER_MAX_FAILURES:
+                requeue_later(worker, WORKER_RETRY_BACKOFF * worker_failures)
+            else:
+                log_callback(f"워커 {worker}를 제외합니다.")
+                if no_workers_left:
+                    idle_workers.put(None)
+        raise RuntimeError(f"청크 변환 재시도 초과: {chunk_name} - {last_error}")
+    
+    log_callback(f"분산 변환 워커 {len(workers)}개: {', '.join(workers)}")
+    return _run_chunked_transcode(input_file, output_ext, log_callback, len(workers), transcode, progress_callback)
+
+def convert_media_batch(input_files, output_ext, log_callback, status_callback, progress_callback=None, checkpoint=None):
+    """
+    Convert multiple media files to another format using ffmpeg.
+    Files already recorded in checkpoint (see JobCheckpoint) are skipped.
+    Returns (True if every file converted, summary).
+    """
+    total_files = len(input_files)
+    successful = 0
+    failed = 0
+    
+    for i, input_file in enumerate(input_files, 1):
+        if progress_callback:
+            progress_callback(i, total_files)
+        
+        if checkpoint and checkpoint.is_done(input_file):
+            successful += 1
+            log_callback(f"[{i}/{total_files}] 이전 실행에서 완료됨, 건너뜀: {input_file}")
+            continue
+        
+        status_callback(f"변환 중 ({i}/{total_files})...")
+        success, result = convert_media(input_file, output_ext, log_callback)
+        
+        if success:
+            successful += 1
+            if checkpoint:
+                checkpoint.mark_done(input_file, result)
+            log_callback(f"[{i}/{total_files}] 성공: {result}")
+        else:
+            failed += 1
+            log_callback(f"[{i}/{total_files}] 실패: {input_file} - {result}")
+    
+    log_callback(f"\n배치 변환 완료! 성공: {successful}, 실패: {failed}")
+    status_callback(f"배치 변환 완료! (성공: {successful}, 실패: {failed})")
+    
+    return failed == 0, f"성공: {successful}개, 실패: {failed}개"
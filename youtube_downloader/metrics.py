@@ -0,0 +1,264 @@
+"""
+Metrics
+In-process counters, gauges and histograms in the Prometheus text format,
+served over a small HTTP endpoint and/or dumped to a file
+
+    METRICS_PORT=9464      serve http://127.0.0.1:9464/metrics
+    METRICS_FILE=/var/lib/node_exporter/textfile/ytdl.prom
+                           rewrite the file every METRICS_DUMP_INTERVAL seconds and at exit
+                           (node_exporter textfile collector)
+
+Throughput is rate(ytdl_operations_total[5m]) and p95 latency is
+histogram_quantile(0.95, sum by (le, operation) (rate(ytdl_operation_duration_seconds_bucket[5m]))).
+"""
+
+import os
+import threading
+import time
+import functools
+import atexit
+
+from .tracing import span
+
+METRICS_PORT_ENV = 'METRICS_PORT'
+METRICS_FILE_ENV = 'METRICS_FILE'
+METRICS_DUMP_INTERVAL = 15  # 파일 덤프 주기 (초)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 짧은 문서 변환부터 한 시간짜리 미디어 작업까지 담는 구간 (초)
+DURATION_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+    def _samples(self):
+        """(suffix, label key, extra labels, value) for every series"""
+        with self._lock:
+            return [('', key, (), value) for key, value in sorted(self._values.items())]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, key, extra, value in self._samples():
+            lines.append(f"{self.name}{suffix}{self._labels(key, extra)} {_format_value(value)}")
+        return '\n'.join(lines)
+
+class Counter(_Metric):
+    """Monotonic count, one series per label combination."""
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+class Gauge(_Metric):
+    """Value that goes up and down (queue depth, running jobs)."""
+
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(_Metric):
+    """Cumulative bucket counts plus sum and count, for quantiles over time."""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DURATION_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value)
+
+    def _samples(self):
+        with self._lock:
+            series = [(key, list(counts), total) for key, (counts, total) in sorted(self._values.items())]
+        samples = []
+        for key, counts, total in series:
+            for bound, count in zip(self.buckets, counts):
+                samples.append(('_bucket', key, (('le', _format_value(bound)),), count))
+            samples.append(('_sum', key, (), total))
+            samples.append(('_count', key, (), counts[-1]))
+        return samples
+
+class MetricsRegistry:
+    """
+    Named metrics of one process.
+
+    Registering an existing name returns the existing metric, so modules can
+    declare the metrics they update at import time in any order.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DURATION_BUCKETS):
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return ''.join(metric.render() + '\n' for metric in metrics)
+
+    def dump(self, path):
+        """Write render() to path atomically (readers never see a partial file)"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+
+REGISTRY = MetricsRegistry()
+
+OPERATIONS_TOTAL = REGISTRY.counter(
+    'ytdl_operations_total', "Finished download/convert/split/merge/document operations",
+    ('operation', 'result'))
+OPERATION_SECONDS = REGISTRY.histogram(
+    'ytdl_operation_duration_seconds', "Wall time of download/convert/split/merge/document operations",
+    ('operation',))
+
+def record_operation(operation, success, seconds):
+    OPERATIONS_TOTAL.inc(operation=operation, result='success' if success else 'failure')
+    OPERATION_SECONDS.observe(seconds, operation=operation)
+
+def timed_operation(operation):
+    """
+    Decorator counting calls and timing them under the given operation label.
+
+    The wrapped function returns the usual (success, result) tuple; an
+    exception counts as a failure and is re-raised. The call is also a
+    trace span when tracing is on.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            success = False
+            try:
+                with span(operation, cat='operation'):
+                    result = func(*args, **kwargs)
+                success = bool(result[0]) if isinstance(result, tuple) and result else bool(result)
+                return result
+            finally:
+                record_operation(operation, success, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+def start_metrics_server(port, host='127.0.0.1', registry=REGISTRY):
+    """Serve GET /metrics from a daemon thread; returns the server (shutdown() stops it)"""
+    # http.server는 엔드포인트를 켤 때만 불러옴 (GUI 시작 시간)
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def start_metrics_file_dump(path, interval=METRICS_DUMP_INTERVAL, registry=REGISTRY):
+    """Rewrite path every interval seconds from a daemon thread, and once more at exit"""
+    def dump():
+        try:
+            registry.dump(path)
+        except OSError:
+            pass  # 다음 주기에 다시 시도
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            dump()
+
+    dump()
+    atexit.register(dump)
+    threading.Thread(target=loop, daemon=True).start()
+
+def start_metrics_exporters():
+    """
+    Start the exporters configured by METRICS_PORT / METRICS_FILE.
+    Returns where metrics are published (empty if neither is set); raises
+    ValueError or OSError if the port is invalid or already in use.
+    """
+    started = []
+    port = os.environ.get(METRICS_PORT_ENV)
+    if port:
+        start_metrics_server(int(port))
+        started.append(f"http://127.0.0.1:{int(port)}/metrics")
+    path = os.environ.get(METRICS_FILE_ENV)
+    if path:
+        start_metrics_file_dump(path)
+        started.append(path)
+    return started
@@ -0,0 +1,215 @@
+"""
+Pandoc
+Persistent pandoc worker and the file/text conversion helpers built on it
+"""
+
+import os
+import subprocess
+import threading
+import json
+import contextlib
+import atexit
+
+from .lazy import LazyModule
+from .tracing import span
+
+pypandoc = LazyModule('pypandoc')
+
+# 상주 pandoc 워커 (변환마다 pandoc 프로세스를 새로 띄우지 않음), "off"면 사용 안 함
+PANDOC_WORKER_ENV = 'PANDOC_WORKER'
+PANDOC_BINARY_FORMATS = ('docx', 'odt', 'epub', 'epub3', 'pptx')
+PANDOC_WORKER_TIMEOUT = 120     # 응답을 이보다 오래 기다리면 워커를 종료하고 CLI로 다시 시도 (초)
+
+# `pandoc lua`로 실행되는 워커 스크립트: 한 줄에 JSON 요청 하나를 받아 한 줄로 응답
+PANDOC_WORKER_SCRIPT = r"""
+local function handle(request)
+  -- 이전 요청의 이미지가 섞이지 않게 요청마다 미디어 백을 비움
+  pandoc.mediabag.empty()
+  local input = request.text
+  if input == nil then
+    local f = assert(io.open(request.input, 'rb'))
+    input = f:read('a')
+    f:close()
+  end
+  local doc = pandoc.read(input, request.from)
+  if request.output then
+    -- CLI처럼 문서가 가리키는 이미지를 요청한 작업 폴더 기준으로 읽어 출력 파일에 넣음
+    pandoc.system.with_working_directory(request.cwd, function()
+      doc = pandoc.mediabag.fill(doc)
+    end)
+  end
+  local output = pandoc.write(doc, request.to)
+  if request.output then
+    local f = assert(io.open(request.output, 'wb'))
+    f:write(output)
+    f:close()
+    return {ok = true}
+  end
+  return {ok = true, output = output}
+end
+io.stdout:write(pandoc.json.encode({ready = true, version = tostring(PANDOC_VERSION)}), '\n')
+io.stdout:flush()
+for line in io.lines() do
+  local ok, result = pcall(function() return handle(pandoc.json.decode(line, false)) end)
+  if not ok then result = {ok = false, error = tostring(result)} end
+  io.stdout:write(pandoc.json.encode(result), '\n')
+  io.stdout:flush()
+end
+"""
+
+class PandocWorker:
+    """
+    Long-lived `pandoc lua` process that converts one document per request.
+
+    Requests and responses are single JSON lines over stdin/stdout, so a batch
+    of small Markdown/HTML files pays the pandoc startup cost once. Text
+    inputs are read here and sent inline; binary inputs and outputs are read
+    and written by pandoc directly. Images referenced by the document are
+    fetched relative to the caller's working directory, as the pandoc CLI
+    does, and embedded in binary outputs. The worker converts one document
+    at a time: a caller that finds it busy gets an error right away (and
+    falls back to the CLI), and a request still unanswered after timeout
+    seconds kills the process. The process exits on its own when stdin
+    closes, including when the owning (pool worker) process dies.
+    """
+
+    def __init__(self, pandoc_path=None, timeout=PANDOC_WORKER_TIMEOUT):
+        self.pandoc_path = pandoc_path
+        self.timeout = timeout
+        self.process = None
+        self.disabled = False
+        self.lock = threading.Lock()
+
+    def _start(self):
+        try:
+            process = subprocess.Popen(
+                [self.pandoc_path or pypandoc.get_pandoc_path(), 'lua', '-e', PANDOC_WORKER_SCRIPT],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, encoding='utf-8'
+            )
+        except (OSError, RuntimeError) as e:
+            self.disabled = True
+            raise RuntimeError(f"pandoc 워커를 시작할 수 없습니다: {e}")
+        try:
+            ready = json.loads(process.stdout.readline()).get('ready')
+        except ValueError:
+            ready = False
+        if not ready:
+            # `pandoc lua`나 pandoc.json이 없는 구버전 pandoc
+            process.kill()
+            process.wait()
+            self.disabled = True
+            raise RuntimeError("pandoc 워커를 지원하지 않는 pandoc 버전입니다")
+        self.process = process
+
+    def convert(self, source_path, to_format, output_path):
+        """Convert source_path to output_path (input format from the extension)"""
+        from_format = pypandoc.normalize_format(os.path.splitext(source_path)[1].strip('.').lower())
+        if from_format in PANDOC_BINARY_FORMATS:
+            self._convert({'input': os.path.abspath(source_path)}, from_format, to_format, output_path)
+        else:
+            with open(source_path, 'r', encoding='utf-8') as f:
+                self._convert({'text': f.read()}, from_format, to_format, output_path)
+
+    def convert_text(self, text, from_format, to_format, output_path):
+        """Convert in-memory text to output_path without staging an input file"""
+        self._convert({'text': text}, pypandoc.normalize_format(from_format), to_format, output_path)
+
+    def _convert(self, request, from_format, to_format, output_path):
+        if self.disabled:
+            raise RuntimeError("pandoc 워커를 사용할 수 없습니다")
+        to_format = pypandoc.normalize_format(to_format)
+        request.update({'from': from_format, 'to': to_format, 'cwd': os.getcwd()})
+        if to_format in PANDOC_BINARY_FORMATS:
+            request['output'] = os.path.abspath(output_path)
+
+        # 다른 스레드가 변환 중이면 기다리지 않고 CLI로 넘김 (모든 변환이 pandoc 하나에 줄 서지 않게 함)
+        if not self.lock.acquire(blocking=False):
+            raise RuntimeError("pandoc 워커가 다른 문서를 변환 중입니다")
+        try:
+            if self.process is None or self.process.poll() is not None:
+                self._start()
+            process = self.process
+            # 응답이 없으면 프로세스를 종료해 readline이 빈 줄을 반환하게 함
+            timer = threading.Timer(self.timeout, process.kill)
+            timer.daemon = True
+            timer.start()
+            try:
+                process.stdin.write(json.dumps(request) + '\n')
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except OSError:
+                line = ''
+            finally:
+                timer.cancel()
+            if not line:
+                self.process = None
+                process.kill()
+                process.wait()
+                raise RuntimeError("pandoc 워커가 응답하지 않거나 비정상 종료되었습니다")
+        finally:
+            self.lock.release()
+
+        response = json.loads(line)
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', 'pandoc 변환 실패'))
+        if 'output' in response:
+            output = response['output']
+            # pandoc CLI처럼 텍스트 출력은 줄바꿈으로 끝냄
+            if output and not output.endswith('\n'):
+                output += '\n'
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(output)
+
+    def close(self):
+        with self.lock:
+            if self.process is not None:
+                with contextlib.suppress(OSError):
+                    self.process.stdin.close()
+                try:
+                    self.process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+                self.process = None
+
+_pandoc_worker = None
+_pandoc_worker_lock = threading.Lock()
+
+def get_pandoc_worker():
+    """프로세스 공용 pandoc 워커 (사용하지 않으면 None)"""
+    global _pandoc_worker
+    if os.environ.get(PANDOC_WORKER_ENV, '').lower() == 'off':
+        return None
+    with _pandoc_worker_lock:
+        if _pandoc_worker is None:
+            _pandoc_worker = PandocWorker()
+            atexit.register(_pandoc_worker.close)
+        return _pandoc_worker
+
+def pandoc_convert_file(source_path, to_format, output_path):
+    """pandoc 변환 (상주 워커 우선, 안 되면 pypandoc으로 pandoc을 한 번 실행)"""
+    # PDF는 외부 엔진(LaTeX 등)이 필요하므로 항상 pandoc CLI 사용
+    worker = get_pandoc_worker() if to_format != 'pdf' else None
+    if worker is not None and not worker.disabled:
+        try:
+            with span('pandoc.worker', cat='document', to=to_format):
+                worker.convert(source_path, to_format, output_path)
+            return
+        except Exception:
+            # CLI로 다시 시도해 기존과 같은 결과/오류 메시지를 얻음
+            pass
+    with span('pandoc.cli', cat='document', to=to_format):
+        pypandoc.convert_file(source_path, to_format, outputfile=output_path)
+
+def pandoc_convert_text(text, from_format, to_format, output_path):
+    """메모리의 텍스트를 임시 파일 없이 pandoc으로 변환 (CLI는 stdin으로 전달)"""
+    worker = get_pandoc_worker() if to_format != 'pdf' else None
+    if worker is not None and not worker.disabled:
+        try:
+            with span('pandoc.worker', cat='document', to=to_format):
+                worker.convert_text(text, from_format, to_format, output_path)
+            return
+        except Exception:
+            pass
+    with span('pandoc.cli', cat='document', to=to_format):
+        pypandoc.convert_text(text, to_format, format=from_format, outputfile=output_path)
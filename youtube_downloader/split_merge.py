@@ -0,0 +1,478 @@
+"""
+Split / merge
+Splitting media by duration or segment count, merging and incremental appending
+"""
+
+import os
+import subprocess
+import datetime
+import json
+import shutil
+import threading
+
+from .media import commit_output, get_media_duration, job_scratch_dir, run_ffmpeg, write_concat_list
+from .metrics import timed_operation
+from .tracing import span
+
+# 합치기 결과 호환성 판단에 쓰는 스트림 파라미터
+MERGE_STREAM_KEYS = ('codec_type', 'codec_name', 'width', 'height', 'pix_fmt', 'sample_rate', 'channels')
+
+# 바이트 단위로 이어붙여도 유효한 컨테이너 (MPEG-TS/PS)
+BYTE_APPENDABLE_EXTS = ('.ts', '.mts', '.m2ts', '.mpg', '.mpeg')
+
+# 같은 출력에 대한 이어붙이기를 한 번에 하나씩 실행 (출력 절대 경로 → 잠금)
+_append_locks = {}
+_append_locks_guard = threading.Lock()
+
+def _append_lock(output_file):
+    with _append_locks_guard:
+        return _append_locks.setdefault(os.path.abspath(output_file), threading.Lock())
+
+def get_media_stream_info(input_file):
+    """
+    Get per-stream parameters (codec, resolution, sample rate...) using ffprobe.
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-show_entries', 'stream=' + ','.join(MERGE_STREAM_KEYS),
+        '-of', 'json',
+        input_file
+    ]
+    try:
+        with span('ffprobe', cat='media', input=os.path.basename(input_file)):
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        streams = json.loads(result.stdout).get('streams', [])
+        return [{key: stream.get(key) for key in MERGE_STREAM_KEYS} for stream in streams]
+    except (subprocess.CalledProcessError, ValueError):
+        return None
+
+def parse_time_to_seconds(hours, minutes, seconds):
+    """
+    Convert hours, minutes, seconds to total seconds.
+    """
+    try:
+        h = int(hours) if hours else 0
+        m = int(minutes) if minutes else 0
+        s = int(seconds) if seconds else 0
+        return h * 3600 + m * 60 + s
+    except ValueError:
+        return None
+
+@timed_operation('split')
+def split_media_by_segments(input_file, num_segments, output_dir, log_callback, status_callback, progress_callback=None, checkpoint=None):
+    """
+    Split media file into specified number of segments using ffmpeg.
+    Segments already recorded in checkpoint (see JobCheckpoint) are skipped.
+    """
+    if not os.path.exists(input_file):
+        log_callback(f"입력 파일이 존재하지 않습니다: {input_file}")
+        return False, "입력 파일이 존재하지 않습니다"
+    
+    # Get total duration
+    total_duration = get_media_duration(input_file)
+    if total_duration is None:
+        log_callback(f"미디어 파일의 길이를 가져올 수 없습니다: {input_file}")
+        return False, "미디어 파일의 길이를 가져올 수 없습니다"
+    
+    # Calculate segment duration
+    segment_duration = total_duration / num_segments
+    log_callback(f"총 길이: {total_duration:.2f}초, {num_segments}개 구간으로 분할")
+    log_callback(f"각 구간 길이: {segment_duration:.2f}초")
+    
+    # Create output directory if it doesn't exist
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    
+    # Get file info for naming
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+    file_ext = os.path.splitext(input_file)[1]
+    
+    successful = 0
+    failed = 0
+    
+    with job_scratch_dir("split") as scratch:
+        for i in range(num_segments):
+            start_time = i * segment_duration
+            # For the last segment, use remaining duration to avoid cutting off
+            if i == num_segments - 1:
+                duration = total_duration - start_time
+            else:
+                duration = segment_duration
+                
+            output_file = os.path.join(output_dir, f"{base_name}_part{i+1:03d}{file_ext}")
+            temp_output = os.path.join(scratch, os.path.basename(output_file))
+            
+            cmd = [
+                'ffmpeg',
+                '-y',  # overwrite
+                '-i', input_file,
+                '-ss', str(start_time),
+                '-t', str(duration),
+                '-c', 'copy',  # copy codec for faster processing
+                temp_output
+            ]
+            
+            if checkpoint and checkpoint.is_done(output_file):
+                log_callback(f"구간 {i+1} 이전 실행에서 완료됨, 건너뜀: {output_file}")
+                if progress_callback:
+                    progress_callback(i+1, num_segments)
+                successful += 1
+                continue
+            
+            try:
+                log_callback(f"구간 {i+1}/{num_segments} 분할 중... ({start_time:.1f}s ~ {start_time + duration:.1f}s)")
+                status_callback(f"분할 중 ({i+1}/{num_segments})...")
+                
+                if progress_callback:
+                    progress_callback(i+1, num_segments)
+                
+                run_ffmpeg(cmd, wait_callback=log_callback)
+                commit_output(temp_output, output_file)
+                if checkpoint:
+                    checkpoint.mark_done(output_file, output_file)
+                log_callback(f"구간 {i+1} 완료: {output_file}")
+                successful += 1
+                
+            except (subprocess.CalledProcessError, OSError) as e:
+                log_callback(f"구간 {i+1} 분할 실패: {e}")
+                failed += 1
+    
+    log_callback(f"\n분할 완료! 성공: {successful}, 실패: {failed}")
+    status_callback(f"분할 완료! (성공: {successful}, 실패: {failed})")
+    
+    return failed == 0, f"성공: {successful}, 실패: {failed}"
+
+@timed_operation('split')
+def split_media_by_duration(input_file, segment_duration, output_dir, log_callback, status_callback, progress_callback=None, checkpoint=None):
+    """
+    Split media file into segments of specified duration using ffmpeg.
+    Segments already recorded in checkpoint (see JobCheckpoint) are skipped.
+    """
+    if not os.path.exists(input_file):
+        log_callback(f"입력 파일이 존재하지 않습니다: {input_file}")
+        return False, "입력 파일이 존재하지 않습니다"
+    
+    # Get total duration
+    total_duration = get_media_duration(input_file)
+    if total_duration is None:
+        log_callback(f"미디어 파일의 길이를 가져올 수 없습니다: {input_file}")
+        return False, "미디어 파일의 길이를 가져올 수 없습니다"
+    
+    # Calculate number of segments
+    num_segments = int((total_duration + segment_duration - 1) // segment_duration)
+    log_callback(f"총 길이: {total_duration:.2f}초, 분할 길이: {segment_duration}초")
+    log_callback(f"총 {num_segments}개 구간으로 분할됩니다.")
+    
+    # Create output directory if it doesn't exist
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    
+    # Get file info for naming
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+    file_ext = os.path.splitext(input_file)[1]
+    
+    successful = 0
+    failed = 0
+    
+    with job_scratch_dir("split") as scratch:
+        for i in range(num_segments):
+            start_time = i * segment_duration
+            output_file = os.path.join(output_dir, f"{base_name}_part{i+1:03d}{file_ext}")
+            temp_output = os.path.join(scratch, os.path.basename(output_file))
+            
+            cmd = [
+                'ffmpeg',
+                '-y',  # overwrite
+                '-i', input_file,
+                '-ss', str(start_time),
+                '-t', str(segment_duration),
+                '-c', 'copy',  # copy codec for faster processing
+                temp_output
+            ]
+            
+            if checkpoint and checkpoint.is_done(output_file):
+                log_callback(f"구간 {i+1} 이전 실행에서 완료됨, 건너뜀: {output_file}")
+                if progress_callback:
+                    progress_callback(i+1, num_segments)
+                successful += 1
+                continue
+            
+            try:
+                log_callback(f"구간 {i+1}/{num_segments} 분할 중... ({start_time:.1f}s ~ {start_time + segment_duration:.1f}s)")
+                status_callback(f"분할 중 ({i+1}/{num_segments})...")
+                
+                if progress_callback:
+                    progress_callback(i+1, num_segments)
+                
+                run_ffmpeg(cmd, wait_callback=log_callback)
+                commit_output(temp_output, output_file)
+                if checkpoint:
+                    checkpoint.mark_done(output_file, output_file)
+                log_callback(f"구간 {i+1} 완료: {output_file}")
+                successful += 1
+                
+            except (subprocess.CalledProcessError, OSError) as e:
+                log_callback(f"구간 {i+1} 분할 실패: {e}")
+                failed += 1
+    
+    log_callback(f"\n분할 완료! 성공: {successful}, 실패: {failed}")
+    status_callback(f"분할 완료! (성공: {successful}, 실패: {failed})")
+    
+    return failed == 0, f"성공: {successful}, 실패: {failed}"
+
+@timed_operation('merge')
+def merge_media_files(input_files, output_file, log_callback, status_callback, progress_callback=None):
+    """
+    Merge multiple media files into one using ffmpeg.
+    """
+    if len(input_files) < 2:
+        log_callback("합칠 파일이 최소 2개 이상 필요합니다.")
+        return False, "합칠 파일이 최소 2개 이상 필요합니다."
+    
+    for input_file in input_files:
+        if not os.path.exists(input_file):
+            log_callback(f"파일이 존재하지 않습니다: {input_file}")
+            return False, f"파일이 존재하지 않습니다: {input_file}"
+    
+    try:
+        # 작업마다 별도 임시 폴더를 써서 동시에 실행되는 합치기끼리 충돌하지 않음
+        with job_scratch_dir("merge") as scratch:
+            temp_list_file = os.path.join(scratch, "merge_list.txt")
+            temp_output = os.path.join(scratch, "output" + os.path.splitext(output_file)[1])
+            write_concat_list(temp_list_file, input_files)
+            
+            log_callback(f"총 {len(input_files)}개 파일을 합칩니다.")
+            log_callback(f"출력 파일: {output_file}")
+            
+            # FFmpeg command to concatenate files
+            cmd = [
+                'ffmpeg',
+                '-y',  # overwrite output file
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', temp_list_file,
+                '-c', 'copy',  # copy streams without re-encoding for speed
+                temp_output
+            ]
+            
+            status_callback("미디어 파일 합치는 중...")
+            if progress_callback:
+                progress_callback(1, 1)
+            
+            log_callback("합치기 시작...")
+            run_ffmpeg(cmd, wait_callback=log_callback)
+            commit_output(temp_output, output_file)
+        
+        log_callback(f"합치기 완료: {output_file}")
+        status_callback("합치기 완료!")
+        
+        # 이후 증분 이어붙이기를 위해 매니페스트 기록
+        write_merge_manifest(output_file, input_files, get_media_stream_info(output_file))
+        
+        if progress_callback:
+            progress_callback(1, 1)
+        
+        return True, output_file
+        
+    except subprocess.CalledProcessError as e:
+        error_msg = f"합치기 실패: {e.stderr if e.stderr else str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+    except Exception as e:
+        error_msg = f"합치기 중 오류 발생: {str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+
+def get_merge_manifest_path(output_file):
+    """
+    Path of the sidecar manifest describing what a merged output contains.
+    """
+    return f"{output_file}.merge.json"
+
+def _merge_part_record(input_file):
+    stat = os.stat(input_file)
+    return {
+        'path': os.path.abspath(input_file),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+    }
+
+def load_merge_manifest(output_file):
+    """
+    Load the sidecar manifest of a merged output, or None if there is none.
+    """
+    manifest_path = get_merge_manifest_path(output_file)
+    if not os.path.exists(manifest_path):
+        return None
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_merge_manifest(output_file, input_files, streams, previous_parts=None, append_from_size=None):
+    """
+    Record the parts and stream parameters of a merged output next to it.
+
+    append_from_size marks a byte append in progress: the output size
+    before the append, which the next append truncates back to if the
+    process died before the manifest listed the new parts. Writing such a
+    marker raises OSError on failure instead of ignoring it.
+    """
+    parts = list(previous_parts or [])
+    parts.extend(_merge_part_record(input_file) for input_file in input_files)
+    manifest = {
+        'version': 1,
+        'output': os.path.abspath(output_file),
+        'streams': streams,
+        'parts': parts,
+        'updated': datetime.datetime.now().isoformat(timespec='seconds'),
+    }
+    if append_from_size is not None:
+        manifest['append_from_size'] = append_from_size
+    manifest_path = get_merge_manifest_path(output_file)
+    temp_manifest = manifest_path + ".tmp"
+    try:
+        with open(temp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(temp_manifest, manifest_path)
+    except OSError:
+        if append_from_size is not None:
+            raise
+    return manifest
+
+@timed_operation('append')
+def append_media_files(output_file, new_files, log_callback, status_callback, progress_callback=None):
+    """
+    Incrementally append new parts to an existing merged output.
+
+    Parts already listed in the sidecar manifest are skipped, and new parts
+    must match the stream parameters recorded for the output. Only MPEG-TS/PS
+    outputs (.ts, .mts, .m2ts, .mpg, .mpeg) are extended in place by byte
+    append, so the time depends only on the new parts. MP4 and MKV outputs,
+    including the GUI's default .mp4, are NOT appended incrementally: they
+    keep their index in the file and are remuxed from the whole existing
+    output plus the new parts, which takes time proportional to the output
+    size; the log says so when that path is taken.
+
+    Appends to the same output run one at a time. Before a byte append the
+    manifest records the current output size, so an append interrupted by
+    a crash is truncated away on the next run instead of being duplicated.
+    """
+    with _append_lock(output_file):
+        return _append_media_files(output_file, new_files, log_callback, status_callback, progress_callback)
+
+def _append_media_files(output_file, new_files, log_callback, status_callback, progress_callback):
+    if not os.path.exists(output_file):
+        log_callback(f"이어붙일 기존 파일이 존재하지 않습니다: {output_file}")
+        return False, f"이어붙일 기존 파일이 존재하지 않습니다: {output_file}"
+    
+    manifest = load_merge_manifest(output_file)
+    if manifest is not None and manifest.get('append_from_size') is not None:
+        # 지난 이어붙이기가 매니페스트를 갱신하기 전에 중단됨: 추가된 바이트를 버림
+        append_from_size = manifest['append_from_size']
+        if os.path.getsize(output_file) > append_from_size:
+            log_callback(f"이전 이어붙이기가 끝나지 않아 출력을 원래 크기({append_from_size} bytes)로 되돌립니다.")
+            os.truncate(output_file, append_from_size)
+        write_merge_manifest(output_file, [], manifest.get('streams'), manifest.get('parts', []))
+    if manifest is None:
+        log_callback("매니페스트가 없어 기존 출력 파일의 스트림 정보로 새로 만듭니다.")
+        streams = get_media_stream_info(output_file)
+        included_parts = []
+    else:
+        streams = manifest.get('streams')
+        included_parts = manifest.get('parts', [])
+    
+    if not streams:
+        log_callback(f"기존 출력 파일의 스트림 정보를 가져올 수 없습니다: {output_file}")
+        return False, "기존 출력 파일의 스트림 정보를 가져올 수 없습니다"
+    
+    included = {(p['path'], p['size'], p['mtime']) for p in included_parts}
+    pending_files = []
+    for input_file in new_files:
+        if not os.path.exists(input_file):
+            log_callback(f"파일이 존재하지 않습니다: {input_file}")
+            return False, f"파일이 존재하지 않습니다: {input_file}"
+        record = _merge_part_record(input_file)
+        if (record['path'], record['size'], record['mtime']) in included:
+            log_callback(f"이미 포함된 파일 건너뜀: {input_file}")
+            continue
+        if os.path.abspath(input_file) == os.path.abspath(output_file):
+            continue
+        part_streams = get_media_stream_info(input_file)
+        if part_streams != streams:
+            log_callback(f"스트림 형식이 기존 출력과 다릅니다: {input_file}")
+            return False, f"스트림 형식이 기존 출력과 다릅니다: {input_file}"
+        pending_files.append(input_file)
+    
+    if not pending_files:
+        log_callback("추가할 새 파일이 없습니다.")
+        status_callback("이어붙이기 완료!")
+        return True, output_file
+    
+    log_callback(f"{len(pending_files)}개 파일을 기존 출력에 이어붙입니다: {output_file}")
+    status_callback("미디어 파일 이어붙이는 중...")
+    
+    output_ext = os.path.splitext(output_file)[1].lower()
+    total_files = len(pending_files)
+    original_size = os.path.getsize(output_file)
+    try:
+        if output_ext in BYTE_APPENDABLE_EXTS:
+            # MPEG-TS/PS는 바이트 이어붙이기만으로 유효한 스트림이 됨
+            write_merge_manifest(output_file, [], streams, included_parts, append_from_size=original_size)
+            with open(output_file, 'ab') as out:
+                for i, input_file in enumerate(pending_files, 1):
+                    if progress_callback:
+                        progress_callback(i, total_files)
+                    with open(input_file, 'rb') as src:
+                        shutil.copyfileobj(src, out, 1024 * 1024)
+                    log_callback(f"[{i}/{total_files}] 추가 완료: {input_file}")
+        else:
+            # 인덱스를 파일 안에 두는 컨테이너는 기존 출력 전체를 다시 써야 함
+            log_callback(
+                f"{output_ext} 출력은 바로 이어붙일 수 없어 기존 출력 전체({original_size / (1024 * 1024):.1f}MB)를 다시 씁니다. "
+                f"자주 이어붙이는 출력은 .ts 형식을 쓰면 새 파일만큼만 시간이 걸립니다."
+            )
+            status_callback("기존 출력 전체를 다시 쓰는 중...")
+            with job_scratch_dir("append") as scratch:
+                temp_list_file = os.path.join(scratch, "append_list.txt")
+                temp_output = os.path.join(scratch, "output" + output_ext)
+                write_concat_list(temp_list_file, [output_file] + pending_files)
+                
+                cmd = [
+                    'ffmpeg',
+                    '-y',
+                    '-f', 'concat',
+                    '-safe', '0',
+                    '-i', temp_list_file,
+                    '-map', '0',
+                    '-c', 'copy',
+                    temp_output
+                ]
+                if progress_callback:
+                    progress_callback(1, 2)
+                run_ffmpeg(cmd, wait_callback=log_callback)
+                commit_output(temp_output, output_file)
+            if progress_callback:
+                progress_callback(2, 2)
+        
+        write_merge_manifest(output_file, pending_files, streams, included_parts)
+        log_callback(f"이어붙이기 완료: {output_file}")
+        status_callback("이어붙이기 완료!")
+        return True, output_file
+    
+    except subprocess.CalledProcessError as e:
+        error_msg = f"이어붙이기 실패: {e.stderr if e.stderr else str(e)}"
+        log_callback(error_msg)
+        return False, error_msg
+    except Exception as e:
+        error_msg = f"이어붙이기 중 오류 발생: {str(e)}"
+        log_callback(error_msg)
+        if output_ext in BYTE_APPENDABLE_EXTS:
+            # 일부만 추가된 상태로 남지 않도록 원래 크기로 되돌림
+            try:
+                os.truncate(output_file, original_size)
+            except OSError:
+                pass
+        return False, error_msg
@@ -0,0 +1,189 @@
+"""
+Tracing
+Opt-in per-stage spans written as Chrome trace-event JSON
+(open the file in chrome://tracing or https://ui.perfetto.dev)
+
+    TRACE_FILE=/tmp/batch.trace.json python job_server.py
+
+Spans are recorded for jobs (queue wait and run), operations, ffprobe,
+ffmpeg, pandoc, PDF page extraction, document extract/write and GUI log
+handling, on every thread. Worker processes (document batches, parallel
+PDF extraction) append their spans to part files next to TRACE_FILE; the
+process that enabled tracing merges them into TRACE_FILE when it exits or
+when write_trace() is called. When TRACE_FILE is unset span() is a no-op.
+"""
+
+import os
+import sys
+import threading
+import time
+import json
+import contextlib
+import atexit
+import shutil
+
+TRACE_FILE_ENV = 'TRACE_FILE'
+# 추적을 켠 프로세스가 만든 조각 폴더 (워커 프로세스가 환경 변수로 물려받음)
+TRACE_PARTS_ENV = 'TRACE_PARTS_DIR'
+TRACE_FLUSH_EVENTS = 1000   # 버퍼가 이만큼 쌓이면 가장 바깥 구간이 끝나기 전에도 기록
+
+_NULL_SPAN = contextlib.nullcontext()
+
+class Tracer:
+    """
+    Collect trace events of one process and append them to its part file.
+
+    Events are buffered and written when the outermost span of a thread
+    ends (or the buffer is full), so a pool worker has written its spans
+    before the parent sees its result.
+    """
+
+    def __init__(self, parts_dir, trace_file=None, process_name=None):
+        self.parts_dir = parts_dir
+        self.trace_file = trace_file  # 병합 결과를 쓸 경로 (추적을 켠 프로세스만)
+        self.pid = os.getpid()
+        self.events = []
+        self.named_threads = set()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self._add_metadata('process_name', 0, process_name or os.path.basename(sys.argv[0]) or 'python')
+
+    def _add_metadata(self, name, tid, value):
+        self.events.append({'name': name, 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': value}})
+
+    def add_complete(self, name, cat, start_us, duration_us, args=None):
+        """Record a finished span ("X" event) on the current thread"""
+        tid = threading.get_native_id()
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': start_us, 'dur': duration_us, 'pid': self.pid, 'tid': tid}
+        if args:
+            event['args'] = {key: value if isinstance(value, (int, float, bool)) else str(value) for key, value in args.items()}
+        with self.lock:
+            if tid not in self.named_threads:
+                self.named_threads.add(tid)
+                self._add_metadata('thread_name', tid, threading.current_thread().name)
+            self.events.append(event)
+            full = len(self.events) >= TRACE_FLUSH_EVENTS
+        if full:
+            self.flush()
+
+    @contextlib.contextmanager
+    def span(self, name, cat, args):
+        depth = getattr(self.local, 'depth', 0)
+        self.local.depth = depth + 1
+        start_us = time.time_ns() // 1000
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.local.depth = depth
+            self.add_complete(name, cat, start_us, (time.perf_counter_ns() - start) // 1000, args)
+            if depth == 0:
+                self.flush()
+
+    def flush(self):
+        with self.lock:
+            events, self.events = self.events, []
+            if not events:
+                return
+            try:
+                os.makedirs(self.parts_dir, exist_ok=True)
+                with open(os.path.join(self.parts_dir, f"{self.pid}.jsonl"), 'a', encoding='utf-8') as f:
+                    f.writelines(json.dumps(event, ensure_ascii=False) + '\n' for event in events)
+            except OSError:
+                pass  # 추적 실패가 작업을 멈추지 않게 함
+
+    def write_trace(self):
+        """Merge every process's part file into trace_file (Chrome JSON object format)"""
+        self.flush()
+        events = []
+        with self.lock:
+            try:
+                part_names = sorted(os.listdir(self.parts_dir))
+            except OSError:
+                part_names = []
+            for part_name in part_names:
+                with open(os.path.join(self.parts_dir, part_name), 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            events.append(json.loads(line))
+                        except ValueError:
+                            pass  # 강제 종료된 워커가 남긴 잘린 줄
+            temp_path = f"{self.trace_file}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+            os.replace(temp_path, self.trace_file)
+        return len(events)
+
+    def close(self):
+        try:
+            self.write_trace()
+        except OSError:
+            pass
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+
+_tracer = None
+_tracer_pid = None
+_tracer_lock = threading.Lock()
+
+def get_tracer():
+    """이 프로세스의 Tracer (TRACE_FILE이 없으면 None)"""
+    global _tracer, _tracer_pid
+    pid = os.getpid()
+    if _tracer_pid == pid:
+        return _tracer
+    with _tracer_lock:
+        if _tracer_pid != pid:
+            # fork된 워커는 부모의 Tracer를 물려받으므로 프로세스마다 새로 만듦
+            parts_dir = os.environ.get(TRACE_PARTS_ENV)
+            trace_file = os.environ.get(TRACE_FILE_ENV)
+            if not (parts_dir or trace_file):
+                _tracer = None
+            elif _is_worker_process():
+                _tracer = Tracer(parts_dir, process_name=f"worker {pid}") if parts_dir else None
+            elif trace_file:
+                parts_dir = f"{trace_file}.{pid}.parts"
+                os.environ[TRACE_PARTS_ENV] = parts_dir
+                _tracer = Tracer(parts_dir, trace_file)
+                atexit.register(_tracer.close)
+            else:
+                _tracer = None
+            _tracer_pid = pid
+        return _tracer
+
+def _is_worker_process():
+    import multiprocessing
+    return multiprocessing.parent_process() is not None
+
+def span(name, cat='stage', **args):
+    """Context manager recording a span; args are shown in the trace viewer"""
+    tracer = get_tracer()
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, cat, args)
+
+def traced_iter(name, iterable, cat='stage'):
+    """Yield from iterable, recording each step of a streaming producer as a span"""
+    if get_tracer() is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        with span(name, cat):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+def add_complete_span(name, cat, start_time, end_time, **args):
+    """Record a span whose start/end (time.time() values) were measured elsewhere"""
+    tracer = get_tracer()
+    if tracer is not None and start_time is not None and end_time is not None:
+        tracer.add_complete(name, cat, int(start_time * 1_000_000), int((end_time - start_time) * 1_000_000), args)
+
+def write_trace():
+    """Write TRACE_FILE now (returns the number of events, None if tracing is off)"""
+    tracer = get_tracer()
+    if tracer is None or tracer.trace_file is None:
+        return None
+    return tracer.write_trace()
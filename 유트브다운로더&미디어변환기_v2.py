@@ -1,22 +1,51 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import yt_dlp
 import os
 import sys
 import subprocess
 from pathlib import Path
-import threading
-import re
-import tempfile
 import datetime
-from docx import Document
-from pptx import Presentation
-from pptx.util import Inches
-import PyPDF2
-import markdown
-import pypandoc
-from PIL import Image
-import io
+from collections import deque
+import multiprocessing
+import queue
+import sqlite3
+import logging
+import logging.handlers
+
+from youtube_downloader.download import download_youtube
+from youtube_downloader.media import (
+    convert_media,
+    convert_media_batch,
+    convert_media_chunked,
+    convert_media_distributed,
+    get_transcode_workers,
+)
+from youtube_downloader.split_merge import (
+    append_media_files,
+    merge_media_files,
+    parse_time_to_seconds,
+    split_media_by_duration,
+    split_media_by_segments,
+)
+from youtube_downloader.documents import convert_document, convert_documents_batch, find_documents
+from youtube_downloader.jobs import (
+    JOB_PRIORITY_HIGH,
+    JOB_PRIORITY_LOW,
+    JOB_PRIORITY_NAMES,
+    JOB_PRIORITY_NORMAL,
+    JOB_RESOURCE_NAMES,
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_DONE,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JobCheckpoint,
+    JobScheduler,
+    JobStore,
+    get_job_db_path,
+)
+from youtube_downloader.metrics import start_metrics_exporters
+from youtube_downloader.tracing import span
 
 # Load environment variables and Git helper
 try:
@@ -29,922 +58,74 @@ try:
 except ImportError:
     GIT_HELPER_AVAILABLE = False
 
-def download_youtube(url, output_dir, format_type, log_callback, status_callback):
-    """
-    Download YouTube video as mp4 or mp3.
-    """
-    ydl_opts = {
-        'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s'),
-    }
-    if format_type == 'mp3':
-        ydl_opts.update({
-            'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-        })
-    else:  # mp4
-        ydl_opts['format'] = 'best[ext=mp4]'
+# GUI 작업 종류 → 스케줄러 자원 종류 (분할/합치기는 스트림 복사라 디스크 위주)
+GUI_JOB_RESOURCES = {
+    "다운로드": 'network',
+    "변환": 'cpu',
+    "배치 변환": 'cpu',
+    "분할": 'disk',
+    "합치기": 'disk',
+    "문서 변환": 'cpu',
+    "문서 일괄 변환": 'cpu',
+}
+
+# GUI 작업 종류 → 진행률 표시줄이 있는 탭 (재개한 작업은 탭을 먼저 만들어야 함)
+GUI_JOB_TABS = {
+    "다운로드": 'tab1',
+    "변환": 'tab2',
+    "배치 변환": 'tab2',
+    "분할": 'tab3',
+    "합치기": 'tab4',
+    "문서 변환": 'tab5',
+    "문서 일괄 변환": 'tab5',
+}
+
+# 항목별 진행 상황을 저장해 재시작 시 끝난 항목을 건너뛰는 GUI 작업 메서드
+GUI_CHECKPOINT_JOBS = ('_convert_media_batch', '_split_video_by_duration', '_split_video_by_segments', '_convert_documents_batch')
+
+# 작업 스레드 → Tk 스레드 이벤트 큐 처리 주기 (ms)와 한 번에 처리할 최대 이벤트 수
+UI_EVENT_INTERVAL_MS = 50
+UI_EVENT_BATCH_LIMIT = 5000
+
+# 로그 창에 남길 최대 줄 수 / 전체 로그 파일 (파일은 크기 기준으로 회전, "off"면 기록 안 함)
+LOG_MAX_LINES_ENV = 'LOG_MAX_LINES'
+LOG_FILE_ENV = 'LOG_FILE'
+DEFAULT_LOG_MAX_LINES = 2000
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+LOG_MAX_JOBS = 50           # 작업별 필터용 로그를 보관할 최근 작업 수
+LOG_FILTER_ALL = "전체"
+
+job_logger = logging.getLogger("youtube_downloader.jobs")
+
+def get_log_max_lines():
+    """로그 창 최대 줄 수"""
     try:
-        log_callback(f"다운로드 시작: {url}")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-        log_callback("다운로드 완료!")
-        status_callback("다운로드 완료!")
-        messagebox.showinfo("완료", "다운로드가 완료되었습니다!")
-    except Exception as e:
-        log_callback(f"다운로드 오류: {e}")
-        status_callback("다운로드 오류")
-        messagebox.showerror("오류", str(e))
-    finally:
-        status_callback("대기 중...")
-
-def convert_media(input_file, output_ext, log_callback):
-    """
-    Convert media file to another format using ffmpeg.
-    """
-    base = os.path.splitext(input_file)[0]
-    output_file = f"{base}.{output_ext}"
-    cmd = [
-        'ffmpeg',
-        '-y',  # overwrite
-        '-i', input_file,
-        output_file
-    ]
-    try:
-        log_callback(f"변환 시작: {input_file} → {output_file}")
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        log_callback(f"변환 완료: {output_file}")
-        return True, output_file
-    except subprocess.CalledProcessError as e:
-        log_callback(f"변환 실패: {e}")
-        return False, str(e)
-
-def get_media_duration(input_file):
-    """
-    Get media file duration in seconds using ffprobe.
-    """
-    cmd = [
-        'ffprobe',
-        '-v', 'quiet',
-        '-show_entries', 'format=duration',
-        '-of', 'default=noprint_wrappers=1:nokey=1',
-        input_file
-    ]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        duration = float(result.stdout.strip())
-        return duration
-    except (subprocess.CalledProcessError, ValueError):
-        return None
-
-def parse_time_to_seconds(hours, minutes, seconds):
-    """
-    Convert hours, minutes, seconds to total seconds.
-    """
-    try:
-        h = int(hours) if hours else 0
-        m = int(minutes) if minutes else 0
-        s = int(seconds) if seconds else 0
-        return h * 3600 + m * 60 + s
+        return max(100, int(os.environ.get(LOG_MAX_LINES_ENV, DEFAULT_LOG_MAX_LINES)))
     except ValueError:
-        return None
+        return DEFAULT_LOG_MAX_LINES
 
-def split_media_by_segments(input_file, num_segments, output_dir, log_callback, status_callback, progress_callback=None):
-    """
-    Split media file into specified number of segments using ffmpeg.
-    """
-    if not os.path.exists(input_file):
-        log_callback(f"입력 파일이 존재하지 않습니다: {input_file}")
-        return False, "입력 파일이 존재하지 않습니다"
-    
-    # Get total duration
-    total_duration = get_media_duration(input_file)
-    if total_duration is None:
-        log_callback(f"미디어 파일의 길이를 가져올 수 없습니다: {input_file}")
-        return False, "미디어 파일의 길이를 가져올 수 없습니다"
-    
-    # Calculate segment duration
-    segment_duration = total_duration / num_segments
-    log_callback(f"총 길이: {total_duration:.2f}초, {num_segments}개 구간으로 분할")
-    log_callback(f"각 구간 길이: {segment_duration:.2f}초")
-    
-    # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Get file info for naming
-    base_name = os.path.splitext(os.path.basename(input_file))[0]
-    file_ext = os.path.splitext(input_file)[1]
-    
-    successful = 0
-    failed = 0
-    
-    for i in range(num_segments):
-        start_time = i * segment_duration
-        # For the last segment, use remaining duration to avoid cutting off
-        if i == num_segments - 1:
-            duration = total_duration - start_time
-        else:
-            duration = segment_duration
-            
-        output_file = os.path.join(output_dir, f"{base_name}_part{i+1:03d}{file_ext}")
-        
-        cmd = [
-            'ffmpeg',
-            '-y',  # overwrite
-            '-i', input_file,
-            '-ss', str(start_time),
-            '-t', str(duration),
-            '-c', 'copy',  # copy codec for faster processing
-            output_file
-        ]
-        
-        try:
-            log_callback(f"구간 {i+1}/{num_segments} 분할 중... ({start_time:.1f}s ~ {start_time + duration:.1f}s)")
-            status_callback(f"분할 중 ({i+1}/{num_segments})...")
-            
-            if progress_callback:
-                progress_callback(i+1, num_segments)
-            
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            log_callback(f"구간 {i+1} 완료: {output_file}")
-            successful += 1
-            
-        except subprocess.CalledProcessError as e:
-            log_callback(f"구간 {i+1} 분할 실패: {e}")
-            failed += 1
-    
-    log_callback(f"\n분할 완료! 성공: {successful}, 실패: {failed}")
-    status_callback(f"분할 완료! (성공: {successful}, 실패: {failed})")
-    
-    return failed == 0, f"성공: {successful}, 실패: {failed}"
-
-def split_media_by_duration(input_file, segment_duration, output_dir, log_callback, status_callback, progress_callback=None):
-    """
-    Split media file into segments of specified duration using ffmpeg.
-    """
-    if not os.path.exists(input_file):
-        log_callback(f"입력 파일이 존재하지 않습니다: {input_file}")
-        return False, "입력 파일이 존재하지 않습니다"
-    
-    # Get total duration
-    total_duration = get_media_duration(input_file)
-    if total_duration is None:
-        log_callback(f"미디어 파일의 길이를 가져올 수 없습니다: {input_file}")
-        return False, "미디어 파일의 길이를 가져올 수 없습니다"
-    
-    # Calculate number of segments
-    num_segments = int((total_duration + segment_duration - 1) // segment_duration)
-    log_callback(f"총 길이: {total_duration:.2f}초, 분할 길이: {segment_duration}초")
-    log_callback(f"총 {num_segments}개 구간으로 분할됩니다.")
-    
-    # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Get file info for naming
-    base_name = os.path.splitext(os.path.basename(input_file))[0]
-    file_ext = os.path.splitext(input_file)[1]
-    
-    successful = 0
-    failed = 0
-    
-    for i in range(num_segments):
-        start_time = i * segment_duration
-        output_file = os.path.join(output_dir, f"{base_name}_part{i+1:03d}{file_ext}")
-        
-        cmd = [
-            'ffmpeg',
-            '-y',  # overwrite
-            '-i', input_file,
-            '-ss', str(start_time),
-            '-t', str(segment_duration),
-            '-c', 'copy',  # copy codec for faster processing
-            output_file
-        ]
-        
-        try:
-            log_callback(f"구간 {i+1}/{num_segments} 분할 중... ({start_time:.1f}s ~ {start_time + segment_duration:.1f}s)")
-            status_callback(f"분할 중 ({i+1}/{num_segments})...")
-            
-            if progress_callback:
-                progress_callback(i+1, num_segments)
-            
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            log_callback(f"구간 {i+1} 완료: {output_file}")
-            successful += 1
-            
-        except subprocess.CalledProcessError as e:
-            log_callback(f"구간 {i+1} 분할 실패: {e}")
-            failed += 1
-    
-    log_callback(f"\n분할 완료! 성공: {successful}, 실패: {failed}")
-    status_callback(f"분할 완료! (성공: {successful}, 실패: {failed})")
-    
-    return failed == 0, f"성공: {successful}, 실패: {failed}"
-
-def merge_media_files(input_files, output_file, log_callback, status_callback, progress_callback=None):
-    """
-    Merge multiple media files into one using ffmpeg.
-    """
-    if len(input_files) < 2:
-        log_callback("합칠 파일이 최소 2개 이상 필요합니다.")
-        return False, "합칠 파일이 최소 2개 이상 필요합니다."
-    
-    # Create a text file listing all input files
-    temp_list_file = "temp_merge_list.txt"
-    try:
-        with open(temp_list_file, 'w', encoding='utf-8') as f:
-            for input_file in input_files:
-                if not os.path.exists(input_file):
-                    log_callback(f"파일이 존재하지 않습니다: {input_file}")
-                    return False, f"파일이 존재하지 않습니다: {input_file}"
-                # Escape single quotes for ffmpeg
-                escaped_path = input_file.replace("'", "'\"'\"'")
-                f.write(f"file '{escaped_path}'\n")
-        
-        log_callback(f"총 {len(input_files)}개 파일을 합칩니다.")
-        log_callback(f"출력 파일: {output_file}")
-        
-        # FFmpeg command to concatenate files
-        cmd = [
-            'ffmpeg',
-            '-y',  # overwrite output file
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', temp_list_file,
-            '-c', 'copy',  # copy streams without re-encoding for speed
-            output_file
-        ]
-        
-        status_callback("미디어 파일 합치는 중...")
-        if progress_callback:
-            progress_callback(1, 1)
-        
-        log_callback("합치기 시작...")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        log_callback(f"합치기 완료: {output_file}")
-        status_callback("합치기 완료!")
-        
-        if progress_callback:
-            progress_callback(1, 1)
-        
-        return True, output_file
-        
-    except subprocess.CalledProcessError as e:
-        error_msg = f"합치기 실패: {e.stderr if e.stderr else str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-    except Exception as e:
-        error_msg = f"합치기 중 오류 발생: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_list_file):
-            try:
-                os.remove(temp_list_file)
-            except:
-                pass
-
-def convert_media_batch(input_files, output_ext, log_callback, status_callback, progress_callback=None):
-    """
-    Convert multiple media files to another format using ffmpeg.
-    """
-    total_files = len(input_files)
-    successful = 0
-    failed = 0
-    
-    for i, input_file in enumerate(input_files, 1):
-        if progress_callback:
-            progress_callback(i, total_files)
-        
-        status_callback(f"변환 중 ({i}/{total_files})...")
-        success, result = convert_media(input_file, output_ext, log_callback)
-        
-        if success:
-            successful += 1
-            log_callback(f"[{i}/{total_files}] 성공: {result}")
-        else:
-            failed += 1
-            log_callback(f"[{i}/{total_files}] 실패: {input_file} - {result}")
-    
-    log_callback(f"\n배치 변환 완료! 성공: {successful}, 실패: {failed}")
-    status_callback(f"배치 변환 완료! (성공: {successful}, 실패: {failed})")
-    
-    if failed == 0:
-        messagebox.showinfo("완료", f"모든 파일 변환 완료!\n성공: {successful}개")
-    else:
-        messagebox.showwarning("완료", f"배치 변환 완료\n성공: {successful}개, 실패: {failed}개")
-
-def extract_text_from_pdf(pdf_path):
-    """PDF에서 텍스트 추출"""
-    text = ""
-    try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-    except Exception as e:
-        raise Exception(f"PDF 텍스트 추출 실패: {str(e)}")
-    return text
-
-def extract_structured_content_from_pdf(pdf_path):
-    """PDF에서 구조화된 콘텐츠 추출 (페이지별 구조 보존)"""
-    try:
-        content = []
-        
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            for i, page in enumerate(pdf_reader.pages, 1):
-                page_text = page.extract_text()
-                if page_text.strip():
-                    page_content = []
-                    page_content.append(f"## 페이지 {i}")
-                    
-                    # 텍스트를 줄별로 처리
-                    lines = page_text.strip().split('\n')
-                    processed_lines = []
-                    
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                            
-                        # 제목처럼 보이는 줄 감지 (대문자 비율이 높거나 짧은 줄)
-                        if len(line) < 100 and (line.isupper() or line.count(' ') < 5):
-                            processed_lines.append(f"### {line}")
-                        # 리스트 항목 감지
-                        elif line.startswith(('•', '-', '*', '·', '○')) or re.match(r'^\d+[.)]\s', line):
-                            processed_lines.append(f"- {line.lstrip('•-*·○ ').lstrip('0123456789.) ')}")
-                        # 일반 텍스트
-                        else:
-                            processed_lines.append(line)
-                    
-                    # 연속된 줄을 문단으로 합치기
-                    paragraphs = []
-                    current_paragraph = []
-                    
-                    for line in processed_lines:
-                        if line.startswith(('#', '-')):
-                            if current_paragraph:
-                                paragraphs.append(' '.join(current_paragraph))
-                                current_paragraph = []
-                            paragraphs.append(line)
-                        else:
-                            current_paragraph.append(line)
-                    
-                    if current_paragraph:
-                        paragraphs.append(' '.join(current_paragraph))
-                    
-                    page_content.extend(paragraphs)
-                    content.append('\n\n'.join(page_content))
-        
-        return '\n\n---\n\n'.join(content)
-    except Exception as e:
-        # 실패 시 기본 텍스트 추출로 폴백
-        return extract_text_from_pdf(pdf_path)
-
-def extract_text_from_docx(docx_path):
-    """DOCX에서 텍스트 추출"""
-    try:
-        doc = Document(docx_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
-    except Exception as e:
-        raise Exception(f"DOCX 텍스트 추출 실패: {str(e)}")
-
-def extract_structured_content_from_docx(docx_path):
-    """DOCX에서 구조화된 콘텐츠 추출 (표, 리스트, 서식 포함)"""
-    try:
-        doc = Document(docx_path)
-        content = []
-        
-        for element in doc.element.body:
-            if element.tag.endswith('p'):  # 문단
-                para = None
-                for p in doc.paragraphs:
-                    if p._element == element:
-                        para = p
-                        break
-                if para:
-                    # 문단 스타일 확인
-                    style_name = para.style.name if para.style else "Normal"
-                    text = para.text.strip()
-                    
-                    if text:
-                        if "Heading" in style_name:
-                            level = 1
-                            if "1" in style_name:
-                                level = 1
-                            elif "2" in style_name:
-                                level = 2
-                            elif "3" in style_name:
-                                level = 3
-                            elif "4" in style_name:
-                                level = 4
-                            elif "5" in style_name:
-                                level = 5
-                            elif "6" in style_name:
-                                level = 6
-                            content.append(f"{'#' * level} {text}")
-                        elif "List" in style_name or para.text.strip().startswith(('-', '*', '+')):
-                            content.append(f"- {text}")
-                        else:
-                            # 볼드, 이탤릭 처리
-                            formatted_text = ""
-                            for run in para.runs:
-                                run_text = run.text
-                                if run.bold and run.italic:
-                                    formatted_text += f"***{run_text}***"
-                                elif run.bold:
-                                    formatted_text += f"**{run_text}**"
-                                elif run.italic:
-                                    formatted_text += f"*{run_text}*"
-                                else:
-                                    formatted_text += run_text
-                            content.append(formatted_text if formatted_text.strip() else text)
-            
-            elif element.tag.endswith('tbl'):  # 표
-                table = None
-                for t in doc.tables:
-                    if t._element == element:
-                        table = t
-                        break
-                if table:
-                    content.append(convert_table_to_markdown(table))
-        
-        return "\n\n".join(content)
-    except Exception as e:
-        # 실패 시 기본 텍스트 추출로 폴백
-        return extract_text_from_docx(docx_path)
-
-def convert_table_to_markdown(table):
-    """Word 표를 마크다운 표 형식으로 변환"""
-    if not table.rows:
-        return ""
-    
-    markdown_table = []
-    
-    # 헤더 행
-    header_row = []
-    for cell in table.rows[0].cells:
-        header_row.append(cell.text.strip() or " ")
-    markdown_table.append("| " + " | ".join(header_row) + " |")
-    
-    # 구분선
-    separator = "| " + " | ".join(["---"] * len(header_row)) + " |"
-    markdown_table.append(separator)
-    
-    # 데이터 행들
-    for row in table.rows[1:]:
-        data_row = []
-        for cell in row.cells:
-            data_row.append(cell.text.strip() or " ")
-        markdown_table.append("| " + " | ".join(data_row) + " |")
-    
-    return "\n".join(markdown_table)
-
-def extract_text_from_pptx(pptx_path):
-    """PPTX에서 텍스트 추출"""
-    try:
-        prs = Presentation(pptx_path)
-        text = ""
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    text += shape.text + "\n"
-        return text
-    except Exception as e:
-        raise Exception(f"PPTX 텍스트 추출 실패: {str(e)}")
-
-def extract_structured_content_from_pptx(pptx_path):
-    """PPTX에서 구조화된 콘텐츠 추출 (슬라이드별 구조 보존)"""
-    try:
-        prs = Presentation(pptx_path)
-        content = []
-        
-        for i, slide in enumerate(prs.slides, 1):
-            slide_content = []
-            slide_content.append(f"## 슬라이드 {i}")
-            
-            # 슬라이드의 모든 shape 처리
-            shapes_processed = []
-            
-            for shape in slide.shapes:
-                # 표 처리
-                if shape.has_table:
-                    table_md = convert_pptx_table_to_markdown(shape.table)
-                    if table_md:
-                        slide_content.append("\n" + table_md + "\n")
-                    shapes_processed.append(shape)
-                
-                # 텍스트 처리
-                elif hasattr(shape, "text") and shape.text.strip():
-                    text = shape.text.strip()
-                    
-                    # 제목 슬라이드의 경우 첫 번째 텍스트는 제목, 두 번째는 부제목
-                    if i == 1 and len(shapes_processed) == 0:
-                        slide_content.append(f"### {text}")
-                    elif i == 1 and len(shapes_processed) == 1:
-                        slide_content.append(f"*{text}*")
-                    else:
-                        # 일반 슬라이드의 첫 번째 텍스트는 제목
-                        if len([s for s in shapes_processed if hasattr(s, "text")]) == 0:
-                            slide_content.append(f"### {text}")
-                        else:
-                            # 나머지 텍스트 처리
-                            text_lines = text.split('\n')
-                            for line in text_lines:
-                                line = line.strip()
-                                if line:
-                                    if line.startswith(('•', '-', '*')) or re.match(r'^\d+\.', line):
-                                        slide_content.append(f"- {line.lstrip('•-* ').lstrip('0123456789. ')}")
-                                    else:
-                                        slide_content.append(line)
-                    
-                    shapes_processed.append(shape)
-            
-            if len(slide_content) > 1:  # 제목 외에 내용이 있는 경우만 추가
-                content.append("\n".join(slide_content))
-        
-        return "\n\n---\n\n".join(content)
-    except Exception as e:
-        # 실패 시 기본 텍스트 추출로 폴백
-        return extract_text_from_pptx(pptx_path)
-
-def convert_pptx_table_to_markdown(table):
-    """PowerPoint 표를 마크다운 표 형식으로 변환"""
-    if not table.rows:
-        return ""
-    
-    markdown_table = []
-    
-    # 헤더 행
-    header_row = []
-    for cell in table.rows[0].cells:
-        header_row.append(cell.text.strip() or " ")
-    markdown_table.append("| " + " | ".join(header_row) + " |")
-    
-    # 구분선
-    separator = "| " + " | ".join(["---"] * len(header_row)) + " |"
-    markdown_table.append(separator)
-    
-    # 데이터 행들
-    for row in table.rows[1:]:
-        data_row = []
-        for cell in row.cells:
-            data_row.append(cell.text.strip() or " ")
-        markdown_table.append("| " + " | ".join(data_row) + " |")
-    
-    return "\n".join(markdown_table)
-
-def convert_pdf_to_docx(pdf_path, output_path, log_callback):
-    """PDF를 DOCX로 변환"""
-    try:
-        log_callback(f"PDF → DOCX 변환 시작: {pdf_path}")
-        text = extract_text_from_pdf(pdf_path)
-        
-        doc = Document()
-        doc.add_paragraph(text)
-        doc.save(output_path)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"PDF → DOCX 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_pdf_to_md(pdf_path, output_path, log_callback):
-    """PDF를 MD로 변환 (구조화된 형식 유지)"""
-    try:
-        log_callback(f"PDF → MD 변환 시작: {pdf_path}")
-        structured_content = extract_structured_content_from_pdf(pdf_path)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"# {os.path.splitext(os.path.basename(pdf_path))[0]}\n\n")
-            f.write(structured_content)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"PDF → MD 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_pdf_to_pptx(pdf_path, output_path, log_callback):
-    """PDF를 PPTX로 변환"""
-    try:
-        log_callback(f"PDF → PPTX 변환 시작: {pdf_path}")
-        text = extract_text_from_pdf(pdf_path)
-        
-        prs = Presentation()
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        title = slide.shapes.title
-        content = slide.placeholders[1]
-        
-        title.text = os.path.splitext(os.path.basename(pdf_path))[0]
-        content.text = text[:1000] + "..." if len(text) > 1000 else text
-        
-        prs.save(output_path)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"PDF → PPTX 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_docx_to_pdf(docx_path, output_path, log_callback):
-    """DOCX를 PDF로 변환 (pandoc 사용)"""
-    try:
-        log_callback(f"DOCX → PDF 변환 시작: {docx_path}")
-        pypandoc.convert_file(docx_path, 'pdf', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"DOCX → PDF 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_docx_to_md(docx_path, output_path, log_callback):
-    """DOCX를 MD로 변환 (표, 리스트, 서식 유지)"""
-    try:
-        log_callback(f"DOCX → MD 변환 시작: {docx_path}")
-        structured_content = extract_structured_content_from_docx(docx_path)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"# {os.path.splitext(os.path.basename(docx_path))[0]}\n\n")
-            f.write(structured_content)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"DOCX → MD 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_docx_to_pptx(docx_path, output_path, log_callback):
-    """DOCX를 PPTX로 변환"""
-    try:
-        log_callback(f"DOCX → PPTX 변환 시작: {docx_path}")
-        text = extract_text_from_docx(docx_path)
-        
-        prs = Presentation()
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        title = slide.shapes.title
-        content = slide.placeholders[1]
-        
-        title.text = os.path.splitext(os.path.basename(docx_path))[0]
-        content.text = text[:1000] + "..." if len(text) > 1000 else text
-        
-        prs.save(output_path)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"DOCX → PPTX 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_pptx_to_pdf(pptx_path, output_path, log_callback):
-    """PPTX를 PDF로 변환"""
-    try:
-        log_callback(f"PPTX → PDF 변환 시작: {pptx_path}")
-        text = extract_text_from_pptx(pptx_path)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as temp_file:
-            temp_file.write(text)
-            temp_md_path = temp_file.name
-        
-        pypandoc.convert_file(temp_md_path, 'pdf', outputfile=output_path)
-        os.unlink(temp_md_path)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"PPTX → PDF 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_pptx_to_docx(pptx_path, output_path, log_callback):
-    """PPTX를 DOCX로 변환"""
-    try:
-        log_callback(f"PPTX → DOCX 변환 시작: {pptx_path}")
-        text = extract_text_from_pptx(pptx_path)
-        
-        doc = Document()
-        doc.add_paragraph(text)
-        doc.save(output_path)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"PPTX → DOCX 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_pptx_to_md(pptx_path, output_path, log_callback):
-    """PPTX를 MD로 변환 (슬라이드 구조, 표 유지)"""
-    try:
-        log_callback(f"PPTX → MD 변환 시작: {pptx_path}")
-        structured_content = extract_structured_content_from_pptx(pptx_path)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"# {os.path.splitext(os.path.basename(pptx_path))[0]}\n\n")
-            f.write(structured_content)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"PPTX → MD 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_md_to_pdf(md_path, output_path, log_callback):
-    """MD를 PDF로 변환"""
-    try:
-        log_callback(f"MD → PDF 변환 시작: {md_path}")
-        pypandoc.convert_file(md_path, 'pdf', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"MD → PDF 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_md_to_docx(md_path, output_path, log_callback):
-    """MD를 DOCX로 변환"""
-    try:
-        log_callback(f"MD → DOCX 변환 시작: {md_path}")
-        pypandoc.convert_file(md_path, 'docx', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"MD → DOCX 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_md_to_pptx(md_path, output_path, log_callback):
-    """MD를 PPTX로 변환"""
-    try:
-        log_callback(f"MD → PPTX 변환 시작: {md_path}")
-        
-        with open(md_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        
-        html = markdown.markdown(md_content)
-        
-        prs = Presentation()
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        title = slide.shapes.title
-        content = slide.placeholders[1]
-        
-        title.text = os.path.splitext(os.path.basename(md_path))[0]
-        content.text = md_content[:1000] + "..." if len(md_content) > 1000 else md_content
-        
-        prs.save(output_path)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"MD → PPTX 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_html_to_pdf(html_path, output_path, log_callback):
-    """HTML을 PDF로 변환"""
-    try:
-        log_callback(f"HTML → PDF 변환 시작: {html_path}")
-        pypandoc.convert_file(html_path, 'pdf', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"HTML → PDF 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_html_to_docx(html_path, output_path, log_callback):
-    """HTML을 DOCX로 변환"""
-    try:
-        log_callback(f"HTML → DOCX 변환 시작: {html_path}")
-        pypandoc.convert_file(html_path, 'docx', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"HTML → DOCX 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_html_to_md(html_path, output_path, log_callback):
-    """HTML을 Markdown으로 변환"""
-    try:
-        log_callback(f"HTML → MD 변환 시작: {html_path}")
-        pypandoc.convert_file(html_path, 'md', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"HTML → MD 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_pdf_to_html(pdf_path, output_path, log_callback):
-    """PDF를 HTML로 변환"""
-    try:
-        log_callback(f"PDF → HTML 변환 시작: {pdf_path}")
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as temp_file:
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text_content = ""
-                for page in reader.pages:
-                    text_content += page.extract_text() + "\n\n"
-            
-            temp_file.write(text_content)
-            temp_md_path = temp_file.name
-        
-        pypandoc.convert_file(temp_md_path, 'html', outputfile=output_path)
-        os.unlink(temp_md_path)
-        
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"PDF → HTML 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_docx_to_html(docx_path, output_path, log_callback):
-    """DOCX를 HTML로 변환"""
-    try:
-        log_callback(f"DOCX → HTML 변환 시작: {docx_path}")
-        pypandoc.convert_file(docx_path, 'html', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"DOCX → HTML 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_md_to_html(md_path, output_path, log_callback):
-    """Markdown을 HTML로 변환"""
-    try:
-        log_callback(f"MD → HTML 변환 시작: {md_path}")
-        pypandoc.convert_file(md_path, 'html', outputfile=output_path)
-        log_callback(f"변환 완료: {output_path}")
-        return True, output_path
-    except Exception as e:
-        error_msg = f"MD → HTML 변환 실패: {str(e)}"
-        log_callback(error_msg)
-        return False, error_msg
-
-def convert_document(input_file, output_format, log_callback):
-    """문서 변환 메인 함수"""
-    input_ext = os.path.splitext(input_file)[1].lower()
-    base_name = os.path.splitext(input_file)[0]
-    output_file = f"{base_name}.{output_format.lower()}"
-    
-    conversion_map = {
-        ('.pdf', 'docx'): convert_pdf_to_docx,
-        ('.pdf', 'md'): convert_pdf_to_md,
-        ('.pdf', 'pptx'): convert_pdf_to_pptx,
-        ('.pdf', 'html'): convert_pdf_to_html,
-        ('.docx', 'pdf'): convert_docx_to_pdf,
-        ('.docx', 'md'): convert_docx_to_md,
-        ('.docx', 'pptx'): convert_docx_to_pptx,
-        ('.docx', 'html'): convert_docx_to_html,
-        ('.pptx', 'pdf'): convert_pptx_to_pdf,
-        ('.pptx', 'docx'): convert_pptx_to_docx,
-        ('.pptx', 'md'): convert_pptx_to_md,
-        ('.md', 'pdf'): convert_md_to_pdf,
-        ('.md', 'docx'): convert_md_to_docx,
-        ('.md', 'pptx'): convert_md_to_pptx,
-        ('.md', 'html'): convert_md_to_html,
-        ('.html', 'pdf'): convert_html_to_pdf,
-        ('.html', 'docx'): convert_html_to_docx,
-        ('.html', 'md'): convert_html_to_md,
-    }
-    
-    conversion_key = (input_ext, output_format.lower())
-    
-    if conversion_key not in conversion_map:
-        error_msg = f"지원하지 않는 변환: {input_ext} → {output_format}"
-        log_callback(error_msg)
-        return False, error_msg
-    
-    if input_ext == f".{output_format.lower()}":
-        error_msg = "입력 파일과 출력 형식이 동일합니다"
-        log_callback(error_msg)
-        return False, error_msg
-    
-    return conversion_map[conversion_key](input_file, output_file, log_callback)
+def get_log_file_path():
+    """전체 로그 파일 경로 (기록하지 않으면 None)"""
+    log_file = os.environ.get(LOG_FILE_ENV)
+    if log_file and log_file.lower() == 'off':
+        return None
+    return log_file or str(Path.home() / ".cache" / "youtube-downloader" / "logs" / "app.log")
+
+def setup_file_logging():
+    """작업 로그를 회전 로그 파일에 기록하도록 설정 (기록 파일 경로 반환)"""
+    log_file = get_log_file_path()
+    if not log_file or job_logger.handlers:
+        return log_file
+    os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT, encoding='utf-8'
+    )
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    job_logger.addHandler(handler)
+    job_logger.setLevel(logging.INFO)
+    job_logger.propagate = False
+    return log_file
 
 class MediaDownloaderConverterGUI:
     def __init__(self, root):
@@ -952,22 +133,94 @@ class MediaDownloaderConverterGUI:
         self.root.title("YouTube 다운로더 & 미디어/문서 변환기")
         self.root.geometry("800x520")
         self.root.minsize(800, 520)
+        # 작업 스레드는 위젯을 직접 건드리지 않고 이 큐에 이벤트만 넣음
+        self.ui_events = queue.SimpleQueue()
+        # 로그 창은 최근 log_max_lines줄만 유지하고 전체 기록은 로그 파일에 남김
+        self.log_max_lines = get_log_max_lines()
+        self.log_lines = deque(maxlen=self.log_max_lines)
+        self.job_log_lines = {}  # 작업 이름 → 최근 로그 (필터용)
+        self.job_counter = 0
+        # 모든 탭의 작업은 하나의 스케줄러에서 자원 종류별 제한에 맞춰 실행
+        self.scheduler = JobScheduler(change_callback=self._on_job_change)
+        # 작업 대기열과 진행 상황은 SQLite에 저장해 앱을 다시 열면 이어서 실행
+        self.job_store = None
+        self.stored_job_ids = {}  # 스케줄러 작업 ID → 저장소 작업 ID
+        db_path = get_job_db_path()
+        if db_path:
+            try:
+                self.job_store = JobStore(db_path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"작업 저장소를 열 수 없습니다: {e}")
+        try:
+            setup_file_logging()
+        except OSError as e:
+            print(f"로그 파일을 열 수 없습니다: {e}")
         self.setup_ui()
+        self.root.after(UI_EVENT_INTERVAL_MS, self._drain_ui_events)
+        # METRICS_PORT / METRICS_FILE가 설정되어 있으면 작업 메트릭을 내보냄
+        try:
+            for target in start_metrics_exporters():
+                self.log_message(f"메트릭 내보내기: {target}")
+        except (ValueError, OSError) as e:
+            self.log_message(f"메트릭 엔드포인트를 시작할 수 없습니다: {e}")
+        if self.job_store:
+            self.root.after(0, self._resume_stored_jobs)
 
     def setup_ui(self):
-        tab_control = ttk.Notebook(self.root)
-        self.tab1 = ttk.Frame(tab_control)
-        self.tab2 = ttk.Frame(tab_control)
-        self.tab3 = ttk.Frame(tab_control)
-        self.tab4 = ttk.Frame(tab_control)
-        self.tab5 = ttk.Frame(tab_control)
-        tab_control.add(self.tab1, text='YouTube 다운로드')
-        tab_control.add(self.tab2, text='미디어 변환')
-        tab_control.add(self.tab3, text='영상 분할')
-        tab_control.add(self.tab4, text='미디어 합치기')
-        tab_control.add(self.tab5, text='문서 변환')
-        tab_control.pack(expand=1, fill='both')
+        self.tab_control = ttk.Notebook(self.root)
+        self.tab1 = ttk.Frame(self.tab_control)
+        self.tab2 = ttk.Frame(self.tab_control)
+        self.tab3 = ttk.Frame(self.tab_control)
+        self.tab4 = ttk.Frame(self.tab_control)
+        self.tab5 = ttk.Frame(self.tab_control)
+        self.tab6 = ttk.Frame(self.tab_control)
+        self.tab_control.add(self.tab1, text='YouTube 다운로드')
+        self.tab_control.add(self.tab2, text='미디어 변환')
+        self.tab_control.add(self.tab3, text='영상 분할')
+        self.tab_control.add(self.tab4, text='미디어 합치기')
+        self.tab_control.add(self.tab5, text='문서 변환')
+        self.tab_control.add(self.tab6, text='작업 대기열')
+        self.tab_control.pack(expand=1, fill='both')
+
+        # 탭 내용은 처음 선택될 때 만듦 (작업 대기열 탭은 작업 상태를 계속 받으므로 바로 만듦)
+        self.tab_builders = {
+            str(self.tab1): self._build_download_tab,
+            str(self.tab2): self._build_convert_tab,
+            str(self.tab3): self._build_split_tab,
+            str(self.tab4): self._build_merge_tab,
+            str(self.tab5): self._build_document_tab,
+            str(self.tab6): self._build_jobs_tab,
+        }
+        self.ensure_tab(self.tab1)
+        self.ensure_tab(self.tab6)
+        self.tab_control.bind("<<NotebookTabChanged>>", lambda event: self.ensure_tab(self.tab_control.select()))
+
+        # --- Status & Log ---
+        self.status_label = ttk.Label(self.root, text="대기 중...", relief=tk.SUNKEN, anchor=tk.W)
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
 
+        log_frame = ttk.LabelFrame(self.root, text="로그", padding="5")
+        log_frame.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        log_filter_frame = ttk.Frame(log_frame)
+        log_filter_frame.pack(side=tk.TOP, fill=tk.X)
+        ttk.Label(log_filter_frame, text="작업:").pack(side=tk.LEFT)
+        self.log_filter_var = tk.StringVar(value=LOG_FILTER_ALL)
+        self.log_filter_combo = ttk.Combobox(log_filter_frame, textvariable=self.log_filter_var, values=[LOG_FILTER_ALL], state="readonly", width=20)
+        self.log_filter_combo.pack(side=tk.LEFT, padx=5)
+        self.log_filter_combo.bind("<<ComboboxSelected>>", lambda event: self._refresh_log_view())
+        self.log_text = tk.Text(log_frame, height=8, width=80)
+        scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=scrollbar.set)
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def ensure_tab(self, tab):
+        """탭 내용이 아직 없으면 생성"""
+        builder = self.tab_builders.pop(str(tab), None)
+        if builder:
+            builder()
+
+    def _build_download_tab(self):
         # --- Tab 1: YouTube 다운로드 ---
         ttk.Label(self.tab1, text="YouTube URL:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
         self.url_entry = ttk.Entry(self.tab1, width=60)
@@ -988,6 +241,12 @@ class MediaDownloaderConverterGUI:
         self.download_btn = ttk.Button(self.tab1, text="다운로드", command=self.start_download)
         self.download_btn.grid(row=3, column=0, columnspan=4, pady=10)
 
+        # Grid column/row weights for resizing
+        for i in range(4):
+            self.tab1.columnconfigure(i, weight=1)
+        self.tab1.rowconfigure(10, weight=1)
+
+    def _build_convert_tab(self):
         # --- Tab 2: 미디어 변환 ---
         ttk.Label(self.tab2, text="입력 파일:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
         
@@ -1046,9 +305,20 @@ class MediaDownloaderConverterGUI:
         self.convert_btn = ttk.Button(options_frame, text="변환", command=self.start_convert)
         self.convert_btn.grid(row=0, column=3, padx=5)
         
+        self.chunked_convert_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="분할 병렬 변환 (긴 단일 파일)", variable=self.chunked_convert_var).grid(row=1, column=0, columnspan=4, sticky=tk.W, padx=5)
+        
         # 초기 모드 설정
         self.toggle_file_mode()
 
+        # Grid column/row weights for resizing
+        for i in range(4):
+            self.tab2.columnconfigure(i, weight=1)
+        self.tab2.rowconfigure(2, weight=1)
+        self.single_file_frame.columnconfigure(0, weight=1)
+        options_frame.columnconfigure(2, weight=1)
+
+    def _build_split_tab(self):
         # --- Tab 3: 영상 분할 ---
         ttk.Label(self.tab3, text="입력 파일:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
         self.split_input_entry = ttk.Entry(self.tab3, width=50)
@@ -1105,6 +375,12 @@ class MediaDownloaderConverterGUI:
         # 초기 모드 설정
         self.toggle_split_mode()
 
+        # Grid column/row weights for resizing
+        for i in range(4):
+            self.tab3.columnconfigure(i, weight=1)
+        self.tab3.rowconfigure(4, weight=1)
+
+    def _build_merge_tab(self):
         # --- Tab 4: 미디어 합치기 ---
         # 파일 목록 선택
         ttk.Label(self.tab4, text="합칠 파일들:").grid(row=0, column=0, sticky=(tk.W, tk.N), pady=5, padx=5)
@@ -1141,30 +417,58 @@ class MediaDownloaderConverterGUI:
         ttk.Button(self.tab4, text="찾아보기", command=self.browse_merge_output).grid(row=1, column=2, padx=5)
         ttk.Button(self.tab4, text="폴더 열기", command=self.open_merge_output_folder).grid(row=1, column=3, padx=5)
         
+        # 증분 이어붙이기 옵션
+        self.merge_append_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.tab4, text="기존 출력 파일에 이어붙이기 (새 파일만 추가)", variable=self.merge_append_var).grid(row=2, column=1, columnspan=3, sticky=tk.W, pady=5)
+        
         # 합치기 진행률 표시바
         self.merge_progress_var = tk.DoubleVar()
         self.merge_progress_bar = ttk.Progressbar(self.tab4, variable=self.merge_progress_var, maximum=100, length=300)
-        self.merge_progress_bar.grid(row=2, column=0, columnspan=3, pady=10, sticky=(tk.W, tk.E))
+        self.merge_progress_bar.grid(row=3, column=0, columnspan=3, pady=10, sticky=(tk.W, tk.E))
         
         self.merge_btn = ttk.Button(self.tab4, text="합치기", command=self.start_merge)
-        self.merge_btn.grid(row=2, column=3, padx=5)
+        self.merge_btn.grid(row=3, column=3, padx=5)
 
+        # Grid column/row weights for resizing
+        for i in range(4):
+            self.tab4.columnconfigure(i, weight=1)
+        self.tab4.rowconfigure(0, weight=1)
+
+    def _build_document_tab(self):
         # --- Tab 5: 문서 변환 ---
-        ttk.Label(self.tab5, text="입력 문서:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
-        self.doc_input_entry = ttk.Entry(self.tab5, width=50)
-        self.doc_input_entry.grid(row=0, column=1, pady=5, sticky=(tk.W, tk.E))
-        ttk.Button(self.tab5, text="찾아보기", command=self.browse_doc_input).grid(row=0, column=2, padx=5)
-        ttk.Button(self.tab5, text="폴더 열기", command=self.open_doc_input_folder).grid(row=0, column=3, padx=5)
+        ttk.Label(self.tab5, text="변환 방식:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
+        self.doc_mode_var = tk.StringVar(value="single")
+        ttk.Radiobutton(self.tab5, text="단일 파일", variable=self.doc_mode_var, value="single", command=self.toggle_doc_mode).grid(row=0, column=1, sticky=tk.W)
+        ttk.Radiobutton(self.tab5, text="폴더 일괄", variable=self.doc_mode_var, value="batch", command=self.toggle_doc_mode).grid(row=0, column=2, sticky=tk.W)
 
-        ttk.Label(self.tab5, text="변환할 형식:").grid(row=1, column=0, sticky=tk.W, pady=5, padx=5)
+        # 단일 파일 선택 UI
+        self.doc_single_frame = ttk.Frame(self.tab5)
+        self.doc_single_frame.grid(row=1, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=5)
+        ttk.Label(self.doc_single_frame, text="입력 문서:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.doc_input_entry = ttk.Entry(self.doc_single_frame, width=50)
+        self.doc_input_entry.grid(row=0, column=1, pady=5, sticky=(tk.W, tk.E))
+        ttk.Button(self.doc_single_frame, text="찾아보기", command=self.browse_doc_input).grid(row=0, column=2, padx=5)
+        ttk.Button(self.doc_single_frame, text="폴더 열기", command=self.open_doc_input_folder).grid(row=0, column=3, padx=5)
+
+        # 폴더 일괄 변환 UI
+        self.doc_batch_frame = ttk.Frame(self.tab5)
+        self.doc_batch_frame.grid(row=1, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=5)
+        ttk.Label(self.doc_batch_frame, text="입력 폴더:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.doc_folder_entry = ttk.Entry(self.doc_batch_frame, width=50)
+        self.doc_folder_entry.grid(row=0, column=1, pady=5, sticky=(tk.W, tk.E))
+        ttk.Button(self.doc_batch_frame, text="찾아보기", command=self.browse_doc_folder).grid(row=0, column=2, padx=5)
+        self.doc_skip_unchanged_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(self.doc_batch_frame, text="변경된 파일만", variable=self.doc_skip_unchanged_var).grid(row=0, column=3, padx=5)
+
+        ttk.Label(self.tab5, text="변환할 형식:").grid(row=2, column=0, sticky=tk.W, pady=5, padx=5)
         self.doc_output_format_var = tk.StringVar(value="pdf")
         self.doc_format_combo = ttk.Combobox(self.tab5, textvariable=self.doc_output_format_var, width=15)
         self.doc_format_combo['values'] = ('pdf', 'docx', 'pptx', 'md', 'html')
-        self.doc_format_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
+        self.doc_format_combo.grid(row=2, column=1, sticky=tk.W, pady=5)
 
         # 지원 형식 안내
         support_frame = ttk.LabelFrame(self.tab5, text="지원 형식", padding="10")
-        support_frame.grid(row=2, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=10, padx=5)
+        support_frame.grid(row=3, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=10, padx=5)
         
         support_text = """• PDF ↔ DOCX, MD, PPTX, HTML
 • DOCX ↔ PDF, MD, PPTX, HTML  
@@ -1177,7 +481,7 @@ class MediaDownloaderConverterGUI:
 
         # 문서 변환 진행률 표시바 및 버튼
         doc_action_frame = ttk.Frame(self.tab5)
-        doc_action_frame.grid(row=3, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=10)
+        doc_action_frame.grid(row=4, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=10)
         
         self.doc_progress_var = tk.DoubleVar()
         self.doc_progress_bar = ttk.Progressbar(doc_action_frame, variable=self.doc_progress_var, maximum=100, length=300)
@@ -1185,36 +489,50 @@ class MediaDownloaderConverterGUI:
         
         self.doc_convert_btn = ttk.Button(doc_action_frame, text="변환", command=self.start_doc_convert)
         self.doc_convert_btn.grid(row=0, column=1, padx=5)
-
-
-        # --- Status & Log ---
-        self.status_label = ttk.Label(self.root, text="대기 중...", relief=tk.SUNKEN, anchor=tk.W)
-        self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
-
-        log_frame = ttk.LabelFrame(self.root, text="로그", padding="5")
-        log_frame.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self.log_text = tk.Text(log_frame, height=8, width=80)
-        scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=scrollbar.set)
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # 초기 모드 설정
+        self.toggle_doc_mode()
 
         # Grid column/row weights for resizing
         for i in range(4):
-            self.tab1.columnconfigure(i, weight=1)
-            self.tab2.columnconfigure(i, weight=1)
-            self.tab3.columnconfigure(i, weight=1)
-            self.tab4.columnconfigure(i, weight=1)
             self.tab5.columnconfigure(i, weight=1)
-        self.tab1.rowconfigure(10, weight=1)
-        self.tab2.rowconfigure(2, weight=1)
-        self.tab3.rowconfigure(4, weight=1)
-        self.tab4.rowconfigure(0, weight=1)
-        self.tab5.rowconfigure(4, weight=1)
-        self.single_file_frame.columnconfigure(0, weight=1)
-        options_frame.columnconfigure(2, weight=1)
+        self.tab5.rowconfigure(5, weight=1)
+        self.doc_single_frame.columnconfigure(1, weight=1)
+        self.doc_batch_frame.columnconfigure(1, weight=1)
         doc_action_frame.columnconfigure(0, weight=1)
 
+    def _build_jobs_tab(self):
+        # --- Tab 6: 작업 대기열 ---
+        queue_option_frame = ttk.Frame(self.tab6)
+        queue_option_frame.grid(row=0, column=0, columnspan=4, sticky=(tk.W, tk.E), padx=10, pady=5)
+        ttk.Label(queue_option_frame, text="새 작업 우선순위:").pack(side=tk.LEFT)
+        self.job_priority_var = tk.StringVar(value=JOB_PRIORITY_NAMES[JOB_PRIORITY_NORMAL])
+        ttk.Combobox(queue_option_frame, textvariable=self.job_priority_var, values=list(JOB_PRIORITY_NAMES.values()), state="readonly", width=6).pack(side=tk.LEFT, padx=5)
+        limits_text = ", ".join(f"{JOB_RESOURCE_NAMES[resource]} {limit}" for resource, limit in self.scheduler.limits.items())
+        ttk.Label(queue_option_frame, text=f"동시 실행: {limits_text}").pack(side=tk.LEFT, padx=15)
+        
+        job_columns = ("name", "resource", "priority", "status", "submitted", "elapsed")
+        self.job_tree = ttk.Treeview(self.tab6, columns=job_columns, show="headings", height=8)
+        for column, heading, width in zip(job_columns, ("작업", "자원", "우선순위", "상태", "등록", "소요"), (200, 80, 70, 80, 80, 80)):
+            self.job_tree.heading(column, text=heading)
+            self.job_tree.column(column, width=width, anchor=tk.W)
+        job_scrollbar = ttk.Scrollbar(self.tab6, orient=tk.VERTICAL, command=self.job_tree.yview)
+        self.job_tree.configure(yscrollcommand=job_scrollbar.set)
+        self.job_tree.grid(row=1, column=0, columnspan=4, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(10, 0), pady=5)
+        job_scrollbar.grid(row=1, column=4, sticky=(tk.N, tk.S), pady=5)
+        
+        queue_button_frame = ttk.Frame(self.tab6)
+        queue_button_frame.grid(row=2, column=0, columnspan=4, pady=5)
+        ttk.Button(queue_button_frame, text="먼저 실행", command=lambda: self.set_selected_job_priority(JOB_PRIORITY_HIGH)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(queue_button_frame, text="나중에 실행", command=lambda: self.set_selected_job_priority(JOB_PRIORITY_LOW)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(queue_button_frame, text="대기 작업 취소", command=self.cancel_selected_jobs).pack(side=tk.LEFT, padx=5)
+        ttk.Button(queue_button_frame, text="끝난 작업 지우기", command=self.clear_finished_jobs).pack(side=tk.LEFT, padx=5)
+
+        # Grid column/row weights for resizing
+        for i in range(4):
+            self.tab6.columnconfigure(i, weight=1)
+        self.tab6.rowconfigure(1, weight=1)
+
     def browse_save_path(self):
         folder = filedialog.askdirectory(initialdir=str(Path.home() / "Downloads"))
         if folder:
@@ -1260,19 +578,213 @@ class MediaDownloaderConverterGUI:
         self.selected_files.clear()
         self.files_listbox.delete(0, tk.END)
     
+    def _drain_ui_events(self):
+        """큐에 쌓인 이벤트를 모아서 반영 (로그는 한 번에 삽입, 상태/진행률은 마지막 값만)"""
+        logs = []
+        status = None
+        progress = {}
+        
+        def flush():
+            nonlocal status
+            if logs:
+                with span('ui.append_logs', cat='gui', lines=len(logs)):
+                    self._append_logs(logs)
+                logs.clear()
+            if status is not None:
+                self.status_label.config(text=status)
+                status = None
+            for var, value in progress.items():
+                var.set(value)
+            progress.clear()
+        
+        try:
+            for _ in range(UI_EVENT_BATCH_LIMIT):
+                try:
+                    event = self.ui_events.get_nowait()
+                except queue.Empty:
+                    break
+                kind = event[0]
+                if kind == 'log':
+                    logs.append((event[1], event[2]))
+                elif kind == 'status':
+                    status = event[1]
+                elif kind == 'progress':
+                    progress[event[1]] = event[2]
+                else:
+                    # 메시지 박스 등은 앞선 로그/상태를 먼저 반영한 뒤 순서대로 실행
+                    flush()
+                    event[1](*event[2])
+            flush()
+        finally:
+            delay = UI_EVENT_INTERVAL_MS if self.ui_events.empty() else 1
+            self.root.after(delay, self._drain_ui_events)
+
+    def _append_logs(self, entries):
+        """(작업 이름, 메시지) 목록을 로그 버퍼와 현재 필터의 로그 창에 추가"""
+        current_filter = self.log_filter_var.get()
+        visible = []
+        for job, message in entries:
+            line = f"[{job}] {message}" if job else message
+            self.log_lines.append(line)
+            job_lines = self.job_log_lines.get(job)
+            if job_lines is not None:
+                job_lines.append(message)
+            if current_filter == LOG_FILTER_ALL:
+                visible.append(line)
+            elif job == current_filter:
+                visible.append(message)
+        if visible:
+            self.log_text.insert(tk.END, "\n".join(visible) + "\n")
+            self._trim_log_view()
+            self.log_text.see(tk.END)
+
+    def _trim_log_view(self):
+        # 오래된 줄을 지워 Text 위젯 크기를 일정하게 유지
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        excess = line_count - self.log_max_lines
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+
+    def _refresh_log_view(self):
+        """선택한 작업 필터로 로그 창을 다시 그림"""
+        current_filter = self.log_filter_var.get()
+        lines = self.log_lines if current_filter == LOG_FILTER_ALL else self.job_log_lines.get(current_filter, ())
+        self.log_text.delete('1.0', tk.END)
+        if lines:
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self._trim_log_view()
+        self.log_text.see(tk.END)
+
+    def _start_job(self, job_kind, target, *args, stored_job_id=None, priority=None):
+        """작업을 스케줄러에 등록 (target은 작업 이름이 붙는 log_callback을 첫 인자로 받음)
+
+        작업 저장소가 있으면 작업을 기록하고, 재개 가능한 작업에는 JobCheckpoint를 넘긴다.
+        stored_job_id는 재시작 후 저장된 작업을 다시 등록할 때 사용한다.
+        """
+        self.job_counter += 1
+        job = f"{job_kind} #{self.job_counter}"
+        self.job_log_lines[job] = deque(maxlen=self.log_max_lines)
+        while len(self.job_log_lines) > LOG_MAX_JOBS:
+            del self.job_log_lines[next(iter(self.job_log_lines))]
+        self.log_filter_combo.configure(values=[LOG_FILTER_ALL] + list(self.job_log_lines))
+        if priority is None:
+            priority = next(
+                (value for value, name in JOB_PRIORITY_NAMES.items() if name == self.job_priority_var.get()),
+                JOB_PRIORITY_NORMAL
+            )
+        kwargs = {}
+        if self.job_store:
+            if stored_job_id is None:
+                stored_job_id = self.job_store.add_job(job_kind, target.__name__, args, priority)
+            if target.__name__ in GUI_CHECKPOINT_JOBS:
+                kwargs['checkpoint'] = JobCheckpoint(self.job_store, stored_job_id)
+        log_callback = lambda message: self._post_log(message, job)
+        scheduled = self.scheduler.submit(
+            job, GUI_JOB_RESOURCES[job_kind], self._run_job,
+            (stored_job_id, target, (log_callback,) + tuple(args), kwargs), priority
+        )
+        if stored_job_id is not None:
+            self.stored_job_ids[scheduled.job_id] = stored_job_id
+        if scheduled.status == JOB_STATUS_QUEUED:
+            self._post_log(f"작업 대기열에 추가되었습니다 ({JOB_RESOURCE_NAMES[scheduled.resource]} 작업 실행 중)", job)
+
+    def _run_job(self, stored_job_id, target, args, kwargs):
+        """작업 실행 (저장소의 작업 상태도 함께 갱신)"""
+        if stored_job_id is not None:
+            self.job_store.set_status(stored_job_id, JOB_STATUS_RUNNING)
+        status, error = JOB_STATUS_FAILED, None
+        try:
+            result = target(*args, **kwargs)
+            status = JOB_STATUS_FAILED if result is False else JOB_STATUS_DONE
+            return result
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            if stored_job_id is not None:
+                self.job_store.set_status(stored_job_id, status, error)
+
+    def _on_job_change(self, job):
+        # 스케줄러 스레드에서 호출됨: 대기 중 취소만 저장소에 바로 반영하고 화면 갱신은 Tk 스레드로
+        if job.status == JOB_STATUS_CANCELLED and job.job_id in self.stored_job_ids:
+            self.job_store.set_status(self.stored_job_ids[job.job_id], JOB_STATUS_CANCELLED)
+        self.ui_call(self._update_job_row, job)
+
+    def _resume_stored_jobs(self):
+        """지난 실행에서 끝나지 않은 작업을 다시 등록 (끝난 항목은 각 작업이 건너뜀)"""
+        self.job_store.delete_finished()
+        for record in self.job_store.incomplete_jobs():
+            target = getattr(self, record['method'], None)
+            if record['kind'] not in GUI_JOB_RESOURCES or target is None:
+                self.job_store.set_status(record['id'], JOB_STATUS_FAILED, "알 수 없는 작업")
+                continue
+            self.log_message(f"지난 실행에서 끝나지 않은 작업을 이어서 실행합니다: {record['kind']}")
+            self.ensure_tab(getattr(self, GUI_JOB_TABS[record['kind']]))
+            self._start_job(record['kind'], target, *record['args'], stored_job_id=record['id'], priority=record['priority'])
+
+    def _update_job_row(self, job):
+        """작업 대기열 탭의 행 하나를 갱신"""
+        iid = str(job.job_id)
+        if job.job_id not in self.scheduler.jobs:
+            return
+        submitted = datetime.datetime.fromtimestamp(job.submitted_at).strftime("%H:%M:%S")
+        elapsed = f"{int(job.finished_at - job.started_at)}초" if job.started_at and job.finished_at else ""
+        status = f"{job.status}: {job.error}" if job.error else job.status
+        values = (job.name, JOB_RESOURCE_NAMES[job.resource], JOB_PRIORITY_NAMES[job.priority], status, submitted, elapsed)
+        if self.job_tree.exists(iid):
+            self.job_tree.item(iid, values=values)
+        else:
+            self.job_tree.insert("", tk.END, iid=iid, values=values)
+
+    def set_selected_job_priority(self, priority):
+        selected = self.job_tree.selection()
+        if not selected:
+            messagebox.showinfo("안내", "우선순위를 바꿀 작업을 선택하세요.")
+            return
+        changed = [int(iid) for iid in selected if self.scheduler.set_priority(int(iid), priority)]
+        if not changed:
+            messagebox.showinfo("안내", "대기 중인 작업만 우선순위를 바꿀 수 있습니다.")
+        for job_id in changed:
+            if job_id in self.stored_job_ids:
+                self.job_store.set_priority(self.stored_job_ids[job_id], priority)
+
+    def cancel_selected_jobs(self):
+        selected = self.job_tree.selection()
+        if not selected:
+            messagebox.showinfo("안내", "취소할 작업을 선택하세요.")
+            return
+        if not any([self.scheduler.cancel(int(iid)) for iid in selected]):
+            messagebox.showinfo("안내", "대기 중인 작업만 취소할 수 있습니다.")
+
+    def clear_finished_jobs(self):
+        cleared = self.scheduler.clear_finished()
+        for job_id in cleared:
+            if self.job_tree.exists(str(job_id)):
+                self.job_tree.delete(str(job_id))
+        if self.job_store:
+            self.job_store.delete_jobs([self.stored_job_ids.pop(job_id) for job_id in cleared if job_id in self.stored_job_ids])
+
+    def _post_log(self, message, job=None):
+        # 파일 기록은 작업 스레드에서 처리해 Tk 스레드에 디스크 I/O를 넘기지 않음
+        with span('log.write', cat='gui'):
+            job_logger.info(f"[{job}] {message}" if job else message)
+        self.ui_events.put(('log', job, message))
+
+    def ui_call(self, func, *args):
+        """Tk 스레드에서 func(*args) 실행 (작업 스레드에서 메시지 박스 등을 띄울 때 사용)"""
+        self.ui_events.put(('call', func, args))
+
+    def _post_progress(self, var, value):
+        self.ui_events.put(('progress', var, value))
+
     def update_progress(self, current, total):
-        progress = (current / total) * 100
-        self.progress_var.set(progress)
-        self.root.update()
+        self._post_progress(self.progress_var, (current / total) * 100)
 
     def log_message(self, message):
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        self._post_log(message)
 
     def set_status(self, message):
-        self.status_label.config(text=message)
-        self.root.update()
+        self.ui_events.put(('status', message))
 
     def start_download(self):
         url = self.url_entry.get().strip()
@@ -1288,7 +800,15 @@ class MediaDownloaderConverterGUI:
                 messagebox.showerror("오류", f"폴더 생성 실패: {str(e)}")
                 return
         self.set_status("다운로드 중...")
-        threading.Thread(target=download_youtube, args=(url, output_dir, format_type, self.log_message, self.set_status), daemon=True).start()
+        self._start_job("다운로드", self._download_youtube, url, output_dir, format_type)
+
+    def _download_youtube(self, log_callback, url, output_dir, format_type):
+        success, result = download_youtube(url, output_dir, format_type, log_callback, self.set_status)
+        if success:
+            self.ui_call(messagebox.showinfo, "완료", "다운로드가 완료되었습니다!")
+        else:
+            self.ui_call(messagebox.showerror, "오류", result)
+        return success
 
     def start_convert(self):
         output_ext = self.output_ext_var.get().strip().lower()
@@ -1301,7 +821,7 @@ class MediaDownloaderConverterGUI:
                 return
             self.progress_var.set(0)
             self.set_status("변환 중...")
-            threading.Thread(target=self._convert_single_file, args=(input_file, output_ext), daemon=True).start()
+            self._start_job("변환", self._convert_single_file, input_file, output_ext, self.chunked_convert_var.get())
         else:
             if not self.selected_files:
                 messagebox.showerror("오류", "변환할 파일을 선택하세요.")
@@ -1314,18 +834,32 @@ class MediaDownloaderConverterGUI:
                 
             self.progress_var.set(0)
             self.set_status(f"배치 변환 중... (0/{len(valid_files)})")
-            threading.Thread(target=convert_media_batch, args=(valid_files, output_ext, self.log_message, self.set_status, self.update_progress), daemon=True).start()
+            self._start_job("배치 변환", self._convert_media_batch, valid_files, output_ext)
     
-    def _convert_single_file(self, input_file, output_ext):
-        success, result = convert_media(input_file, output_ext, self.log_message)
+    def _convert_media_batch(self, log_callback, input_files, output_ext, checkpoint=None):
+        success, result = convert_media_batch(input_files, output_ext, log_callback, self.set_status, self.update_progress, checkpoint=checkpoint)
         if success:
-            self.progress_var.set(100)
+            self.ui_call(messagebox.showinfo, "완료", f"모든 파일 변환 완료!\n{result}")
+        else:
+            self.ui_call(messagebox.showwarning, "완료", f"배치 변환 완료\n{result}")
+        return success
+    
+    def _convert_single_file(self, log_callback, input_file, output_ext, chunked=False):
+        if chunked and get_transcode_workers():
+            success, result = convert_media_distributed(input_file, output_ext, log_callback, progress_callback=self.update_progress)
+        elif chunked:
+            success, result = convert_media_chunked(input_file, output_ext, log_callback, progress_callback=self.update_progress)
+        else:
+            success, result = convert_media(input_file, output_ext, log_callback)
+        if success:
+            self._post_progress(self.progress_var, 100)
             self.set_status("변환 완료!")
-            messagebox.showinfo("완료", f"변환 완료: {result}")
+            self.ui_call(messagebox.showinfo, "완료", f"변환 완료: {result}")
         else:
             self.set_status("변환 오류")
-            messagebox.showerror("오류", result)
+            self.ui_call(messagebox.showerror, "오류", result)
         self.set_status("대기 중...")
+        return success
 
     def open_download_folder(self):
         folder = self.save_path_entry.get().strip()
@@ -1420,9 +954,7 @@ class MediaDownloaderConverterGUI:
             self.segments_frame.grid()
 
     def update_split_progress(self, current, total):
-        progress = (current / total) * 100
-        self.split_progress_var.set(progress)
-        self.root.update()
+        self._post_progress(self.split_progress_var, (current / total) * 100)
 
     def start_split(self):
         input_file = self.split_input_entry.get().strip()
@@ -1451,7 +983,7 @@ class MediaDownloaderConverterGUI:
             
             self.split_progress_var.set(0)
             self.set_status("영상 분할 중...")
-            threading.Thread(target=self._split_video_by_duration, args=(input_file, total_seconds, output_dir), daemon=True).start()
+            self._start_job("분할", self._split_video_by_duration, input_file, total_seconds, output_dir)
             
         else:
             # 구간 수 모드
@@ -1465,29 +997,31 @@ class MediaDownloaderConverterGUI:
             
             self.split_progress_var.set(0)
             self.set_status("영상 분할 중...")
-            threading.Thread(target=self._split_video_by_segments, args=(input_file, num_segments, output_dir), daemon=True).start()
+            self._start_job("분할", self._split_video_by_segments, input_file, num_segments, output_dir)
 
-    def _split_video_by_duration(self, input_file, segment_duration, output_dir):
-        success, result = split_media_by_duration(input_file, segment_duration, output_dir, self.log_message, self.set_status, self.update_split_progress)
+    def _split_video_by_duration(self, log_callback, input_file, segment_duration, output_dir, checkpoint=None):
+        success, result = split_media_by_duration(input_file, segment_duration, output_dir, log_callback, self.set_status, self.update_split_progress, checkpoint=checkpoint)
         if success:
-            self.split_progress_var.set(100)
+            self._post_progress(self.split_progress_var, 100)
             self.set_status("분할 완료!")
-            messagebox.showinfo("완료", f"영상 분할 완료!\n{result}")
+            self.ui_call(messagebox.showinfo, "완료", f"영상 분할 완료!\n{result}")
         else:
             self.set_status("분할 오류")
-            messagebox.showerror("오류", result)
+            self.ui_call(messagebox.showerror, "오류", result)
         self.set_status("대기 중...")
+        return success
 
-    def _split_video_by_segments(self, input_file, num_segments, output_dir):
-        success, result = split_media_by_segments(input_file, num_segments, output_dir, self.log_message, self.set_status, self.update_split_progress)
+    def _split_video_by_segments(self, log_callback, input_file, num_segments, output_dir, checkpoint=None):
+        success, result = split_media_by_segments(input_file, num_segments, output_dir, log_callback, self.set_status, self.update_split_progress, checkpoint=checkpoint)
         if success:
-            self.split_progress_var.set(100)
+            self._post_progress(self.split_progress_var, 100)
             self.set_status("분할 완료!")
-            messagebox.showinfo("완료", f"영상 분할 완료!\n{result}")
+            self.ui_call(messagebox.showinfo, "완료", f"영상 분할 완료!\n{result}")
         else:
             self.set_status("분할 오류")
-            messagebox.showerror("오류", result)
+            self.ui_call(messagebox.showerror, "오류", result)
         self.set_status("대기 중...")
+        return success
 
     # 미디어 합치기 관련 메서드들
     def add_merge_files(self):
@@ -1591,13 +1125,13 @@ class MediaDownloaderConverterGUI:
             messagebox.showerror("오류", f"폴더를 열 수 없습니다: {e}")
     
     def update_merge_progress(self, current, total):
-        progress = (current / total) * 100
-        self.merge_progress_var.set(progress)
-        self.root.update()
+        self._post_progress(self.merge_progress_var, (current / total) * 100)
     
     def start_merge(self):
-        if len(self.merge_file_list) < 2:
-            messagebox.showerror("오류", "합칠 파일을 최소 2개 이상 선택하세요.")
+        append_mode = self.merge_append_var.get()
+        min_files = 1 if append_mode else 2
+        if len(self.merge_file_list) < min_files:
+            messagebox.showerror("오류", f"합칠 파일을 최소 {min_files}개 이상 선택하세요.")
             return
         
         output_file = self.merge_output_entry.get().strip()
@@ -1605,6 +1139,10 @@ class MediaDownloaderConverterGUI:
             messagebox.showerror("오류", "출력 파일 경로를 설정하세요.")
             return
         
+        if append_mode and not os.path.exists(output_file):
+            messagebox.showerror("오류", "이어붙일 기존 출력 파일이 없습니다.")
+            return
+        
         # 출력 디렉토리 생성
         output_dir = os.path.dirname(output_file)
         if not os.path.exists(output_dir):
@@ -1622,24 +1160,28 @@ class MediaDownloaderConverterGUI:
             else:
                 self.log_message(f"파일을 찾을 수 없습니다: {file_path}")
         
-        if len(valid_files) < 2:
-            messagebox.showerror("오류", "유효한 파일이 2개 미만입니다.")
+        if len(valid_files) < min_files:
+            messagebox.showerror("오류", f"유효한 파일이 {min_files}개 미만입니다.")
             return
         
         self.merge_progress_var.set(0)
         self.set_status("미디어 합치는 중...")
-        threading.Thread(target=self._merge_files, args=(valid_files, output_file), daemon=True).start()
+        self._start_job("합치기", self._merge_files, valid_files, output_file, append_mode)
     
-    def _merge_files(self, input_files, output_file):
-        success, result = merge_media_files(input_files, output_file, self.log_message, self.set_status, self.update_merge_progress)
+    def _merge_files(self, log_callback, input_files, output_file, append_mode=False):
+        if append_mode:
+            success, result = append_media_files(output_file, input_files, log_callback, self.set_status, self.update_merge_progress)
+        else:
+            success, result = merge_media_files(input_files, output_file, log_callback, self.set_status, self.update_merge_progress)
         if success:
-            self.merge_progress_var.set(100)
+            self._post_progress(self.merge_progress_var, 100)
             self.set_status("합치기 완료!")
-            messagebox.showinfo("완료", f"미디어 합치기 완료!\n출력: {result}")
+            self.ui_call(messagebox.showinfo, "완료", f"미디어 합치기 완료!\n출력: {result}")
         else:
             self.set_status("합치기 오류")
-            messagebox.showerror("오류", result)
+            self.ui_call(messagebox.showerror, "오류", result)
         self.set_status("대기 중...")
+        return success
 
     # 문서 변환 관련 메서드들
     def browse_doc_input(self):
@@ -1678,7 +1220,28 @@ class MediaDownloaderConverterGUI:
         except Exception as e:
             messagebox.showerror("오류", f"폴더를 열 수 없습니다: {e}")
 
+    def toggle_doc_mode(self):
+        if self.doc_mode_var.get() == "single":
+            self.doc_single_frame.grid()
+            self.doc_batch_frame.grid_remove()
+        else:
+            self.doc_single_frame.grid_remove()
+            self.doc_batch_frame.grid()
+
+    def browse_doc_folder(self):
+        folder = filedialog.askdirectory(title="일괄 변환할 문서 폴더 선택")
+        if folder:
+            self.doc_folder_entry.delete(0, tk.END)
+            self.doc_folder_entry.insert(0, folder)
+
+    def update_doc_progress(self, current, total):
+        self._post_progress(self.doc_progress_var, (current / total) * 100)
+
     def start_doc_convert(self):
+        if self.doc_mode_var.get() == "batch":
+            self.start_doc_batch_convert()
+            return
+        
         input_file = self.doc_input_entry.get().strip()
         output_format = self.doc_output_format_var.get().strip()
         
@@ -1704,26 +1267,65 @@ class MediaDownloaderConverterGUI:
         
         self.doc_progress_var.set(0)
         self.set_status("문서 변환 중...")
-        threading.Thread(target=self._convert_document, args=(input_file, output_format), daemon=True).start()
+        self._start_job("문서 변환", self._convert_document, input_file, output_format)
+
+    def start_doc_batch_convert(self):
+        folder = self.doc_folder_entry.get().strip()
+        output_format = self.doc_output_format_var.get().strip().lower()
+        
+        if not folder or not os.path.isdir(folder):
+            messagebox.showerror("오류", "입력 폴더를 선택하세요.")
+            return
+        
+        if not output_format:
+            messagebox.showerror("오류", "출력 형식을 선택하세요.")
+            return
+        
+        input_files = find_documents(folder, output_format)
+        if not input_files:
+            messagebox.showerror("오류", f"{output_format}(으)로 변환할 수 있는 문서가 없습니다.")
+            return
+        
+        self.doc_progress_var.set(0)
+        self.set_status(f"문서 일괄 변환 중... (0/{len(input_files)})")
+        self._start_job("문서 일괄 변환", self._convert_documents_batch, input_files, output_format, self.doc_skip_unchanged_var.get())
+
+    def _convert_documents_batch(self, log_callback, input_files, output_format, skip_unchanged, checkpoint=None):
+        try:
+            success, result = convert_documents_batch(input_files, output_format, log_callback, self.set_status, self.update_doc_progress, skip_unchanged=skip_unchanged, checkpoint=checkpoint)
+            self._post_progress(self.doc_progress_var, 100)
+            if success:
+                self.ui_call(messagebox.showinfo, "완료", f"문서 일괄 변환 완료!\n{result}")
+            else:
+                self.ui_call(messagebox.showwarning, "완료", f"문서 일괄 변환 완료\n{result}")
+            return success
+        except Exception as e:
+            self.set_status("문서 변환 오류")
+            log_callback(f"문서 일괄 변환 중 오류: {str(e)}")
+            self.ui_call(messagebox.showerror, "오류", f"문서 일괄 변환 중 오류가 발생했습니다: {str(e)}")
+            return False
+        finally:
+            self.set_status("대기 중...")
 
-    def _convert_document(self, input_file, output_format):
+    def _convert_document(self, log_callback, input_file, output_format):
         try:
-            self.doc_progress_var.set(50)
-            self.root.update()
+            self._post_progress(self.doc_progress_var, 50)
             
-            success, result = convert_document(input_file, output_format, self.log_message)
+            success, result = convert_document(input_file, output_format, log_callback)
             
             if success:
-                self.doc_progress_var.set(100)
+                self._post_progress(self.doc_progress_var, 100)
                 self.set_status("문서 변환 완료!")
-                messagebox.showinfo("완료", f"문서 변환 완료!\n출력: {result}")
+                self.ui_call(messagebox.showinfo, "완료", f"문서 변환 완료!\n출력: {result}")
             else:
                 self.set_status("문서 변환 오류")
-                messagebox.showerror("오류", result)
+                self.ui_call(messagebox.showerror, "오류", result)
+            return success
         except Exception as e:
             self.set_status("문서 변환 오류")
-            self.log_message(f"문서 변환 중 오류: {str(e)}")
-            messagebox.showerror("오류", f"문서 변환 중 오류가 발생했습니다: {str(e)}")
+            log_callback(f"문서 변환 중 오류: {str(e)}")
+            self.ui_call(messagebox.showerror, "오류", f"문서 변환 중 오류가 발생했습니다: {str(e)}")
+            return False
         finally:
             self.set_status("대기 중...")
 
@@ -1734,4 +1336,6 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # 병렬 추출 워커 프로세스가 번들(PyInstaller) 환경에서도 GUI를 다시 띄우지 않도록 함
+    multiprocessing.freeze_support()
     main()